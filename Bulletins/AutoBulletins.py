@@ -0,0 +1,131 @@
+'''
+Author: Ivan Nguyen
+Last Updated: 10-18-2026
+Description: Creates the bulletins listed in AutoBulletins_Properties.txt. The bulletins are run at the same time in a bounded pool of
+    workers and each bulletin is published with scp as soon as it is created, so the total run time is close to the slowest bulletin
+    instead of the sum of all of the bulletins. Replaces the serial list of commands in AutoBulletins.script.
+'''
+# --------------------------------------------------------------------------------------------------------------------------------------
+# Required Imports
+# --------------------------------------------------------------------------------------------------------------------------------------
+import os, sys, glob, time, threading, subprocess
+try :
+    import Queue as queue
+except ImportError :
+    import queue
+
+# --------------------------------------------------------------------------------------------------------------------------------------
+# Pathnames
+# --------------------------------------------------------------------------------------------------------------------------------------
+BulletinsDirectory = os.path.dirname(os.path.realpath(__file__)) + os.sep
+PropertiesPathname = BulletinsDirectory + 'AutoBulletins_Properties.txt'
+
+# runBulletin Function      : Runs a bulletin script and waits for it to finish. The output of the bulletin is written to a log file
+#                               in the Bulletins directory. The bulletin is stopped if it runs longer than the timeout.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def runBulletin(    Bulletin,       # Bulletin dictionary from BulletinList
+                    ) :
+    LogPathname = BulletinsDirectory + 'AutoBulletins_%s.log' % Bulletin['Name']
+    LogFile = open(LogPathname, 'w')
+    try :
+        Process = subprocess.Popen([JythonCommand, Bulletin['Script']], cwd = BulletinsDirectory, stdout = LogFile,
+            stderr = subprocess.STDOUT)
+        Timer = threading.Timer(BulletinTimeout, Process.kill)
+        Timer.start()
+        try :
+            ReturnCode = Process.wait()
+        finally :
+            Timer.cancel()
+    finally :
+        LogFile.close()
+    return ReturnCode
+
+# publishBulletin Function  : Copies the files of a bulletin to their destinations with scp
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def publishBulletin(    Bulletin,       # Bulletin dictionary from BulletinList
+                        ) :
+    Success = True
+    for FilePattern, Destination in Bulletin['Publish'] :
+        FileList = sorted(glob.glob(BulletinsDirectory + FilePattern))
+        if len(FileList) == 0 :
+            print 'WARNING : No files match %s for %s' % (FilePattern, Bulletin['Name'])
+            Success = False
+            continue
+        if subprocess.call(['/bin/scp'] + FileList + [Destination]) != 0 :
+            print 'ERROR : Could not copy %s to %s' % (FilePattern, Destination)
+            Success = False
+    return Success
+
+# bulletinWorker Function   : Takes bulletins from the queue, creates them and publishes them until the queue is empty. The result
+#                               of each bulletin is stored in Results.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def bulletinWorker( BulletinQueue,  # Queue of bulletin dictionaries
+                    Results,        # Dictionary of results for each bulletin name
+                    ) :
+    while True :
+        try :
+            Bulletin = BulletinQueue.get_nowait()
+        except queue.Empty :
+            return
+        Result = {'Status' : 'Failed', 'RunSeconds' : 0., 'PublishSeconds' : 0.}
+        Results[Bulletin['Name']] = Result
+        StartTime = time.time()
+        try :
+            print 'Creating %s' % Bulletin['Name']
+            ReturnCode = runBulletin(Bulletin)
+            Result['RunSeconds'] = time.time() - StartTime
+            if ReturnCode != 0 :
+                print 'ERROR : %s exited with %s after %.1f seconds' % (Bulletin['Name'], ReturnCode, Result['RunSeconds'])
+                continue
+            PublishStartTime = time.time()
+            if publishBulletin(Bulletin) : Result['Status'] = 'Published'
+            else : Result['Status'] = 'Not Published'
+            Result['PublishSeconds'] = time.time() - PublishStartTime
+            print 'Finished %s in %.1f seconds' % (Bulletin['Name'], time.time() - StartTime)
+        except Exception, e :
+            print 'ERROR : %s failed : %s' % (Bulletin['Name'], e)
+
+# runBulletins Function     : Creates and publishes all of the bulletins with a bounded number of workers and prints a summary
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def runBulletins(   BulletinList,   # List of bulletin dictionaries
+                    MaxWorkers,     # Number of bulletins created at the same time
+                    ) :
+    BulletinQueue = queue.Queue()
+    for Bulletin in BulletinList : BulletinQueue.put(Bulletin)
+    Results = {}
+    StartTime = time.time()
+    WorkerList = []
+    for x in range(min(MaxWorkers, len(BulletinList))) :
+        Worker = threading.Thread(target = bulletinWorker, args = (BulletinQueue, Results))
+        Worker.start()
+        WorkerList.append(Worker)
+    for Worker in WorkerList : Worker.join()
+
+    print '%-30s%-16s%12s%12s' % ('Bulletin', 'Status', 'Run (s)', 'Publish (s)')
+    for Bulletin in BulletinList :
+        Result = Results.get(Bulletin['Name'], {'Status' : 'Not Run', 'RunSeconds' : 0., 'PublishSeconds' : 0.})
+        print '%-30s%-16s%12.1f%12.1f' % (Bulletin['Name'], Result['Status'], Result['RunSeconds'], Result['PublishSeconds'])
+    print 'Total time = %.1f seconds' % (time.time() - StartTime)
+    return all([Results.get(Bulletin['Name'], {}).get('Status') == 'Published' for Bulletin in BulletinList])
+
+# --------------------------------------------------------------------------------------------------------------------------------------
+# Main Script
+# --------------------------------------------------------------------------------------------------------------------------------------
+if __name__ == '__main__' :
+    BulletinProperties = open(PropertiesPathname, "r"); exec(BulletinProperties)
+    BulletinProperties.close()
+
+    # Remove the bulletins from the last run so old files are not published
+    for Pathname in glob.glob(BulletinsDirectory + '*.pdf') + glob.glob(BulletinsDirectory + '*.csv') : os.remove(Pathname)
+
+    print 'Creating bulletins'
+    if not runBulletins(BulletinList, MaxWorkers) : sys.exit(1)
+    print 'Done'
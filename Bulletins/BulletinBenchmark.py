@@ -0,0 +1,155 @@
+'''
+Author: Ivan Nguyen
+Last Updated: 10-18-2026
+Description: Offline benchmark of the bulletins. Runs each bulletin end to end in this jython process against the SQLite fixture of
+    Offline_DBAPI.py instead of the CWMS database, and reports the wall time, the number of queries, CwmsDb.get calls and rows, and the
+    size of the pdf. The fixture and the latency settings are the same for every run, so optimizations can be compared on a laptop.
+    Create a fixture        : jython3 BulletinBenchmark.py seed <fixture.db> <ddMonYYYY HHMM> [days]
+    Record a fixture        : jython3 BulletinBenchmark.py record <fixture.db> [Bulletin Name or script ...]
+    Run the benchmark       : jython3 BulletinBenchmark.py run <fixture.db> [options] [Bulletin Name or script ...]
+        --latency <ms>          Latency of each query
+        --get-latency <ms>      Latency of each CwmsDb.get
+        --catalog-latency <ms>  Latency of each CwmsDb.getPathnameList
+        --recorded-latency      Use the latency recorded for each call. The latencies above are used for the calls that were not recorded
+        --repeat <n>            Number of runs of each bulletin. The first run is cold, the others reuse the caches of the process
+        --json <pathname>       Also write the results to a json file
+    The bulletins default to the MVS bulletins. seed fills the catalog and hourly synthetic values for every pathname template in
+    DatabasePathnames.txt and the properties of the bulletins with every project in their ProjectLists, and stores the bulletin date
+    that every run uses. record runs the bulletins once against the CWMS database and captures every query, time series and catalog
+    call with its latency, so the benchmark replays the real query mix of the office. The bulletin date of the recording is stored and
+    used by every run. The pdf files, the reference cache and the logs are written to the Benchmark directory, so the production files
+    are not changed.
+'''
+# --------------------------------------------------------------------------------------------------------------------------------------
+# Required Imports
+# --------------------------------------------------------------------------------------------------------------------------------------
+import os, sys, re, json, time, argparse, traceback
+from BulletinServer import BulletinsDirectory, findBulletins, renderBulletin
+
+# --------------------------------------------------------------------------------------------------------------------------------------
+# Pathnames
+# --------------------------------------------------------------------------------------------------------------------------------------
+CronjobsDirectory = os.path.dirname(os.path.dirname(os.path.realpath(__file__))) + os.sep
+if CronjobsDirectory not in sys.path : sys.path.append(CronjobsDirectory)
+DatabasePathnamesFile = os.path.join(CronjobsDirectory, 'DatabasePathnames.txt')
+BenchmarkDirectory = os.path.join(BulletinsDirectory, 'Benchmark')
+
+import Offline_DBAPI
+
+# Bulletins that are run when none are given on the command line
+BenchmarkBulletins = [  'MVS_WebRep/MVS_WebRep_Bulletin.py', 'MVS_WebRep/MVS_WebRep_Sub_Bulletin.py', 'MVS/MVS_Morning_Report_Bulletin.py']
+
+# benchmarkPathnames Function   : Returns the time series pathnames used by the bulletins. Every pathname template in DatabasePathnames.txt
+#                                   and in the properties of the bulletins is filled with every project in the ProjectLists.
+# Author/Editor                 : Ivan Nguyen
+# Last updated                  : 10-18-2026
+
+def benchmarkPathnames( BulletinList,   # List of bulletin dictionaries
+                        ) :
+    Templates, Projects = set(), set()
+    PropertiesList = [DatabasePathnamesFile] + [os.path.join(BulletinsDirectory, Bulletin['Script'][: -3] + '_Properties.txt')
+        for Bulletin in BulletinList]
+    for PropertiesPathname in PropertiesList :
+        if not os.path.isfile(PropertiesPathname) : continue
+        PropertiesFile = open(PropertiesPathname, 'r')
+        try : Text = re.sub(r'(?m)^\s*#.*$', '', PropertiesFile.read())
+        finally : PropertiesFile.close()
+        Templates.update(re.findall(r"'(%s(?:\.[^'.]+){5})'", Text))
+        for ProjectList in re.findall(r"'ProjectList'\s*:\s*\[([^\]]*)\]", Text) :
+            Projects.update(re.findall(r"'([^']+)'", ProjectList))
+    return [Template % Project for Template in sorted(Templates) for Project in sorted(Projects)]
+
+# runBenchmark Function     : Runs each bulletin Repeat times against the fixture and returns a list of result dictionaries
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def runBenchmark(   BulletinList,   # List of bulletin dictionaries
+                    Repeat,         # Number of runs of each bulletin
+                    BulletinDate,   # Date of the bulletins formatted as ddMonYYYY HHMM
+                    ) :
+    if not os.path.isdir(BenchmarkDirectory) : os.makedirs(BenchmarkDirectory)
+    ReferenceCachePathname = os.path.join(BenchmarkDirectory, 'ReferenceCache.json')
+    if os.path.isfile(ReferenceCachePathname) : os.remove(ReferenceCachePathname)
+    Results = []
+    for Bulletin in BulletinList :
+        for Run in range(Repeat) :
+            Properties = {  'BulletinFilename'          :   os.path.join(BenchmarkDirectory, Bulletin['Name'] + '.pdf'),
+                            'ArchiveBulletinFilename'   :   os.path.join(BenchmarkDirectory, Bulletin['Name'] + '_%s.pdf'),
+                            'ReferenceCachePathname'    :   ReferenceCachePathname,
+                            'CallSummaryPathname'       :   os.path.join(BenchmarkDirectory, '%s_%d_Calls.json' % (Bulletin['Name'], Run + 1)),
+                            'TracePathname'             :   os.path.join(BenchmarkDirectory, '%s_%d_Trace.json' % (Bulletin['Name'], Run + 1)),
+                            }
+            Result = {'Name' : Bulletin['Name'], 'Run' : Run + 1, 'Status' : 'Failed'}
+            Results.append(Result)
+            Offline_DBAPI.resetStats()
+            LogFile = open(os.path.join(BenchmarkDirectory, '%s_%d.log' % (Bulletin['Name'], Run + 1)), 'w')
+            StartTime = time.time()
+            try :
+                try :
+                    renderBulletin(Bulletin, {'Date' : BulletinDate, 'Properties' : Properties}, LogFile)
+                    Result['Status'] = 'OK'
+                except :
+                    LogFile.write(traceback.format_exc())
+            finally :
+                Result['WallSeconds'] = time.time() - StartTime
+                LogFile.close()
+            Result.update(Offline_DBAPI.getStats())
+            if os.path.isfile(Properties['BulletinFilename']) : Result['PdfBytes'] = os.path.getsize(Properties['BulletinFilename'])
+            else : Result['PdfBytes'] = 0
+    return Results
+
+# printResults Function     : Prints the benchmark results as a table
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def printResults(   Results,    # List of result dictionaries from runBenchmark
+                    ) :
+    print '%-30s%5s%-8s%10s%10s%8s%8s%10s%10s' % ('Bulletin', 'Run', ' Status', 'Wall (s)', 'Queries', 'Misses', 'Gets', 'Rows', 'Pdf (KB)')
+    for Result in Results :
+        print '%-30s%5d %-7s%10.2f%10d%8d%8d%10d%10.1f' % (Result['Name'], Result['Run'], Result['Status'], Result['WallSeconds'],
+            Result['Queries'], Result['Misses'], Result['Gets'], Result['Rows'], Result['PdfBytes'] / 1024.)
+
+# --------------------------------------------------------------------------------------------------------------------------------------
+# Main Script
+# --------------------------------------------------------------------------------------------------------------------------------------
+if __name__ == '__main__' :
+    Parser = argparse.ArgumentParser(description = 'Offline benchmark of the bulletins')
+    Parser.add_argument('Command', choices = ['seed', 'record', 'run'])
+    Parser.add_argument('Fixture', help = 'Pathname of the SQLite fixture file')
+    Parser.add_argument('Arguments', nargs = '*', help = 'seed : ddMonYYYY HHMM [days], record and run : bulletin names or scripts')
+    Parser.add_argument('--latency', type = float, default = 0., help = 'Latency of each query in milliseconds')
+    Parser.add_argument('--get-latency', type = float, default = 0., help = 'Latency of each CwmsDb.get in milliseconds')
+    Parser.add_argument('--catalog-latency', type = float, default = 0., help = 'Latency of each CwmsDb.getPathnameList in milliseconds')
+    Parser.add_argument('--recorded-latency', action = 'store_true', help = 'Use the latency recorded for each call')
+    Parser.add_argument('--repeat', type = int, default = 1, help = 'Number of runs of each bulletin')
+    Parser.add_argument('--json', help = 'Pathname of a json file for the results')
+    Options = Parser.parse_args()
+    FixturePathname = os.path.abspath(Options.Fixture)
+    BulletinList = []
+    if Options.Command == 'seed' :
+        for Script in BenchmarkBulletins : BulletinList.extend(findBulletins(Script))
+        if len(Options.Arguments) < 2 : Parser.error('seed needs the bulletin date formatted as ddMonYYYY HHMM')
+        if len(Options.Arguments) > 2 : Days = int(Options.Arguments[2])
+        else : Days = 10
+        Count = Offline_DBAPI.seedFixture(FixturePathname, benchmarkPathnames(BulletinList), ' '.join(Options.Arguments[: 2]), Days)
+        print 'Seeded %d pathnames in %s' % (Count, FixturePathname)
+    else :
+        for Name in Options.Arguments or BenchmarkBulletins : BulletinList.extend(findBulletins(Name))
+        if Options.Command == 'record' :
+            Offline_DBAPI.startRecording(FixturePathname)
+            BulletinDate = time.strftime('%d%b%Y %H%M')
+            Offline_DBAPI.setMeta('BulletinDate', BulletinDate)
+            Results = runBenchmark(BulletinList, 1, BulletinDate)
+            print 'Recorded %d queries and %d time series in %s' % (sum([Result['Queries'] for Result in Results]),
+                sum([Result['Gets'] for Result in Results]), FixturePathname)
+        else :
+            Offline_DBAPI.configure(FixturePathname, Options.latency / 1000., Options.get_latency / 1000., Options.catalog_latency / 1000.,
+                Options.recorded_latency)
+            sys.modules['DBAPI'] = Offline_DBAPI
+            Results = runBenchmark(BulletinList, Options.repeat, Offline_DBAPI.getMeta('BulletinDate'))
+        printResults(Results)
+        if Options.json :
+            JsonFile = open(Options.json, 'w')
+            try : json.dump(Results, JsonFile, indent = 2)
+            finally : JsonFile.close()
+        if not all([Result['Status'] == 'OK' for Result in Results]) : sys.exit(1)
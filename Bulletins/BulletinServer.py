@@ -0,0 +1,171 @@
+'''
+Author: Ivan Nguyen
+Last Updated: 10-18-2026
+Description: Long running bulletin server. Creates bulletins from the jobs in the spool directory in one jython process, so the JVM, the
+    iText classes, the Server_Utils caches and the pathname catalog are loaded once instead of once for every bulletin. Re-rendering a
+    bulletin during a flood event only costs the queries and the pdf.
+    Start the server        : jython3 BulletinServer.py
+    Submit a job            : jython3 BulletinServer.py submit <Bulletin Name or all> [ddMonYYYY HHMM] [nopublish]
+    The bulletin names are the names in BulletinList of AutoBulletins_Properties.txt. A script pathname relative to the Bulletins
+    directory can be used for bulletins that are not in the list, e.g. MVS_WebRep/MVS_WebRep_Bulletin.py. The date creates a historic
+    bulletin by setting UseCurDate = False and HistoricBulletinDate in the properties of the bulletin.
+    Each job is written as <job>.job. The server renames it to <job>.running while it works on it and then to <job>.done or <job>.failed
+    with the results of each bulletin. The output of the bulletins is written to <job>.log.
+'''
+# --------------------------------------------------------------------------------------------------------------------------------------
+# Required Imports
+# --------------------------------------------------------------------------------------------------------------------------------------
+import os, sys, glob, json, time, traceback
+from AutoBulletins import BulletinsDirectory, PropertiesPathname, publishBulletin
+
+BulletinProperties = open(PropertiesPathname, "r"); exec(BulletinProperties)
+BulletinProperties.close()
+
+# --------------------------------------------------------------------------------------------------------------------------------------
+# Pathnames
+# --------------------------------------------------------------------------------------------------------------------------------------
+SpoolPathname = os.path.join(BulletinsDirectory, SpoolDirectory)
+
+# submitJob Function        : Writes a job to the spool directory. The job is written to a temporary file first and renamed, so the
+#                               server never reads part of a job. Returns the pathname of the job.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def submitJob(  Name,           # Bulletin name, script pathname or 'all'
+                Date = None,    # Date of a historic bulletin formatted as ddMonYYYY HHMM. Uses the current date if None
+                Publish = True, # Set to False to create the bulletin without copying it to the web server
+                ) :
+    if not os.path.isdir(SpoolPathname) : os.makedirs(SpoolPathname)
+    JobName = '%s_%d_%s' % (time.strftime('%Y%m%d_%H%M%S'), os.getpid(), os.path.basename(Name).replace('.py', ''))
+    JobPathname = os.path.join(SpoolPathname, JobName + '.job')
+    JobFile = open(JobPathname + '.tmp', 'w')
+    try : json.dump({'Name' : Name, 'Date' : Date, 'Publish' : Publish}, JobFile)
+    finally : JobFile.close()
+    os.rename(JobPathname + '.tmp', JobPathname)
+    return JobPathname
+
+# findBulletins Function    : Returns the list of bulletin dictionaries for a job name. 'all' returns every bulletin in BulletinList. A
+#                               name that is not in BulletinList is used as a script pathname relative to the Bulletins directory.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def findBulletins(  Name,   # Bulletin name, script pathname or 'all'
+                    ) :
+    if Name.lower() == 'all' : return BulletinList
+    for Bulletin in BulletinList :
+        if Bulletin['Name'] == Name : return [Bulletin]
+    if os.path.isfile(os.path.join(BulletinsDirectory, Name)) :
+        return [{'Name' : os.path.basename(Name).replace('.py', ''), 'Script' : Name, 'Publish' : []}]
+    raise ValueError('Unknown bulletin %s' % Name)
+
+# renderBulletin Function   : Runs a bulletin script in this process. The script runs as __main__ in a new namespace, the same way it
+#                               runs from the command line, and its output is written to the log file. The Properties of the job replace
+#                               the values from the properties files of the bulletin. Returns the namespace of the bulletin.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def renderBulletin( Bulletin,   # Bulletin dictionary
+                    Job,        # Job dictionary from the spool file
+                    LogFile,    # Open log file of the job
+                    ) :
+    ScriptPathname = os.path.join(BulletinsDirectory, Bulletin['Script'])
+    Namespace = {'__name__' : '__main__', '__file__' : ScriptPathname, 'PropertyOverrides' : {}}
+    if Job.get('Date') : Namespace['PropertyOverrides'].update({'UseCurDate' : False, 'HistoricBulletinDate' : str(Job['Date'])})
+    Namespace['PropertyOverrides'].update(Job.get('Properties') or {})
+    Stdout, Stderr = sys.stdout, sys.stderr
+    sys.stdout = sys.stderr = LogFile
+    os.chdir(BulletinsDirectory)
+    try :
+        try :
+            execfile(ScriptPathname, Namespace)
+        except SystemExit, e :
+            if e.code not in [None, 0] : raise
+    finally :
+        sys.stdout, sys.stderr = Stdout, Stderr
+    return Namespace
+
+# runJob Function           : Creates and publishes the bulletins of a job and writes the results to <job>.done or <job>.failed
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def runJob( JobPathname,    # Pathname of the .job file
+            ) :
+    JobBase = JobPathname[: -len('.job')]
+    os.rename(JobPathname, JobBase + '.running')
+    Results = []
+    LogFile = open(JobBase + '.log', 'w')
+    try :
+        try :
+            JobFile = open(JobBase + '.running', 'r')
+            try : Job = json.load(JobFile)
+            finally : JobFile.close()
+            JobBulletinList = findBulletins(str(Job['Name']))
+        except Exception, e :
+            Results.append({'Name' : os.path.basename(JobBase), 'Status' : 'Failed', 'Error' : str(e)})
+            JobBulletinList = []
+        for Bulletin in JobBulletinList :
+            Result = {'Name' : Bulletin['Name'], 'Status' : 'Failed', 'RunSeconds' : 0., 'PublishSeconds' : 0.}
+            Results.append(Result)
+            StartTime = time.time()
+            print 'Creating %s' % Bulletin['Name']
+            try :
+                renderBulletin(Bulletin, Job, LogFile)
+            except :
+                Result['RunSeconds'] = time.time() - StartTime
+                Result['Error'] = traceback.format_exc()
+                LogFile.write(Result['Error'])
+                print 'ERROR : %s failed after %.1f seconds' % (Bulletin['Name'], Result['RunSeconds'])
+                continue
+            Result['RunSeconds'] = time.time() - StartTime
+            Result['Status'] = 'Created'
+            if Job.get('Publish', True) and Bulletin['Publish'] :
+                PublishStartTime = time.time()
+                if publishBulletin(Bulletin) : Result['Status'] = 'Published'
+                else : Result['Status'] = 'Not Published'
+                Result['PublishSeconds'] = time.time() - PublishStartTime
+            print 'Finished %s in %.1f seconds' % (Bulletin['Name'], time.time() - StartTime)
+    finally :
+        LogFile.close()
+
+    if all([Result['Status'] in ['Created', 'Published'] for Result in Results]) : ResultPathname = JobBase + '.done'
+    else : ResultPathname = JobBase + '.failed'
+    ResultFile = open(ResultPathname, 'w')
+    try : json.dump(Results, ResultFile, indent = 2)
+    finally : ResultFile.close()
+    os.remove(JobBase + '.running')
+    return ResultPathname
+
+# serveJobs Function        : Runs the jobs in the spool directory in the order they were submitted and waits for new jobs. Jobs that
+#                               were running when the server stopped are marked as failed when the server starts.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def serveJobs() :
+    if not os.path.isdir(SpoolPathname) : os.makedirs(SpoolPathname)
+    for RunningPathname in glob.glob(os.path.join(SpoolPathname, '*.running')) :
+        os.rename(RunningPathname, RunningPathname[: -len('.running')] + '.failed')
+    print 'Waiting for jobs in %s' % SpoolPathname
+    while True :
+        JobList = sorted(glob.glob(os.path.join(SpoolPathname, '*.job')))
+        if len(JobList) == 0 :
+            time.sleep(SpoolPollSeconds)
+            continue
+        for JobPathname in JobList :
+            try :
+                print 'Finished job %s' % os.path.basename(runJob(JobPathname))
+            except Exception, e :
+                print 'ERROR : Could not run job %s : %s' % (os.path.basename(JobPathname), e)
+
+# --------------------------------------------------------------------------------------------------------------------------------------
+# Main Script
+# --------------------------------------------------------------------------------------------------------------------------------------
+if __name__ == '__main__' :
+    if len(sys.argv) > 2 and sys.argv[1] == 'submit' :
+        Arguments = sys.argv[3 :]
+        Publish = 'nopublish' not in Arguments
+        Arguments = [Argument for Argument in Arguments if Argument != 'nopublish']
+        if len(Arguments) > 0 : Date = ' '.join(Arguments)
+        else : Date = None
+        print 'Submitted %s' % submitJob(sys.argv[2], Date, Publish)
+    else :
+        serveJobs()
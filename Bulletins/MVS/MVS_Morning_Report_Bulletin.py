@@ -53,6 +53,17 @@ print 'BulletinPropertiesPathname = ', BulletinPropertiesPathname
 if CronjobsDirectory not in sys.path : sys.path.append(CronjobsDirectory)
 if BulletinsDirectory not in sys.path : sys.path.append(BulletinsDirectory)
 if ScriptDirectory not in sys.path : sys.path.append(ScriptDirectory)
+
+# Call counts and latency of the Server_Utils functions, and the trace of the run, are written to these files at the end of the run
+CallSummaryPathname = ScriptDirectory + 'MVS_Morning_Report_Bulletin_Calls.json'
+TracePathname = ScriptDirectory + 'MVS_Morning_Report_Bulletin_Trace.json'
+
+# The properties files are loaded with the compiled properties cache in Server_Utils.py
+from Server_Utils import loadProperties, resetTrace, resetCallStats
+
+# Start the trace and count the calls of this run only before the properties are loaded, so they are in the trace and the call summary
+resetTrace('MVS_Morning_Report_Bulletin')
+resetCallStats()
 #
 # Load DatabasePathnames.txt and BulletinProperties
 #
@@ -66,17 +77,20 @@ while True :
     print 'DatabasePathnamesFile = ' + str(DatabasePathnamesFile)
     if not os.path.exists(DatabasePathnamesFile) :
         errorMessage = "DatabasePathnames.txt does not exist: %s" % DatabasePathnamesFile
-    with open(DatabasePathnamesFile, "r") as f : exec(f.read())
+    loadProperties(DatabasePathnamesFile, globals())
     break
 if errorMessage :
     print "ERROR : " + errorMessage
-BulletinProperties = open(BulletinPropertiesPathname, "r"); exec(BulletinProperties)
+loadProperties(BulletinPropertiesPathname, globals())
 #
 # Import Server_Utils
-import Server_Utils
-reload(Server_Utils)
 from Server_Utils import lineNo, outputDebug, retrieveLocationLevel, retrievePublicName, retrieveElevatonDatum, retrieveRiverMile, retrieveGroup, \
-    retrieveGroupLPMS, retrieveGageZero29, createCell, is_dst, retrieveLocationLevel2
+    retrieveGroupLPMS, retrieveGageZero29, createCell, is_dst, retrieveLocationLevel2, loadPathnameCatalog, \
+    closeStatementCache, getImage, rowRecordClass, DataBlockRows, openBulletinPdf, writeFooter, streamTable, \
+    logCallSummary, timeCall, span, writeTrace
+
+# Row records of each data block, keyed by data block name, e.g. Table1Data1. They are filled by the data functions
+TableRows = {}
 #
 # Set debug = True to print all debug statements and = False to turn them off
 debug = True
@@ -96,11 +110,11 @@ def titleBlock(debug, TitleBlock,) :
     # Add USACE Logo, title block lines, and seal to TitleBlock
     TitleLines = [TitleLine1, TitleLine2, TitleLine3, TitleLine4]
     #
-    outputDebug(debug, lineNo(), 'TitleLines = ', TitleLines)
+    outputDebug(debug, 'TitleLines = ', TitleLines)
     #
     # Add the USACE Logo to the TitleBlock
-    Img = Image.getInstance(UsaceLogo)
-    outputDebug(debug, lineNo(), 'Img = ', Img)
+    Img = getImage(debug, UsaceLogo)
+    outputDebug(debug, 'Img = ', Img)
     Cell = PdfPCell(Img, 1)
     Cell.setRowspan(len(TitleLines))
     Cell.setHorizontalAlignment(Element.ALIGN_LEFT); Cell.setVerticalAlignment(TableLayoutDict['Table1']['VerticalAlignment'])
@@ -119,7 +133,7 @@ def titleBlock(debug, TitleBlock,) :
     TitleBlock.addCell(Cell)
   
     # Add the seal to the TitleBlock
-    Img = Image.getInstance(Seal)   
+    Img = getImage(debug, Seal)   
     Cell = PdfPCell(Img, 1)
     Cell.setRowspan(len(TitleLines))
     Cell.setHorizontalAlignment(TableLayoutDict['Table1']['HorizontalAlignment']); Cell.setVerticalAlignment(TableLayoutDict['Table1']['VerticalAlignment'])
@@ -290,23 +304,29 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
 
     # QUERY TO GET PROJECT GROUP TO DISPLAY STAGE 29
     PoolLakeLocation = retrieveGroup(debug,conn,'RDL_POOL_LAKE_ELEV_DISPLAY') 
-    outputDebug(debug, lineNo(), 'PoolLakeLocation = ', str(PoolLakeLocation))
+    outputDebug(debug, 'PoolLakeLocation = ', PoolLakeLocation)
 
     # QUERY TO GET GAGES WITH LPMS DATA
     LPMSLocation = retrieveGroupLPMS(debug,conn) 
-    outputDebug(debug, lineNo(), 'LPMSLocation = ', str(LPMSLocation))
+    outputDebug(debug, 'LPMSLocation = ', LPMSLocation)
            
+    # Row records of the data block. The values that are computed for each row are kept in TableRows instead of the DataBlockDict
+    Rows = DataBlockRows(TableDataName, rowRecordClass('%sRow' % TableName, DataOrder + ['Stage2x']),
+        DataBlockDict['DataBlocks'][TableDataName]['ProjectList'])
+    TableRows[TableDataName] = Rows
+
     # Data
-    for project in DataBlockDict['DataBlocks'][TableDataName]['ProjectList'] :
+    for Row in Rows :
+        project = Row.Project
         # Retrieve Public Name and store it to the DataBlockDict
         print '======================================================'
-        outputDebug(debug, lineNo(), 'Location ID ============================================================ project = ', project, ' ==================================')
+        outputDebug(debug, 'Location ID ============================================================ project = ', project, ' ==================================')
         PublicName = retrievePublicName(debug, conn, project)
         #PublicName = PublicName.replace(' & Reservoir', '')
-        outputDebug(debug, lineNo(), 'Creating %s row' % PublicName)
+        outputDebug(debug, 'Creating ', PublicName, ' row')
 
         # If adding the last project in the last data block, create a trigger to use a thick bottom border
-        if DataName == 'Data%d' % NumberOfDataBlocks and project == DataBlockDict['DataBlocks'][TableDataName]['ProjectList'][-1] :
+        if DataName == 'Data%d' % NumberOfDataBlocks and project == Rows.ProjectList[-1] :
             LastProject = True
         else : LastProject = False
 
@@ -316,10 +336,7 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
         for data in DataOrder :
             print '====================================================== data START'
             #
-            outputDebug(debug, lineNo(), 'Adding %s to the row' % data)
-            # Create a variable within the DataDict. This will allow the user to store all data to a dictionary and access the variables throughout
-            #   the script
-            DataBlockDict['DataBlocks'][TableDataName].setdefault(project, {}).setdefault(data, None)
+            outputDebug(debug, 'Adding ', data, ' to the row')
             #
             # Get column number
             ColumnKey = 'Column%d' % DataOrder.index(data)
@@ -344,7 +361,7 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
 			# 1 - RiverMile
             if data == 'RiverMile' :
                 getRiverMile = retrieveRiverMile(debug,conn,project)
-                outputDebug(debug, lineNo(), 'getRiverMile = ', str(getRiverMile))
+                outputDebug(debug, 'getRiverMile = ', getRiverMile)
                 #stop
                 if type(getRiverMile) == type('') : 
                     RivMile = float(getRiverMile)
@@ -400,59 +417,59 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
                     MVSFloodStage = Null
                     CellData = Phrase(Chunk(Missing, TextFont))
                     TscPathname = DataBlockDict['DataBlocks'][TableDataName][data] % project
-                    MVSFloodStage = retrieveLocationLevel(debug, conn, CwmsDb, TscPathname)
-                    outputDebug(debug, lineNo(), 'Flood Stage Pathname = ', TscPathname, '\tMVSFloodStage = ', MVSFloodStage)
+                    MVSFloodStage = retrieveLocationLevel(debug, conn, CwmsDb.getTimeZoneName(), TscPathname, Date.strftime('%d%b%Y 0000'))
+                    outputDebug(debug, 'Flood Stage Pathname = ', TscPathname, '\tMVSFloodStage = ', MVSFloodStage)
                     if MVSFloodStage != Null and MVSFloodStage != 'None' :
                         # Create a formatted string that will be added to the table
-                        outputDebug(debug, lineNo(), 'MVSFloodStage = ', str(MVSFloodStage))
+                        outputDebug(debug, 'MVSFloodStage = ', MVSFloodStage)
                         CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % MVSFloodStage, TextFont))
                     else:
                         CellData = Phrase(Chunk('', TextFont))
                 except Exception, e :
-                    outputDebug(debug, lineNo(), 'FloodStage Exception = ', str(e))
+                    outputDebug(debug, 'FloodStage Exception = ', e)
 
             # 5 - Stage
             elif data == 'Stage' :
                 if project in PoolLakeLocation:
                     TscPathname = StageInst30min29 % project
-                    outputDebug(debug, lineNo(), 'TscPathname_project = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime) 
+                    outputDebug(debug, 'TscPathname_project = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime) 
                     if TscPathname == "Mel Price Pool-Mississippi.Stage.Inst.30Minutes.0.29":  
                        TscPathname = StageInst15min29 % project 
-                       outputDebug(debug, lineNo(), 'TscPathname_mel_price = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime) 
+                       outputDebug(debug, 'TscPathname_mel_price = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime) 
                 elif project in LPMSLocation:
                      TscPathname = StageInst2HoursLpmsRaw % project
-                     outputDebug(debug, lineNo(), 'TscPathname_lpms = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime)
+                     outputDebug(debug, 'TscPathname_lpms = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime)
                 else: 
                     TscPathname = DataBlockDict['DataBlocks'][TableDataName][data] % project
-                    outputDebug(debug, lineNo(), 'TscPathname_in_data_block = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime)
+                    outputDebug(debug, 'TscPathname_in_data_block = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime)
                     if TscPathname not in DbPathnameList:
                         TscPathname = StageInst15minRevLrgs % project
-                        outputDebug(debug, lineNo(), 'TscPathname_not_in_data_block = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime)
+                        outputDebug(debug, 'TscPathname_not_in_data_block = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime)
                 try :
-                    Tsc = CwmsDb.get(TscPathname, startTime, endTime)
+                    Tsc = timeCall('CwmsDb.get', CwmsDb.get, TscPathname, startTime, endTime)
                     PrevStage = Tsc.values[-1] # Previous day's midnight value
                     Prev2xStage = Tsc.values[0] # 2 days previous midnight value
-                    outputDebug(debug, lineNo(), 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
-                    outputDebug(debug, lineNo(), 'TscPathname = ', str(TscPathname))
+                    outputDebug(debug, 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
+                    outputDebug(debug, 'TscPathname = ', TscPathname)
                     #
                     getGageZero29 = retrieveGageZero29( debug,          # Set to True to print all debug statements
                                                         conn,           # 
                                                         project,        # Full name of time series container
                                                         )  
-                    outputDebug(debug, lineNo(), 'project = ', project) 
-                    outputDebug(debug, lineNo(), 'getGageZero29 = ', str(getGageZero29))                 
+                    outputDebug(debug, 'project = ', project) 
+                    outputDebug(debug, 'getGageZero29 = ', getGageZero29)                 
                     #
                     if PrevStage == Constants.UNDEFINED : raise ValueError('Missing Stage data for %s' % project)
                     elif Prev2xStage == Constants.UNDEFINED : Prev2xStage = Missing 		
                     #
-                    outputDebug(debug, lineNo(), 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage) 
-                    outputDebug(debug, lineNo(), 'PoolLakeLocation = ', str(PoolLakeLocation))
+                    outputDebug(debug, 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage) 
+                    outputDebug(debug, 'PoolLakeLocation = ', PoolLakeLocation)
                     #
                     MVSFloodStage = retrieveLocationLevel2(debug,conn,project)
-                    outputDebug(debug, lineNo(), 'MVSFloodStage = ', str(MVSFloodStage))  
+                    outputDebug(debug, 'MVSFloodStage = ', MVSFloodStage)  
                     #    
                     if project in PoolLakeLocation:
-                        outputDebug(debug, lineNo(), 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
+                        outputDebug(debug, 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
                         if len(str(MVSFloodStage)) > 0:
                             print 'MVSFloodStage = ' + str(MVSFloodStage) 
                             print 'getGageZero29 = ' + str(getGageZero29)
@@ -464,15 +481,15 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
                             BackgroundColor = Color4
                             print "colorset = Color4 (project with no flood stage)"    
                     elif str(MVSFloodStage) =='':
-                        outputDebug(debug, lineNo(), 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)   
+                        outputDebug(debug, 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)   
                         BackgroundColor = Color4
                         print "colorset = Color4 (white not a project)"
                     else:
-                        outputDebug(debug, lineNo(), 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
+                        outputDebug(debug, 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
                         if (float(PrevStage) >= float(MVSFloodStage)):
                             BackgroundColor = Color10
                             print "colorset = Color10 (red for regualr gage)"
-                    outputDebug(debug, lineNo(), 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
+                    outputDebug(debug, 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
 
                     #if project in PoolLakeLocation:
                     #    CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % PrevStage, TextFont2))    
@@ -482,25 +499,26 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
                     PrevStage, Prev2xStage = Missing, Missing
                     # Create a formatted string that will be added to the table
                     CellData = Phrase(Chunk(Missing, TextFont))
-                # Store value to DataDict
-                outputDebug(debug, lineNo(), 'Set %s %s = ' % (project, data), PrevStage)
-                DataBlockDict['DataBlocks'][TableDataName][project][data] = PrevStage
-                DataBlockDict['DataBlocks'][TableDataName][project][data + '2x'] = Prev2xStage
+                # Store the values in the row record
+                outputDebug(debug, 'Set ', project, ' ', data, ' = ', PrevStage)
+                Row.Stage = PrevStage
+                Row.Stage2x = Prev2xStage
                       
             # 6 StageChange
             elif data == 'StageChange' :
                 try :
-                    if DataBlockDict['DataBlocks'][TableDataName][project]['Stage'] == Missing or \
-                        DataBlockDict['DataBlocks'][TableDataName][project]['Stage2x'] == Missing :
+                    if Row.Stage == Missing or Row.Stage2x == Missing :
                         raise ValueError('Cannot compute daily Stage change data for %s' % project)
             
-                    DlyStageChange = DataBlockDict['DataBlocks'][TableDataName][project]['Stage'] - DataBlockDict['DataBlocks'][TableDataName][project]['Stage2x']
-                    outputDebug(debug, lineNo(), 'DlyStageChange = ', str(DlyStageChange))
+                    DlyStageChange = Row.Stage - Row.Stage2x
+                    Row.StageChange = DlyStageChange
+                    outputDebug(debug, 'DlyStageChange = ', DlyStageChange)
                     #
                     # Create a formatted string that will be added to the table
                     CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % DlyStageChange, TextFont))
                 except :
                     DlyStageChange = Missing
+                    Row.StageChange = DlyStageChange
                     # Create a formatted string that will be added to the table
                     CellData = Phrase(Chunk(Missing, TextFont))
                 
@@ -508,23 +526,24 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
             Table.addCell(Cell)
             #
             # Add data to CsvData. Break data loop if column span reaches the total number columns before each data piece has been added to that table
-            outputDebug(debug, lineNo(), 'ColSpan = ', ColSpan)
+            outputDebug(debug, 'ColSpan = ', ColSpan)
             TotalColSpan += ColSpan
-            outputDebug(debug, lineNo(), 'TotalColSpan = ', TotalColSpan)    
+            outputDebug(debug, 'TotalColSpan = ', TotalColSpan)    
         #
         # Add Continued Heading for second page
         #
     print '=================================================================================================Data1_END'
     return Table
 #
-# titleBlock Function   : Creates the title block for the bulletin
-# Author/Editor         : Ryan Larsen
-# Modified              : Ivan Nguyen
-# Last updated          : 03-30-2022
+# bulletinFooter Function   : Creates a footer for the bulletin. The pdf is written to more than one file, so the page number is passed
+#                               in instead of read from the PdfWriter.
+# Author/Editor             : Ryan Larsen
+# Modified                  : Ivan Nguyen
+# Last updated              : 10-18-2026
 #
-def bulletinFooter(debug, Footer) :
+def bulletinFooter(debug, Footer, PageNumber) :
     # Add the footer image to the footer
-    Img = Image.getInstance(FooterImage)
+    Img = getImage(debug, FooterImage)
     Img.scalePercent(20)
     # createCell(debug, CellData, RowSpan, ColSpan, HorizontalAlignment, VerticalAlignment, CellPadding, BorderColors, BorderWidths, VariableBorders, BackgroundColor)
     Cell = createCell(debug, Img, TableLayoutDict['Table1']['RowSpan'], TableLayoutDict['Table1']['ColSpan'], Element.ALIGN_LEFT, 
@@ -535,7 +554,7 @@ def bulletinFooter(debug, Footer) :
 
     # Add the page numbers to the footer
     # createCell(debug, CellData, RowSpan, ColSpan, HorizontalAlignment, VerticalAlignment, CellPadding, BorderColors, BorderWidths, VariableBorders, BackgroundColor)
-    Cell = createCell(debug, Phrase(Chunk('Page %d of 2' % Writer.getPageNumber(), TableLayoutDict['Table1']['TextFont'])), TableLayoutDict['Table1']['RowSpan'], 
+    Cell = createCell(debug, Phrase(Chunk('Page %d of 2' % PageNumber, TableLayoutDict['Table1']['TextFont'])), TableLayoutDict['Table1']['RowSpan'], 
         TableLayoutDict['Table1']['ColSpan'], TableLayoutDict['Table1']['HorizontalAlignment'], TableLayoutDict['Table1']['VerticalAlignment'], 
         TableLayoutDict['Table1']['CellPadding'], TableLayoutDict['Table1']['BorderColors'], TableLayoutDict['Table1']['BorderWidths'], 
         TableLayoutDict['Table1']['VariableBorders'], TableLayoutDict['Table1']['BackgroundColor'])
@@ -582,6 +601,28 @@ def table1Footnote(debug, TableFootnote,) :
 
     return TableFootnote
 #
+# tableDataBlocks Function  : Generator that adds the data blocks of Table1 one at a time and yields the name of each data block. Used
+#                               with streamTable, so the rows of a data block are written to the pdf before the next data block is made.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+#
+def tableDataBlocks(    debug,          # Set to True to print all debug statements
+                        Table,          # PdfPTable the rows are added to
+                        TableName,      # Name of the table in DataBlockDict
+                        DataBlocks,     # List of data block names
+                        startTime,      # Start of time window
+                        endTime,        # End of time window
+                        startSysTime,   # Start of the storage time window
+                        endSysTime,     # End of the storage time window
+                        DbPathnameList, # PathnameCatalog of the pathnames in the database
+                        ) :
+    for DataBlock in DataBlocks :
+        outputDebug(debug, 'startTime = ', startTime)
+        outputDebug(debug, 'endTime = ', endTime)
+        with span('table1Data', DataBlock = '%s%s' % (TableName, DataBlock)) :
+            table1Data(debug, Table, TableName, DataBlock, startTime, endTime, startSysTime, endSysTime, DbPathnameList)
+        yield '%s%s' % (TableName, DataBlock)
+#
 #
 try :    
     # Date and Time Window Info
@@ -629,23 +670,22 @@ try :
     StartMainStemStor   = EndTw.strftime('%d%b%Y 0600')
 
     ProjectDateTimeStr  = CurDateTime.strftime('%m-%d-%Y 06:00') 
-    outputDebug(debug, lineNo(), 'Start of Time Window = ', StartTwStr)
-    outputDebug(debug, lineNo(), 'End of Time Window = ', EndTwStr)
-    outputDebug(debug, lineNo(), 'Project Date and Time = ', ProjectDateTimeStr)
+    outputDebug(debug, 'Start of Time Window = ', StartTwStr)
+    outputDebug(debug, 'End of Time Window = ', EndTwStr)
+    outputDebug(debug, 'Project Date and Time = ', ProjectDateTimeStr)
     #
     # Open database connection
     #
-    CwmsDb = DBAPI.open()
-    outputDebug(debug, lineNo(), 'CwmsDb = ', str(CwmsDb))
+    CwmsDb = timeCall('DBAPI.open', DBAPI.open)
+    outputDebug(debug, 'CwmsDb = ', CwmsDb)
     CwmsDb.setTimeZone('US/Central')
     CwmsDb.setTimeWindow(StartTwStr, EndTwStr)
     CwmsDb.setOfficeId('MVS')
     CwmsDb.setTrimMissing(False)
     conn = CwmsDb.getConnection()   # Create a java.sql.Connection
-    outputDebug(debug, lineNo(), 'conn = ', str(conn))
-    # Get list of pathnames in database
-    DbPathnameList = CwmsDb.getPathnameList()
-    outputDebug(debug, lineNo(), 'DbPathnameList = ', str(DbPathnameList))
+    outputDebug(debug, 'conn = ', conn)
+    # Get the indexed catalog of pathnames in database
+    DbPathnameList = loadPathnameCatalog(debug, CwmsDb)
     #
     # Create tables with a finite number of columns that will be written to the pdf file
     #
@@ -698,75 +738,54 @@ try :
     #
     TitleBlock = titleBlock(debug, TitleBlock)
     #
-    # Add data to the heading for Table1
+    # Add data to the heading for Table1. The heading is repeated on each page
     #
     Table1 = table1Heading(debug, Table1)
+    Table1.setHeaderRows(3)
+
+    Table1Footnote = table1Footnote(debug, Table1Footnote)
+    #
+    # Open the bulletin and its archive copy. Table1 is written to both files while its rows are made, so the finished rows do not
+    #   stay in memory.
+    #
+    filenames = [BulletinFilename, ArchiveBulletinFilename % ArchiveDateTimeStr]
+    BulletinPdf, WriterList = openBulletinPdf(debug, filenames, [LeftMargin, RightMargin, TopMargin, BottomMargin])
+    # Build a footer with page numbers and add to PDF
+    BulletinFooter = bulletinFooter(debug, BulletinFooter, WriterList[0].getPageNumber())
+    writeFooter(BulletinFooter, BulletinPdf, WriterList)
+    with span('BulletinPdf.add', Element = 'TitleBlock') : BulletinPdf.add(TitleBlock) # Add TitleBlock to the PDF
     #
     # Add data to the data blocks for Table1
     #
     print '=================================================================================================Main Script 2'
     NumberOfDataBlocks = len(DataBlockDict['DataBlocks'].keys())
     #NumberOfDataBlocks = 8
-    for x in range(1, NumberOfDataBlocks + 1, 1) :
-        DataBlock = 'Data%d' % x
-        #if DataBlock == 'Data1' or DataBlock == 'Data2' or DataBlock == 'Data3' or DataBlock == 'Data4' or DataBlock == 'Data5' or DataBlock == 'Data6' or DataBlock == 'Data7' or DataBlock == 'Data8' :
-        #if DataBlock == 'Data1':
-        startTime = StartMainStem
-        outputDebug(debug, lineNo(), 'startTime = ', startTime)
-        endTime = EndMainStem
-        outputDebug(debug, lineNo(), 'endTime = ', endTime)
-        Table1 = table1Data(debug, Table1, 'Table1', DataBlock, startTime, endTime, StartMainStemStor, endTime, DbPathnameList)
-        print '=================================================================================================Main Script 4 - For Every Basins'
-    #
-    # Create bulletin header that is repeated on each page
-    #
-    Table1.setHeaderRows(3)
-    
-    Table1Footnote = table1Footnote(debug, Table1Footnote)
-    #
-    # Create Pdf file and write tables to create bulletin
-    #
-    #filenames = [BulletinFilename]
+    DataBlocks = ['Data%d' % x for x in range(1, NumberOfDataBlocks + 1, 1)]
+    streamTable(debug, BulletinPdf, Table1, tableDataBlocks(debug, Table1, 'Table1', DataBlocks, StartMainStem, EndMainStem,
+        StartMainStemStor, EndMainStem, DbPathnameList))
+
+    # Need for second page Footer
+    BulletinFooter2 = bulletinFooter(debug, BulletinFooter2, WriterList[0].getPageNumber())
+    writeFooter(BulletinFooter2, BulletinPdf, WriterList)
+
+    with span('BulletinPdf.add', Element = 'Table1Footnote') : BulletinPdf.add(Table1Footnote) # Add Table1's footnotes
+    with span('BulletinPdf.close') : BulletinPdf.close() # Closing the document closes both pdf files
     #
-    filenames = [BulletinFilename, ArchiveBulletinFilename % ArchiveDateTimeStr]
-    for filename in filenames :
-        BulletinPdf = Document()
-        Writer = PdfWriter.getInstance(BulletinPdf, FileOutputStream(filename))
-        BulletinPdf.setPageSize(PageSize.LETTER) # Set the page size
-        PageWidth = BulletinPdf.getPageSize().getWidth()
-        BulletinPdf.setMargins(LeftMargin, RightMargin, TopMargin, BottomMargin) # Left, Right, Top, Bottom
-        BulletinPdf.setMarginMirroring(True) 
-        BulletinPdf.open()
-        # Build a footer with page numbers and add to PDF. Only need to build it one time.
-        if filename == filenames[0] :
-            BulletinFooter = bulletinFooter(debug, BulletinFooter)
-        BulletinFooter.setTotalWidth(PageWidth - 48) # Total width is 612 pixels (8.5 inches) minus the left and right margins (24 pixels each)
-        BulletinFooter.writeSelectedRows(0, -1, 24, 36, Writer.getDirectContent())
-
-        BulletinPdf.add(TitleBlock) # Add TitleBlock to the PDF
-        BulletinPdf.add(Table1) # Add Table1 to the PDF
-
-        # Need for second page Footer
-        if filename == filenames[0] :
-            BulletinFooter2 = bulletinFooter(debug, BulletinFooter2)
-        BulletinFooter2.setTotalWidth(PageWidth - 48) # Total width is 612 pixels (8.5 inches) minus the left and right margins (24 pixels each)
-        BulletinFooter2.writeSelectedRows(0, -1, 24, 36, Writer.getDirectContent())
-
-        BulletinPdf.add(Table1Footnote) # Add Table1's footnotes
-        BulletinPdf.close()
-        Writer.close()
-        #
 #
 #
 finally :
+    try : logCallSummary(CallSummaryPathname)
+    except : pass
+    try : writeTrace(TracePathname)
+    except : pass
+    try : closeStatementCache(conn)
+    except : pass
     try : CwmsDb.done()
     except : pass
     try : conn.close()
     except : pass
     try : BulletinPdf.close()
     except : pass
-    try : Writer.close()
-    except : pass
     try : BulletinTsFile.close()
     except : pass
     try : BulletinProperties.close()
@@ -327,10 +327,10 @@ def table1Data(debug,      # Set to True to print all debug statements
     # Data
     for project in DataBlockDict['DataBlocks'][TableDataName]['ProjectList'] :
         # Retrieve Public Name and store it to the DataBlockDict
-        outputDebug(debug, lineNo(), 'Location ID = ', project)
+        outputDebug(debug, 'Location ID = ', project)
         PublicName = retrievePublicName(debug, conn, project)
         ###PublicName = PublicName.replace(' & Reservoir', '')
-        outputDebug(debug, lineNo(), 'Creating %s row' % PublicName)
+        outputDebug(debug, 'Creating %s row' % PublicName)
         
         # If adding the last project in the last data block, create a trigger to use a thick bottom border
         if DataName == 'Data%d' % NumberOfDataBlocks and project == DataBlockDict['DataBlocks'][TableDataName]['ProjectList'][-1] :
@@ -341,7 +341,7 @@ def table1Data(debug,      # Set to True to print all debug statements
         TotalColSpan = 0
 
         for data in DataOrder :
-            outputDebug(debug, lineNo(), 'Adding %s to the row' % data)
+            outputDebug(debug, 'Adding %s to the row' % data)
             # Create a variable within the DataDict. This will allow the user to store all data to a dictionary and access the variables throughout
             #   the script
             DataBlockDict['DataBlocks'][TableDataName].setdefault(project, {}).setdefault(data, None)
@@ -378,7 +378,7 @@ def table1Data(debug,      # Set to True to print all debug statements
             # 1 - River Mile
             elif data == 'RiverMile' :
                 getRiverMile = retrieveRiverMile(debug,conn,project)
-                #outputDebug(True, lineNo(), 'getRiverMile = ' , type(getRiverMile))
+                #outputDebug(True, 'getRiverMile = ' , type(getRiverMile))
                 #stop
                 if type(getRiverMile) == type('') : 
                     RivMile = float(getRiverMile)
@@ -425,7 +425,7 @@ def table1Data(debug,      # Set to True to print all debug statements
                     CellData = Phrase(Chunk(Missing, TextFont))
                     TscPathname = DataBlockDict['DataBlocks'][TableDataName][data] % project
                     MVSFloodStage = retrieveLocationLevel(debug, conn, CwmsDb, TscPathname)
-                    outputDebug(debug, lineNo(), 'Flood Stage Pathname = ', TscPathname, '\tMVSFloodStage = ', MVSFloodStage)
+                    outputDebug(debug, 'Flood Stage Pathname = ', TscPathname, '\tMVSFloodStage = ', MVSFloodStage)
                     if MVSFloodStage != Null and MVSFloodStage != 'None' :
                         # Create a formatted string that will be added to the table
                         CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % MVSFloodStage, TextFont))
@@ -467,7 +467,7 @@ def table1Data(debug,      # Set to True to print all debug statements
                     # project is a pool, then no checking for floodstage
                     # If previous day's value is missing raise an exception and using the missing value
 
-                    outputDebug(debug, lineNo(), 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
+                    outputDebug(debug, 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
                     if PrevStage == Constants.UNDEFINED : raise ValueError('Missing Stage data for %s' % project)
                     elif Prev2xStage == Constants.UNDEFINED : Prev2xStage = Missing 
                     
@@ -507,7 +507,7 @@ def table1Data(debug,      # Set to True to print all debug statements
                     CellData = Phrase(Chunk(Missing, TextFont))
     
                 # Store value to DataDict
-                outputDebug(debug, lineNo(), 'Set %s %s = ' % (project, data), PrevStage)
+                outputDebug(debug, 'Set %s %s = ' % (project, data), PrevStage)
 
                 #if project in GroupSet:
                 #    PrevStage = str(PrevStage) + str('*')
@@ -567,10 +567,10 @@ def table1Data(debug,      # Set to True to print all debug statements
             Table.addCell(Cell)
 
             # Add data to CsvData. Break data loop if column span reaches the total number columns before each data piece has been added to that table
-            outputDebug(debug, lineNo(), 'ColSpan = ', ColSpan)
+            outputDebug(debug, 'ColSpan = ', ColSpan)
             TotalColSpan += ColSpan
             UnformattedData = str(CellData[0]).replace(',', '')
-            outputDebug(debug, lineNo(), 'TotalColSpan = ', TotalColSpan)
+            outputDebug(debug, 'TotalColSpan = ', TotalColSpan)
                 
         #
         # Add Continued Heading for second page
@@ -682,7 +682,7 @@ try :
     StartMainStemStor   = EndTw.strftime('%d%b%Y 0600')
 
     ProjectDateTimeStr  = CurDateTime.strftime('%m-%d-%Y 00:00') 
-    outputDebug(debug, lineNo(), 'Start of Time Window = ', StartTwStr, '\tEnd of Time Window = ', EndTwStr, 
+    outputDebug(debug, 'Start of Time Window = ', StartTwStr, '\tEnd of Time Window = ', EndTwStr, 
         '\tProject Date and Time = ', ProjectDateTimeStr)
     
     #
@@ -697,7 +697,7 @@ try :
     # Get list of pathnames in database
     DbPathnameList = CwmsDb.getPathnameList()
     #StationName = retrieveRiverMile(debug, conn, 'Hermann-Missouri')
-    #outputDebug(debug, lineNo(), 'Station Name = ', StationName)
+    #outputDebug(debug, 'Station Name = ', StationName)
     #stop
 
     #getRiverMile = retrieveRiverMile( debug,                      # Set to True to print all debug statements
@@ -769,9 +769,9 @@ try :
         #if DataBlock == 'Data1' or DataBlock == 'Data2' or DataBlock == 'Data3' or DataBlock == 'Data4' or DataBlock == 'Data5' or DataBlock == 'Data6' or DataBlock == 'Data7' or DataBlock == 'Data8' :
         #if DataBlock == 'Data1':
         startTime = StartMainStem
-        outputDebug(debug, lineNo(), 'startTime = ', startTime)
+        outputDebug(debug, 'startTime = ', startTime)
         endTime = EndMainStem
-        outputDebug(debug, lineNo(), 'endTime = ', endTime)
+        outputDebug(debug, 'endTime = ', endTime)
         Table1 = table1Data(debug, Table1, 'Table1', DataBlock, startTime, endTime, StartMainStemStor, endTime, DbPathnameList)
 
     #
@@ -96,11 +96,11 @@ def titleBlock(debug, TitleBlock,) :
     # Add USACE Logo, title block lines, and seal to TitleBlock
     TitleLines = [TitleLine1, TitleLine2, TitleLine3, TitleLine4]
     #
-    outputDebug(debug, lineNo(), 'TitleLines = ', TitleLines)
+    outputDebug(debug, 'TitleLines = ', TitleLines)
     #
     # Add the USACE Logo to the TitleBlock
     Img = Image.getInstance(UsaceLogo)
-    outputDebug(debug, lineNo(), 'Img = ', Img)
+    outputDebug(debug, 'Img = ', Img)
     Cell = PdfPCell(Img, 1)
     Cell.setRowspan(len(TitleLines))
     Cell.setHorizontalAlignment(Element.ALIGN_LEFT); Cell.setVerticalAlignment(TableLayoutDict['Table1']['VerticalAlignment'])
@@ -290,20 +290,20 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
 
     # QUERY TO GET PROJECT GROUP TO DISPLAY STAGE 29
     PoolLakeLocation = retrieveGroup(debug,conn,'RDL_POOL_LAKE_ELEV_DISPLAY') 
-    outputDebug(debug, lineNo(), 'PoolLakeLocation = ', str(PoolLakeLocation))
+    outputDebug(debug, 'PoolLakeLocation = ', str(PoolLakeLocation))
 
     # QUERY TO GET GAGES WITH LPMS DATA
     LPMSLocation = retrieveGroupLPMS(debug,conn) 
-    outputDebug(debug, lineNo(), 'LPMSLocation = ', str(LPMSLocation))
+    outputDebug(debug, 'LPMSLocation = ', str(LPMSLocation))
            
     # Data
     for project in DataBlockDict['DataBlocks'][TableDataName]['ProjectList'] :
         # Retrieve Public Name and store it to the DataBlockDict
         print '======================================================'
-        outputDebug(debug, lineNo(), 'Location ID ============================================================ project = ', project, ' ==================================')
+        outputDebug(debug, 'Location ID ============================================================ project = ', project, ' ==================================')
         PublicName = retrievePublicName(debug, conn, project)
         #PublicName = PublicName.replace(' & Reservoir', '')
-        outputDebug(debug, lineNo(), 'Creating %s row' % PublicName)
+        outputDebug(debug, 'Creating %s row' % PublicName)
 
         # If adding the last project in the last data block, create a trigger to use a thick bottom border
         if DataName == 'Data%d' % NumberOfDataBlocks and project == DataBlockDict['DataBlocks'][TableDataName]['ProjectList'][-1] :
@@ -316,7 +316,7 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
         for data in DataOrder :
             print '====================================================== data START'
             #
-            outputDebug(debug, lineNo(), 'Adding %s to the row' % data)
+            outputDebug(debug, 'Adding %s to the row' % data)
             # Create a variable within the DataDict. This will allow the user to store all data to a dictionary and access the variables throughout
             #   the script
             DataBlockDict['DataBlocks'][TableDataName].setdefault(project, {}).setdefault(data, None)
@@ -344,7 +344,7 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
 			# 1 - RiverMile
             if data == 'RiverMile' :
                 getRiverMile = retrieveRiverMile(debug,conn,project)
-                outputDebug(debug, lineNo(), 'getRiverMile = ', str(getRiverMile))
+                outputDebug(debug, 'getRiverMile = ', str(getRiverMile))
                 #stop
                 if type(getRiverMile) == type('') : 
                     RivMile = float(getRiverMile)
@@ -401,58 +401,58 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
                     CellData = Phrase(Chunk(Missing, TextFont))
                     TscPathname = DataBlockDict['DataBlocks'][TableDataName][data] % project
                     MVSFloodStage = retrieveLocationLevel(debug, conn, CwmsDb, TscPathname)
-                    outputDebug(debug, lineNo(), 'Flood Stage Pathname = ', TscPathname, '\tMVSFloodStage = ', MVSFloodStage)
+                    outputDebug(debug, 'Flood Stage Pathname = ', TscPathname, '\tMVSFloodStage = ', MVSFloodStage)
                     if MVSFloodStage != Null and MVSFloodStage != 'None' :
                         # Create a formatted string that will be added to the table
-                        outputDebug(debug, lineNo(), 'MVSFloodStage = ', str(MVSFloodStage))
+                        outputDebug(debug, 'MVSFloodStage = ', str(MVSFloodStage))
                         CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % MVSFloodStage, TextFont))
                     else:
                         CellData = Phrase(Chunk('', TextFont))
                 except Exception, e :
-                    outputDebug(debug, lineNo(), 'FloodStage Exception = ', str(e))
+                    outputDebug(debug, 'FloodStage Exception = ', str(e))
 
             # 5 - Stage
             elif data == 'Stage' :
                 if project in PoolLakeLocation:
                     TscPathname = StageInst30min29 % project
-                    outputDebug(debug, lineNo(), 'TscPathname_project = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime) 
+                    outputDebug(debug, 'TscPathname_project = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime) 
                     if TscPathname == "Mel Price Pool-Mississippi.Stage.Inst.30Minutes.0.29":  
                        TscPathname = StageInst15min29 % project 
-                       outputDebug(debug, lineNo(), 'TscPathname_mel_price = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime) 
+                       outputDebug(debug, 'TscPathname_mel_price = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime) 
                 elif project in LPMSLocation:
                      TscPathname = StageInst2HoursLpmsRaw % project
-                     outputDebug(debug, lineNo(), 'TscPathname_lpms = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime)
+                     outputDebug(debug, 'TscPathname_lpms = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime)
                 else: 
                     TscPathname = DataBlockDict['DataBlocks'][TableDataName][data] % project
-                    outputDebug(debug, lineNo(), 'TscPathname_in_data_block = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime)
+                    outputDebug(debug, 'TscPathname_in_data_block = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime)
                     if TscPathname not in DbPathnameList:
                         TscPathname = StageInst15minRevLrgs % project
-                        outputDebug(debug, lineNo(), 'TscPathname_not_in_data_block = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime)
+                        outputDebug(debug, 'TscPathname_not_in_data_block = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime)
                 try :
                     Tsc = CwmsDb.get(TscPathname, startTime, endTime)
                     PrevStage = Tsc.values[-1] # Previous day's midnight value
                     Prev2xStage = Tsc.values[0] # 2 days previous midnight value
-                    outputDebug(debug, lineNo(), 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
-                    outputDebug(debug, lineNo(), 'TscPathname = ', str(TscPathname))
+                    outputDebug(debug, 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
+                    outputDebug(debug, 'TscPathname = ', str(TscPathname))
                     #
                     getGageZero29 = retrieveGageZero29( debug,          # Set to True to print all debug statements
                                                         conn,           # 
                                                         project,        # Full name of time series container
                                                         )  
-                    outputDebug(debug, lineNo(), 'project = ', project) 
-                    outputDebug(debug, lineNo(), 'getGageZero29 = ', str(getGageZero29))                 
+                    outputDebug(debug, 'project = ', project) 
+                    outputDebug(debug, 'getGageZero29 = ', str(getGageZero29))                 
                     #
                     if PrevStage == Constants.UNDEFINED : raise ValueError('Missing Stage data for %s' % project)
                     elif Prev2xStage == Constants.UNDEFINED : Prev2xStage = Missing 		
                     #
-                    outputDebug(debug, lineNo(), 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage) 
-                    outputDebug(debug, lineNo(), 'PoolLakeLocation = ', str(PoolLakeLocation))
+                    outputDebug(debug, 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage) 
+                    outputDebug(debug, 'PoolLakeLocation = ', str(PoolLakeLocation))
                     #
                     MVSFloodStage = retrieveLocationLevel2(debug,conn,project)
-                    outputDebug(debug, lineNo(), 'MVSFloodStage = ', str(MVSFloodStage))  
+                    outputDebug(debug, 'MVSFloodStage = ', str(MVSFloodStage))  
                     #    
                     if project in PoolLakeLocation:
-                        outputDebug(debug, lineNo(), 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
+                        outputDebug(debug, 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
                         if len(str(MVSFloodStage)) > 0:
                             print 'MVSFloodStage = ' + str(MVSFloodStage) 
                             print 'getGageZero29 = ' + str(getGageZero29)
@@ -464,15 +464,15 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
                             BackgroundColor = Color4
                             print "colorset = Color4 (project with no flood stage)"    
                     elif str(MVSFloodStage) =='':
-                        outputDebug(debug, lineNo(), 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)   
+                        outputDebug(debug, 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)   
                         BackgroundColor = Color4
                         print "colorset = Color4 (white not a project)"
                     else:
-                        outputDebug(debug, lineNo(), 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
+                        outputDebug(debug, 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
                         if (float(PrevStage) >= float(MVSFloodStage)):
                             BackgroundColor = Color10
                             print "colorset = Color10 (red for regualr gage)"
-                    outputDebug(debug, lineNo(), 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
+                    outputDebug(debug, 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
 
                     #if project in PoolLakeLocation:
                     #    CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % PrevStage, TextFont2))    
@@ -483,7 +483,7 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
                     # Create a formatted string that will be added to the table
                     CellData = Phrase(Chunk(Missing, TextFont))
                 # Store value to DataDict
-                outputDebug(debug, lineNo(), 'Set %s %s = ' % (project, data), PrevStage)
+                outputDebug(debug, 'Set %s %s = ' % (project, data), PrevStage)
                 DataBlockDict['DataBlocks'][TableDataName][project][data] = PrevStage
                 DataBlockDict['DataBlocks'][TableDataName][project][data + '2x'] = Prev2xStage
                       
@@ -495,7 +495,7 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
                         raise ValueError('Cannot compute daily Stage change data for %s' % project)
             
                     DlyStageChange = DataBlockDict['DataBlocks'][TableDataName][project]['Stage'] - DataBlockDict['DataBlocks'][TableDataName][project]['Stage2x']
-                    outputDebug(debug, lineNo(), 'DlyStageChange = ', str(DlyStageChange))
+                    outputDebug(debug, 'DlyStageChange = ', str(DlyStageChange))
                     #
                     # Create a formatted string that will be added to the table
                     CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % DlyStageChange, TextFont))
@@ -508,9 +508,9 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
             Table.addCell(Cell)
             #
             # Add data to CsvData. Break data loop if column span reaches the total number columns before each data piece has been added to that table
-            outputDebug(debug, lineNo(), 'ColSpan = ', ColSpan)
+            outputDebug(debug, 'ColSpan = ', ColSpan)
             TotalColSpan += ColSpan
-            outputDebug(debug, lineNo(), 'TotalColSpan = ', TotalColSpan)    
+            outputDebug(debug, 'TotalColSpan = ', TotalColSpan)    
         #
         # Add Continued Heading for second page
         #
@@ -629,23 +629,23 @@ try :
     StartMainStemStor   = EndTw.strftime('%d%b%Y 0600')
 
     ProjectDateTimeStr  = CurDateTime.strftime('%m-%d-%Y 06:00') 
-    outputDebug(debug, lineNo(), 'Start of Time Window = ', StartTwStr)
-    outputDebug(debug, lineNo(), 'End of Time Window = ', EndTwStr)
-    outputDebug(debug, lineNo(), 'Project Date and Time = ', ProjectDateTimeStr)
+    outputDebug(debug, 'Start of Time Window = ', StartTwStr)
+    outputDebug(debug, 'End of Time Window = ', EndTwStr)
+    outputDebug(debug, 'Project Date and Time = ', ProjectDateTimeStr)
     #
     # Open database connection
     #
     CwmsDb = DBAPI.open()
-    outputDebug(debug, lineNo(), 'CwmsDb = ', str(CwmsDb))
+    outputDebug(debug, 'CwmsDb = ', str(CwmsDb))
     CwmsDb.setTimeZone('US/Central')
     CwmsDb.setTimeWindow(StartTwStr, EndTwStr)
     CwmsDb.setOfficeId('MVS')
     CwmsDb.setTrimMissing(False)
     conn = CwmsDb.getConnection()   # Create a java.sql.Connection
-    outputDebug(debug, lineNo(), 'conn = ', str(conn))
+    outputDebug(debug, 'conn = ', str(conn))
     # Get list of pathnames in database
     DbPathnameList = CwmsDb.getPathnameList()
-    outputDebug(debug, lineNo(), 'DbPathnameList = ', str(DbPathnameList))
+    outputDebug(debug, 'DbPathnameList = ', str(DbPathnameList))
     #
     # Create tables with a finite number of columns that will be written to the pdf file
     #
@@ -712,9 +712,9 @@ try :
         #if DataBlock == 'Data1' or DataBlock == 'Data2' or DataBlock == 'Data3' or DataBlock == 'Data4' or DataBlock == 'Data5' or DataBlock == 'Data6' or DataBlock == 'Data7' or DataBlock == 'Data8' :
         #if DataBlock == 'Data1':
         startTime = StartMainStem
-        outputDebug(debug, lineNo(), 'startTime = ', startTime)
+        outputDebug(debug, 'startTime = ', startTime)
         endTime = EndMainStem
-        outputDebug(debug, lineNo(), 'endTime = ', endTime)
+        outputDebug(debug, 'endTime = ', endTime)
         Table1 = table1Data(debug, Table1, 'Table1', DataBlock, startTime, endTime, StartMainStemStor, endTime, DbPathnameList)
         print '=================================================================================================Main Script 4 - For Every Basins'
     #
@@ -62,6 +62,17 @@ if CronjobsDirectory not in sys.path : sys.path.append(CronjobsDirectory)
 if BulletinsDirectory not in sys.path : sys.path.append(BulletinsDirectory)
 if ScriptDirectory not in sys.path : sys.path.append(ScriptDirectory)
 
+# Call counts and latency of the Server_Utils functions, and the trace of the run, are written to these files at the end of the run
+CallSummaryPathname = ScriptDirectory + 'MVS_WebRep_Bulletin_Calls.json'
+TracePathname = ScriptDirectory + 'MVS_WebRep_Bulletin_Trace.json'
+
+# The properties files are loaded with the compiled properties cache in Server_Utils.py
+from Server_Utils import loadProperties, resetTrace, resetCallStats
+
+# Start the trace and count the calls of this run only before the properties are loaded, so they are in the trace and the call summary
+resetTrace('MVS_WebRep_Bulletin')
+resetCallStats()
+
 # --------------------------------------------------------------------------------------------------------------------------------------
 # Load DatabasePathnames.txt (One level above at "Bulletins" Folder) and BulletinProperties.txt (Same folder "MVS_Webrep")
 # --------------------------------------------------------------------------------------------------------------------------------------
@@ -70,17 +81,18 @@ while True :
     errorMessage = None
     # Build Pathname for DatabasePathnames.txt
     DatabasePathnamesFile = os.path.join(CronjobsDirectory, "DatabasePathnames.txt")
+    ReferenceCachePathname = os.path.join(CronjobsDirectory, "ReferenceCache.json")
     print 'DatabasePathnamesFile = ' + str(DatabasePathnamesFile)
 
     # ***
     if not os.path.exists(DatabasePathnamesFile) :
         errorMessage = "DatabasePathnames.txt does not exist: %s" % DatabasePathnamesFile
-    with open(DatabasePathnamesFile, "r") as f : exec(f.read())
+    loadProperties(DatabasePathnamesFile, globals())
     break
 # ***
 if errorMessage :
     print "ERROR : " + errorMessage
-BulletinProperties = open(BulletinPropertiesPathname, "r"); exec(BulletinProperties)
+loadProperties(BulletinPropertiesPathname, globals())
 
 # --------------------------------------------------------------------------------------------------------------------------------------
 # Import Query Functions From Server_Utils.py (One level above at "Bulletins" Folder)
@@ -90,15 +102,24 @@ from Server_Utils import lineNo, outputDebug, retrieveCrest, retrieveCrestDate,
     retrieveElevatonDatum, retrieveRiverMile, retrieveGroup, retrieveGroupLPMS, retrieveGageZero29, retrieveBasin, retrieveLocationID, \
     createCell, is_dst, checkTs, retrieveNWSDay1Date, retrieveNWSDay2Date, retrieveNWSDay3Date, retrievePrecipLake, retrieveMidnight,\
     retrieveEveningOutflow, retrieveRuleCurve, retrieveCrestLake, retrieveCrestLakeDate, retrieveYesterdayInflow, retrieveLakeMeta,\
-    retrieveStorageLake, retrieveTopBottomLake, retrieveLocationLevel2
+    retrieveStorageLake, retrieveTopBottomLake, retrieveLocationLevel2, getProjectList, retrieveLocationMeta, retrieveNWSForecast, \
+    retrieveTsFirstLast, loadPathnameCatalog, closeStatementCache, retrieveLakeSnapshot, EmptyLakeRecord, \
+    retrieveLocationMetaCached, configureLogging, BulletinLog, CellStyleProperties, getImage, getConnectionPool, borrowConnection, \
+    fetchConcurrently, QueryConcurrency, rowRecordClass, DataBlockRows, openBulletinPdf, writeFooter, streamTable, \
+    logCallSummary, span, writeTrace
+
+# Row records of each data block, keyed by data block name, e.g. Table1Data1. They are filled by the data functions
+TableRows = {}
 
 # --------------------------------------------------------------------------------------------------------------------------------------
-# Set debug = True to print all debug statements and = False to turn them off
+# Log to MVS_WebRep_Bulletin.log in the script folder. Set BulletinLogLevel = 'DEBUG' (or BULLETIN_LOG_LEVEL=DEBUG in the environment)
+# to write all debug statements. debug is False for any other level and the debug statements are skipped.
 # --------------------------------------------------------------------------------------------------------------------------------------
-debug = True
-#debug = False
+BulletinLogLevel = 'INFO'
+debug = configureLogging(ScriptDirectory + 'MVS_WebRep_Bulletin.log', BulletinLogLevel)
+BulletinLog.info('Creating %s', BulletinFilename)
 
-print '=========================================================== OS END'
+outputDebug(debug, '=========================================================== OS END')
 
 ##################################################################################################################################
 # Functions
@@ -113,7 +134,7 @@ def titleBlock( debug,      # Set to True to print all debug statements
                 TitleBlock  # PdfPTable object
               ) :
 
-    print '=========================================================== titleBlock START'
+    outputDebug(debug, '=========================================================== titleBlock START')
     
     # Add USACE Logo, title block lines, and seal to TitleBlock
 
@@ -123,7 +144,7 @@ def titleBlock( debug,      # Set to True to print all debug statements
     # createCell(debug, CellData, RowSpan, ColSpan, HorizontalAlignment, VerticalAlignment, CellPadding, BorderColors, BorderWidths, VariableBorders, BackgroundColor)
 
     # Add USACE Logo to TitleBlock
-    Img = Image.getInstance(UsaceLogo)
+    Img = getImage(debug, UsaceLogo)
     Cell = PdfPCell(Img, 1)
     Cell.setRowspan(len(TitleLines))
     Cell.setHorizontalAlignment(Element.ALIGN_LEFT); Cell.setVerticalAlignment(TableLayoutDict['Table1']['VerticalAlignment'])
@@ -142,7 +163,7 @@ def titleBlock( debug,      # Set to True to print all debug statements
     UnformattedData = str(CellData[0]).replace(',', '') + ',\n'
     
     # Add the Seal to the TitleBlock
-    Img = Image.getInstance(Seal)
+    Img = getImage(debug, Seal)
     Cell = PdfPCell(Img, 1)
     Cell.setRowspan(len(TitleLines))
     Cell.setHorizontalAlignment(TableLayoutDict['Table1']['HorizontalAlignment']); Cell.setVerticalAlignment(TableLayoutDict['Table1']['VerticalAlignment'])
@@ -187,7 +208,7 @@ def titleBlock( debug,      # Set to True to print all debug statements
     Cell.setFixedHeight(4)
     TitleBlock.addCell(Cell)
 
-    print '=========================================================== titleBlock END'
+    outputDebug(debug, '=========================================================== titleBlock END')
 
     return TitleBlock
 #
@@ -197,21 +218,21 @@ def titleBlock( debug,      # Set to True to print all debug statements
 # Last updated              : 05-03-2023
 #
 def table1Heading(debug, Table,) :
-    print '=========================================================== table1Heading'
+    outputDebug(debug, '=========================================================== table1Heading')
     # Create Table1 Heading 
     # createCell(debug, CellData, RowSpan, ColSpan, HorizontalAlignment, VerticalAlignment, CellPadding, BorderColors, BorderWidths, VariableBorders, BackgroundColor)
     # [Top, Right, Bottom, Left]
 
-    # Query to Get NWS Date
+    # NWS forecast dates from the St Louis forecast
     #
-    NWSDay1Date = retrieveNWSDay1Date(debug, conn) 
-    outputDebug(debug, lineNo(), 'NWSDay1Date = ', str(NWSDay1Date))
+    NWSDay1Date = NWSForecast.get('St Louis-Mississippi', {}).get('Day1Date')
+    outputDebug(debug, 'NWSDay1Date = ', NWSDay1Date)
     #
-    NWSDay2Date = retrieveNWSDay2Date(debug, conn) 
-    outputDebug(debug, lineNo(), 'NWSDay2Date = ', str(NWSDay2Date))
+    NWSDay2Date = NWSForecast.get('St Louis-Mississippi', {}).get('Day2Date')
+    outputDebug(debug, 'NWSDay2Date = ', NWSDay2Date)
     #
-    NWSDay3Date = retrieveNWSDay3Date(debug, conn) 
-    outputDebug(debug, lineNo(), 'NWSDay3Date = ', str(NWSDay3Date))
+    NWSDay3Date = NWSForecast.get('St Louis-Mississippi', {}).get('Day3Date')
+    outputDebug(debug, 'NWSDay3Date = ', NWSDay3Date)
 
     # Table Heading Note
     Cell = createCell(debug, Phrase(Chunk('NOTE: ALL WATER LEVELS GIVEN IN STAGE, UNLESS INDICATED (GAGE ZERO + STAGE = ELEVATION \n FORECASTS INCLUDE OBSERVED PRECIP UP TO 6AM TODAY + EXPECTED PRECIP TO 6AM TOMORROW ONLY.', Font8)), TableLayoutDict['Table1']['RowSpan'], Table1Columns, TableLayoutDict['Table1']['HorizontalAlignmentLeft'], 
@@ -581,7 +602,7 @@ def table1Heading(debug, Table,) :
     Table.addCell(Cell)
     UnformattedData = str(CellData[0]).replace(',', '') + ','
 
-    print '=========================================================== table1Heading END'
+    outputDebug(debug, '=========================================================== table1Heading END')
 
     return Table
 #
@@ -591,7 +612,7 @@ def table1Heading(debug, Table,) :
 # Last updated              : 03-30-2022
 #
 def table2Heading(debug, Table,) :
-    print '=========================================================== table2Heading'
+    outputDebug(debug, '=========================================================== table2Heading')
     # Create Table2 Heading 
     # createCell(debug, CellData, RowSpan, ColSpan, HorizontalAlignment, VerticalAlignment, CellPadding, BorderColors, BorderWidths, VariableBorders, BackgroundColor)
     # [Top, Right, Bottom, Left]
@@ -865,7 +886,7 @@ def table2Heading(debug, Table,) :
     Cell.setFixedHeight(25)
     Table.addCell(Cell)
     UnformattedData = str(CellData[0]).replace(',', '') + ','
-    print '=========================================================== table1Heading END'
+    outputDebug(debug, '=========================================================== table1Heading END')
 
     return Table
 #
@@ -874,9 +895,50 @@ def table2Heading(debug, Table,) :
 # Modified                  : Ivan Nguyen
 # Last updated              : 03-30-2022
 #
-def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTime, endSysTime, DbPathnameList) :
-    print ''
-    print '================================================================================================= table1Data START'
+# stagePathname Function    : Resolves the Stage pathname for a project. Pool and lake gages use the NGVD29 30 minute data (15 minute
+#                               for Mel Price), LPMS gages use the LPMS data and the remaining gages use the data block pathname
+#                               unless it is not in the database.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def stagePathname(  debug,          # Set to True to print all debug statements
+                    TableDataName,  # Name of the data block in DataBlockDict
+                    project,        # Location ID
+                    DbPathnameList, # PathnameCatalog of the pathnames in the database
+                    ) :
+    if project in PoolLakeLocation :
+        CandidateList = [StageInst30min29 % project]
+        if CandidateList[0] == "Mel Price Pool-Mississippi.Stage.Inst.30Minutes.0.29" :
+            CandidateList = [StageInst15min29 % project]
+    elif project in GroupSetLPMS :
+        CandidateList = [StageInst2HoursLpmsRaw % project]
+    else :
+        CandidateList = [DataBlockDict['DataBlocks'][TableDataName]['Stage'] % project, StageInst15minRevLrgs % project]
+    TscPathname = DbPathnameList.firstPathname(CandidateList)
+    outputDebug(debug, 'project = ', project, '\tStage TscPathname = ', TscPathname)
+    return TscPathname
+
+# retrieveStageData Function    : Resolves the Stage pathname for every project in the data blocks of a table and retrieves all of the
+#                                   Stage values with one query
+# Author/Editor                 : Ivan Nguyen
+# Last updated                  : 10-18-2026
+
+def retrieveStageData(  debug,          # Set to True to print all debug statements
+                        TableName,      # Name of the table in DataBlockDict
+                        DataBlocks,     # List of data block names
+                        startTime,      # Start of time window
+                        endTime,        # End of time window
+                        DbPathnameList, # List of pathnames in the database
+                        ) :
+    PathnameList = []
+    for DataName in DataBlocks :
+        TableDataName = '%s%s' % (TableName, DataName)
+        for project in DataBlockDict['DataBlocks'][TableDataName]['ProjectList'] :
+            PathnameList.append(stagePathname(debug, TableDataName, project, DbPathnameList))
+    return retrieveTsFirstLast(debug, conn, PathnameList, startTime, endTime)
+
+def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTime, endSysTime, DbPathnameList, StageData) :
+    outputDebug(debug, '================================================================================================= table1Data START')
     # Create name for TableData
     TableDataName = '%s%s' % (TableName, DataName)
     #
@@ -903,23 +965,26 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
     # Add text to CsvData
     CellData = Phrase(Chunk(DataBlockDict['DataBlocks'][TableDataName]['Heading'], Font5))
 
-    # QUERY TO GET PROJECT GROUP TO DISPLAY STAGE 29
-    PoolLakeLocation = retrieveGroup(debug,conn,'RDL_POOL_LAKE_ELEV_DISPLAY') 
-    outputDebug(debug, lineNo(), 'PoolLakeLocation = ', str(PoolLakeLocation))
+    # Default cell properties of the table. They are read from the TableLayoutDict once instead of for every cell
+    DefaultTextFont = TableLayoutDict[TableName]['TextFont']
+    DefaultTextFont4 = TableLayoutDict[TableName]['TextFont4']
+    DefaultCellProperties = tuple([TableLayoutDict[TableName][Name] for Name in CellStyleProperties])
+
+    # Row records of the data block. The values that are computed for each row are kept in TableRows instead of the DataBlockDict
+    Rows = DataBlockRows(TableDataName, rowRecordClass('%sRow' % TableName, DataOrder + ['Stage2x']),
+        DataBlockDict['DataBlocks'][TableDataName]['ProjectList'])
+    TableRows[TableDataName] = Rows
 
-    # QUERY TO GET GAGES WITH LPMS DATA
-    GroupSetLPMS = retrieveGroupLPMS(debug,conn) 
-    outputDebug(debug, lineNo(), 'GroupSetLPMS = ', str(GroupSetLPMS))
-           
     # Data
-    for project in DataBlockDict['DataBlocks'][TableDataName]['ProjectList'] :
+    for Row in Rows :
+        project = Row.Project
         # Retrieve Public Name and store it to the DataBlockDict
-        outputDebug(debug, lineNo(), 'Location ID ============================================================================================== project = ', project, ' ==================================')
-        PublicName = retrievePublicName(debug, conn, project)
-        outputDebug(debug, lineNo(), 'Creating %s row' % PublicName)
+        outputDebug(debug, 'Location ID ============================================================================================== project = ', project, ' ==================================')
+        PublicName = LocationMeta[project]['PublicName']
+        outputDebug(debug, 'Creating ', PublicName, ' row')
         
         # If adding the last project in the last data block, create a trigger to use a thick bottom border [?]
-        if DataName == 'Data%d' % NumberOfDataBlocks and project == DataBlockDict['DataBlocks'][TableDataName]['ProjectList'][-1] :
+        if DataName == 'Data%d' % NumberOfDataBlocks and project == Rows.ProjectList[-1] :
             LastProject = True
         else : LastProject = False
 
@@ -927,41 +992,29 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
         TotalColSpan = 0
 
         for data in DataOrder :
-            print '====================================================== data START'
+            outputDebug(debug, '====================================================== data START')
             
-            outputDebug(debug, lineNo(), 'Adding %s to the row' % data)
+            outputDebug(debug, 'Adding ', data, ' to the row')
 
-            # Create a variable within the DataDict. This will allow the user to store all data to a dictionary and access the variables throughout
-            DataBlockDict['DataBlocks'][TableDataName].setdefault(project, {}).setdefault(data, None)
             
             # Get column number
             ColumnKey = 'Column%d' % DataOrder.index(data)
-            outputDebug(debug, lineNo(), 'ColumnKey = ', str(ColumnKey))
+            outputDebug(debug, 'ColumnKey = ', ColumnKey)
             
             # Default cell properties. If there is a special case, the properties will be changed.
-            TextFont = TableLayoutDict[TableName]['TextFont']
-            TextFont4 = TableLayoutDict[TableName]['TextFont4']
-            if project in ['SYS'] :
-                RowSpan = 3
-            else :
-                RowSpan = TableLayoutDict[TableName]['RowSpan']
-            
-            ColSpan = TableLayoutDict[TableName]['ColSpan']   
-            HorizontalAlignment = TableLayoutDict[TableName]['HorizontalAlignment']; VerticalAlignment = TableLayoutDict[TableName]['VerticalAlignment']
-            CellPadding = TableLayoutDict[TableName]['CellPadding'] #[Top, Right, Bottom, Left]
-            BorderColors = TableLayoutDict[TableName]['BorderColors']
-            BorderWidths = TableLayoutDict[TableName]['BorderWidths']
-            VariableBorders = TableLayoutDict[TableName]['VariableBorders']
-            BackgroundColor = TableLayoutDict[TableName]['BackgroundColor']
+            TextFont, TextFont4 = DefaultTextFont, DefaultTextFont4
+            RowSpan, ColSpan, HorizontalAlignment, VerticalAlignment, CellPadding, BorderColors, BorderWidths, VariableBorders, \
+                BackgroundColor = DefaultCellProperties
+            if project in ['SYS'] : RowSpan = 3
             
 			# 01 - RiverMile
             if data == 'RiverMile' :
-                getRiverMile = retrieveRiverMile(debug,conn,project)
-                outputDebug(debug, lineNo(), 'getRiverMile = ', str(getRiverMile))
+                getRiverMile = LocationMeta[project]['RiverMile']
+                outputDebug(debug, 'getRiverMile = ', getRiverMile)
                 
                 if type(getRiverMile) == type('') : 
                     RiverMile = float(getRiverMile)
-                    outputDebug(debug, lineNo(), 'RiverMile = ', str(RiverMile))
+                    outputDebug(debug, 'RiverMile = ', RiverMile)
                     CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % RiverMile, TextFont))
                 else :
                     CellData = Phrase(Chunk(Null, TextFont))
@@ -986,84 +1039,64 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
 
             # 03 - Stage
             elif data == 'Stage' :
-                if_project = False
-                if project in PoolLakeLocation:
-                    if_project = True
-                    TscPathname = StageInst30min29 % project
-                    outputDebug(debug, lineNo(), 'TscPathname_project = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime) 
-                    if TscPathname == "Mel Price Pool-Mississippi.Stage.Inst.30Minutes.0.29":  
-                       TscPathname = StageInst15min29 % project 
-                       outputDebug(debug, lineNo(), 'TscPathname_mel_price = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime) 
-                elif project in GroupSetLPMS:
-                     TscPathname = StageInst2HoursLpmsRaw % project
-                     outputDebug(debug, lineNo(), 'TscPathname_lpms = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime)
-                else: 
-                    TscPathname = DataBlockDict['DataBlocks'][TableDataName][data] % project
-                    outputDebug(debug, lineNo(), 'TscPathname_in_data_block = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime)
-                    if TscPathname not in DbPathnameList:
-                        TscPathname = StageInst15minRevLrgs % project
-                        outputDebug(debug, lineNo(), 'TscPathname_not_in_data_block = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime)
+                TscPathname = stagePathname(debug, TableDataName, project, DbPathnameList)
                 try :
-                    Tsc = CwmsDb.get(TscPathname, startTime, endTime)
-                    PrevStage = Tsc.values[-1] # Previous day's midnight value
-                    Prev2xStage = Tsc.values[0] # 2 days previous midnight value
-                    outputDebug(debug, lineNo(), 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
-                    outputDebug(debug, lineNo(), 'TscPathname = ', str(TscPathname))
+                    PrevStage = StageData[TscPathname]['Last'] # Previous day's midnight value
+                    Prev2xStage = StageData[TscPathname]['First'] # 2 days previous midnight value
+                    outputDebug(debug, 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
+                    outputDebug(debug, 'TscPathname = ', TscPathname)
                     
-                    getGageZero29 = retrieveGageZero29( debug,          # Set to True to print all debug statements
-                                                        conn,           # 
-                                                        project,        # Full name of time series container
-                                                        )  
-                    outputDebug(debug, lineNo(), 'project = ', project) 
-                    outputDebug(debug, lineNo(), 'getGageZero29 = ', str(getGageZero29))                 
+                    getGageZero29 = LocationMeta[project]['GageZero29']
+                    outputDebug(debug, 'project = ', project) 
+                    outputDebug(debug, 'getGageZero29 = ', getGageZero29)                 
                     
                     if PrevStage == Constants.UNDEFINED : raise ValueError('Missing Stage data for %s' % project)
                     elif Prev2xStage == Constants.UNDEFINED : Prev2xStage = Missing 		
                     
-                    outputDebug(debug, lineNo(), 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage) 
-                    outputDebug(debug, lineNo(), 'PoolLakeLocation = ', str(PoolLakeLocation))
+                    outputDebug(debug, 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage) 
+                    outputDebug(debug, 'PoolLakeLocation = ', PoolLakeLocation)
                     
-                    MVSFloodStage = retrieveLocationLevel2(debug,conn,project)
-                    outputDebug(debug, lineNo(), 'MVSFloodStage = ', str(MVSFloodStage))  
+                    MVSFloodStage = LocationMeta[project]['FloodLevel']
+                    outputDebug(debug, 'MVSFloodStage = ', MVSFloodStage)  
                       
                     if project in PoolLakeLocation:
-                        outputDebug(debug, lineNo(), 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
+                        outputDebug(debug, 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
                         TextFont = FontBold
                         if len(str(MVSFloodStage)) > 0:
-                            print 'MVSFloodStage = ' + str(MVSFloodStage) 
-                            print 'getGageZero29 = ' + str(getGageZero29)
+                            outputDebug(debug, 'MVSFloodStage = ', MVSFloodStage)
+                            outputDebug(debug, 'getGageZero29 = ', getGageZero29)
                             # if (float(PrevStage) >= (float(MVSFloodStage) + float(getGageZero29))): BackgroundColor = Color10 # BackgroundColor = Red
                             if (float(PrevStage) >= (float(MVSFloodStage) + float(getGageZero29))): TextFont = FontBoldRed # TextFont = Red
                         else : 
                             BackgroundColor = Color4   
                     elif str(MVSFloodStage) =='':
-                        outputDebug(debug, lineNo(), 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)   
+                        outputDebug(debug, 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)   
                         BackgroundColor = Color4
                     else:
-                        outputDebug(debug, lineNo(), 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
+                        outputDebug(debug, 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
                         if (float(PrevStage) >= float(MVSFloodStage)):
                             #BackgroundColor = Color10 # BackgroundColor = Red
                             TextFont = Font10 # TextFont = Red
-                    outputDebug(debug, lineNo(), 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
+                    outputDebug(debug, 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
                     CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % PrevStage, TextFont))
                 except :
                     PrevStage, Prev2xStage = Missing, Missing
                     # Create a formatted string that will be added to the table
                     CellData = Phrase(Chunk(Missing, TextFont))
-                # Store value to DataDict
-                outputDebug(debug, lineNo(), 'Set %s %s = ' % (project, data), PrevStage)
-                DataBlockDict['DataBlocks'][TableDataName][project][data] = PrevStage
-                DataBlockDict['DataBlocks'][TableDataName][project][data + '2x'] = Prev2xStage
+                # Store the values in the row record
+                outputDebug(debug, 'Set ', project, ' ', data, ' = ', PrevStage)
+                Row.Stage = PrevStage
+                Row.Stage2x = Prev2xStage
 
 
             # 04 StageChange
             elif data == 'StageChange' :
                 try :
-                    if DataBlockDict['DataBlocks'][TableDataName][project]['Stage'] == Missing or \
-                        DataBlockDict['DataBlocks'][TableDataName][project]['Stage2x'] == Missing :
+                    if Row.Stage == Missing or Row.Stage2x == Missing :
                         raise ValueError('Cannot compute daily Stage change data for %s' % project)
             
-                    DlyStageChange = DataBlockDict['DataBlocks'][TableDataName][project]['Stage'] - DataBlockDict['DataBlocks'][TableDataName][project]['Stage2x']
+                    DlyStageChange = Row.Stage - Row.Stage2x
+                    Row.StageChange = DlyStageChange
                     
                     if DlyStageChange < 0 :
                         #BackgroundColor = Color10 # Change Background Color to RED
@@ -1077,18 +1110,19 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
                     CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % DlyStageChange, TextFont))
                 except :
                     DlyStageChange = Missing
+                    Row.StageChange = DlyStageChange
                     # Create a formatted string that will be added to the table
                     CellData = Phrase(Chunk(Missing, TextFont))
 
 
             # 05 - NWSDay1
             elif data == 'NWSDay1' :
-                getNWSDay1 = retrieveNWSDay1(debug,conn,project)
-                outputDebug(debug, lineNo(), 'getNWSDay1 = ', str(getNWSDay1))
+                getNWSDay1 = LocationMeta[project]['NWSDay1']
+                outputDebug(debug, 'getNWSDay1 = ', getNWSDay1)
 
                 if getNWSDay1 != None:
                     NWSDay1 = float(getNWSDay1)
-                    outputDebug(debug, lineNo(), 'NWSDay1 = ', str(NWSDay1))
+                    outputDebug(debug, 'NWSDay1 = ', NWSDay1)
                     CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % NWSDay1, TextFont))
                 else :
                     CellData = Phrase(Chunk('', TextFont)) 
@@ -1097,12 +1131,12 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
 
             # 06 - NWSDay2
             elif data == 'NWSDay2' :
-                getNWSDay2 = retrieveNWSDay2(debug,conn,project)
-                outputDebug(debug, lineNo(), 'getNWSDay2 = ', str(getNWSDay2))
+                getNWSDay2 = LocationMeta[project]['NWSDay2']
+                outputDebug(debug, 'getNWSDay2 = ', getNWSDay2)
 
                 if getNWSDay2 != None:
                     NWSDay2 = float(getNWSDay2)
-                    outputDebug(debug, lineNo(), 'NWSDay2 = ', str(NWSDay2))
+                    outputDebug(debug, 'NWSDay2 = ', NWSDay2)
                     CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % NWSDay2, TextFont))
                 else :
                     CellData = Phrase(Chunk('', TextFont))
@@ -1110,12 +1144,12 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
 
             # 07 - NWSDay3
             elif data == 'NWSDay3' :
-                getNWSDay3 = retrieveNWSDay3(debug,conn,project)
-                outputDebug(debug, lineNo(), 'getNWSDay3 = ', str(getNWSDay3))
+                getNWSDay3 = LocationMeta[project]['NWSDay3']
+                outputDebug(debug, 'getNWSDay3 = ', getNWSDay3)
 
                 if getNWSDay3 != None:
                     NWSDay3 = float(getNWSDay3)
-                    outputDebug(debug, lineNo(), 'NWSDay3 = ', str(NWSDay3))
+                    outputDebug(debug, 'NWSDay3 = ', NWSDay3)
                     CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % NWSDay3, TextFont))
                 else :
                     CellData = Phrase(Chunk('', TextFont))
@@ -1123,8 +1157,8 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
 
             # 08 - NWSForecastDate
             elif data == 'NWSForecastDate' :
-                getNWSForecastDate = retrieveNWSForecastDate(debug,conn,project) 
-                outputDebug(debug, lineNo(), 'getNWSForecastDate = ', str(getNWSForecastDate))
+                getNWSForecastDate = LocationMeta[project]['NWSForecastDate']
+                outputDebug(debug, 'getNWSForecastDate = ', getNWSForecastDate)
 
                 if getNWSForecastDate != None:
                     CellData = Phrase(Chunk(getNWSForecastDate, TextFont))
@@ -1134,12 +1168,12 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
 
             # 09 - Crest
             elif data == 'Crest' :
-                getCrest = retrieveCrest(debug,conn,project)
-                outputDebug(debug, lineNo(), 'getCrest = ', str(getCrest))
+                getCrest = LocationMeta[project]['Crest']
+                outputDebug(debug, 'getCrest = ', getCrest)
 
                 if getCrest != None:
                     Crest = float(getCrest)
-                    outputDebug(debug, lineNo(), 'Crest = ', str(Crest))
+                    outputDebug(debug, 'Crest = ', Crest)
                     CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % Crest, TextFont))
                 else :
                     CellData = Phrase(Chunk('', TextFont))
@@ -1147,14 +1181,14 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
 
             # 10 - CrestDate
             elif data == 'CrestDate' :
-                getCrestDate = retrieveCrestDate(debug,conn,project)  
-                outputDebug(debug, lineNo(), 'getCrestDate = ', str(getCrestDate))  
+                getCrestDate = LocationMeta[project]['CrestDate']
+                outputDebug(debug, 'getCrestDate = ', getCrestDate)  
 
                 if getCrestDate != None:
-                    outputDebug(debug, lineNo(), 'getCrestDate = ', str(getCrestDate)) 
+                    outputDebug(debug, 'getCrestDate = ', getCrestDate) 
                 if type(getCrestDate) == type('') : 
                     CrestDate = str(getCrestDate)
-                    outputDebug(debug, lineNo(), 'CrestDate = ', str(CrestDate)) 
+                    outputDebug(debug, 'CrestDate = ', CrestDate) 
                     CellData = Phrase(Chunk(CrestDate, TextFont))
                 else :
                     CellData = Phrase(Chunk('', TextFont))
@@ -1166,11 +1200,10 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
                 try :
                     MVSFloodStage = Null
                     CellData = Phrase(Chunk('', TextFont))
-                    TscPathname = DataBlockDict['DataBlocks'][TableDataName][data] % project
-                    MVSFloodStage = retrieveLocationLevel(debug, conn, CwmsDb, TscPathname)
-                    outputDebug(debug, lineNo(), 'Flood Stage Pathname = ', TscPathname, '\tMVSFloodStage = ', MVSFloodStage)
+                    MVSFloodStage = LocationMeta[project]['FloodStage']
+                    outputDebug(debug, 'MVSFloodStage = ', MVSFloodStage)
                     
-                    if MVSFloodStage != Null and MVSFloodStage != 'None' :
+                    if MVSFloodStage != None and MVSFloodStage != Null and MVSFloodStage != 'None' :
                         if MVSFloodStage > 900 :
                             CellData = Phrase(Chunk('', TextFont))
                         else :
@@ -1180,7 +1213,7 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
                         CellData = Phrase(Chunk('', TextFont))
                     BorderColors = [Color2, Color2, Color2, Color3]
                 except Exception, e :
-                    outputDebug(debug, lineNo(), 'FloodStage Exception = ', str(e))
+                    outputDebug(debug, 'FloodStage Exception = ', e)
                     BorderColors = [Color2, Color2, Color2, Color3]
 
               
@@ -1196,15 +1229,15 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
                     elif project in ['SYS'] :
                         CellData = Phrase(Chunk(Null, TextFont))
                     else :
-            			ElevationDatum = retrieveElevatonDatum(debug, conn, project) 
+            			ElevationDatum = LocationMeta[project]['ElevDatum']
                     # Create a formatted string that will be added to the table
                     
-        			if ElevationDatum == Null or ElevationDatum == 'None' :
+        			if ElevationDatum == None or ElevationDatum == Null or ElevationDatum == 'None' :
         			   CellData = Phrase(Chunk(Null, TextFont))
         			else :
         			   CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % float(ElevationDatum), TextFont))
                 except Exception, e :
-                    print "Elevation Datum Exception = " + str(e)	
+                    outputDebug(debug, "Elevation Datum Exception = ", e)
                     # Create a formatted string that will be added to the table
                     CellData = Phrase(Chunk(Missing, TextFont))
 
@@ -1214,27 +1247,25 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
                 try :
                     MVSRecordStage = Null
                     CellData = Phrase(Chunk(Missing, TextFont))
-                    TscPathname = DataBlockDict['DataBlocks'][TableDataName][data] % project
-                    MVSRecordStage = retrieveRecordStage(debug, conn, CwmsDb, TscPathname)
-                    outputDebug(debug, lineNo(), 'TscPathname = ', str(TscPathname))
-                    outputDebug(debug, lineNo(), 'MVSFloodStage = ', str(MVSFloodStage))
-                    outputDebug(debug, lineNo(), 'MVSRecordStage = ', str(MVSRecordStage))
+                    MVSRecordStage = LocationMeta[project]['RecordStage']
+                    outputDebug(debug, 'MVSFloodStage = ', MVSFloodStage)
+                    outputDebug(debug, 'MVSRecordStage = ', MVSRecordStage)
 
-                    if MVSRecordStage != Null and MVSRecordStage != 'None' :
+                    if MVSRecordStage != None and MVSRecordStage != Null and MVSRecordStage != 'None' :
                         # Create a formatted string that will be added to the table
                         CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % MVSRecordStage, TextFont))
                     else:
                         #CellData = Phrase(Chunk(Missing, TextFont))
                         CellData = Phrase(Chunk(Missing, TextFont))
                 except Exception, e :
-                    outputDebug(debug, lineNo(), 'RecordStage Exception = ', str(e))
+                    outputDebug(debug, 'RecordStage Exception = ', e)
 
 
             # 14 - RecordStageDate
             elif data == 'RecordStageDate' :
-                getRecordStageDate = retrieveRecordStageDate(debug,conn,project)
+                getRecordStageDate = LocationMeta[project]['RecordStageDate']
                 if getRecordStageDate != None:
-                    print 'getRecordStageDate = ' + getRecordStageDate
+                    outputDebug(debug, 'getRecordStageDate = ', getRecordStageDate)
                 if type(getRecordStageDate) == type('') : 
                     RecordStageDate = str(getRecordStageDate)
                     #CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % RecordStageDate, TextFont))
@@ -1252,15 +1283,15 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
             Table.addCell(Cell)
 
             # Add data to CsvData. Break data loop if column span reaches the total number columns before each data piece has been added to that table
-            outputDebug(debug, lineNo(), 'ColSpan = ', ColSpan)
+            outputDebug(debug, 'ColSpan = ', ColSpan)
             TotalColSpan += ColSpan
             UnformattedData = str(CellData[0]).replace(',', '')
-            outputDebug(debug, lineNo(), 'TotalColSpan = ', TotalColSpan)
-            print '==========================='    
+            outputDebug(debug, 'TotalColSpan = ', TotalColSpan)
+            outputDebug(debug, '===========================')
         #
         # Add Continued Heading for second page
         #
-    print '=================================================================================================Data1_END'
+    outputDebug(debug, '=================================================================================================Data1_END')
     return Table
 #
 # table2Data Function       : Creates the title block for the bulletin
@@ -1268,32 +1299,38 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
 # Modified                  : Ivan Nguyen
 # Last updated              : 03-30-2022
 #
-def table2Data(debug, Table, TableName, DataName, startTime, endTime, startSysTime, endSysTime, DbPathnameList) :
-    print '=================================================================================================table2Data'
+def table2Data(debug, Table, TableName, DataName, startTime, endTime, startSysTime, endSysTime, DbPathnameList, StageData) :
+    outputDebug(debug, '=================================================================================================table2Data')
     # Create name for TableData
     TableDataName = '%s%s' % (TableName, DataName)
 
 # Data Block Heading
 # createCell(debug, CellData, RowSpan, ColSpan, HorizontalAlignment, VerticalAlignment, CellPadding, BorderColors, BorderWidths, VariableBorders, BackgroundColor)
 #CellPadding = [Top, Right, Bottom, Left]
-    print '=================================================================================================Data2' + TableDataName
+    outputDebug(debug, '=================================================================================================Data2', TableDataName)
      
 
-    # QUERY TO GET PROJECT GROUP TO DISPLAY STAGE 29
-    PoolLakeLocation = retrieveGroup(debug,conn,'RDL_POOL_LAKE_ELEV_DISPLAY') 
-    outputDebug(debug, lineNo(), 'PoolLakeLocation = ', str(PoolLakeLocation))
+    # Default cell properties of the table. They are read from the TableLayoutDict once instead of for every cell
+    DefaultTextFont = TableLayoutDict[TableName]['TextFont']
+    DefaultCellProperties = tuple([TableLayoutDict[TableName][Name] for Name in CellStyleProperties])
 
+    # Row records of the data block. The values that are computed for each row are kept in TableRows instead of the DataBlockDict
+    Rows = DataBlockRows(TableDataName, rowRecordClass('%sRow' % TableName, DataOrder + ['Stage2x']),
+        DataBlockDict['DataBlocks'][TableDataName]['ProjectList'])
+    TableRows[TableDataName] = Rows
 
     # Data
-    for project in DataBlockDict['DataBlocks'][TableDataName]['ProjectList'] :
+    for Row in Rows :
+        project = Row.Project
         # Retrieve Public Name and store it to the DataBlockDict
-        outputDebug(debug, lineNo(), 'Location ID ============================================================ project = ', project)
-        PublicName = retrievePublicName(debug, conn, project)
+        outputDebug(debug, 'Location ID ============================================================ project = ', project)
+        PublicName = LocationMeta[project]['PublicName']
         ###PublicName = PublicName.replace(' & Reservoir', '')
-        outputDebug(debug, lineNo(), 'Creating %s row' % PublicName)
+        Lake = LakeSnapshot.get(project, EmptyLakeRecord)
+        outputDebug(debug, 'Creating ', PublicName, ' row')
         
         # If adding the last project in the last data block, create a trigger to use a thick bottom border
-        if DataName == 'Data%d' % NumberOfDataBlocks and project == DataBlockDict['DataBlocks'][TableDataName]['ProjectList'][-1] :
+        if DataName == 'Data%d' % NumberOfDataBlocks and project == Rows.ProjectList[-1] :
             LastProject = True
         else : LastProject = False
         #
@@ -1301,29 +1338,18 @@ def table2Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
         TotalColSpan = 0
         #
         for data in DataOrder :
-            print '==========================='
+            outputDebug(debug, '===========================')
 
-            outputDebug(debug, lineNo(), 'Adding %s to the row' % data)
-            # Create a variable within the DataDict. This will allow the user to store all data to a dictionary and access the variables throughout
-            # The script
-            DataBlockDict['DataBlocks'][TableDataName].setdefault(project, {}).setdefault(data, None)
+            outputDebug(debug, 'Adding ', data, ' to the row')
             #
             # Get column number
             ColumnKey = 'Column%d' % DataOrder.index(data)
             #
             # Default cell properties. If there is a special case, the properties will be changed.
-            TextFont = TableLayoutDict[TableName]['TextFont']
-            if project in ['SYS'] :
-                RowSpan = 3
-            else :
-                RowSpan = TableLayoutDict[TableName]['RowSpan']
-            ColSpan = TableLayoutDict[TableName]['ColSpan']   
-            HorizontalAlignment = TableLayoutDict[TableName]['HorizontalAlignment']; VerticalAlignment = TableLayoutDict[TableName]['VerticalAlignment']
-            CellPadding = TableLayoutDict[TableName]['CellPadding'] #[Top, Right, Bottom, Left]
-            BorderColors = TableLayoutDict[TableName]['BorderColors']
-            BorderWidths = TableLayoutDict[TableName]['BorderWidths']
-            VariableBorders = TableLayoutDict[TableName]['VariableBorders']
-            BackgroundColor = TableLayoutDict[TableName]['BackgroundColor']
+            TextFont = DefaultTextFont
+            RowSpan, ColSpan, HorizontalAlignment, VerticalAlignment, CellPadding, BorderColors, BorderWidths, VariableBorders, \
+                BackgroundColor = DefaultCellProperties
+            if project in ['SYS'] : RowSpan = 3
             
                     
             # 1 - PublicName
@@ -1341,49 +1367,30 @@ def table2Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
 
             # 2 - Stage
             elif data == 'Stage' :
-                if project in PoolLakeLocation:
-                    TscPathname = StageInst30min29 % project
-                    outputDebug(debug, lineNo(), 'TscPathname_project = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime) 
-                    if TscPathname == "Mel Price Pool-Mississippi.Stage.Inst.30Minutes.0.29":  
-                       TscPathname = StageInst15min29 % project 
-                       outputDebug(debug, lineNo(), 'TscPathname_mel_price = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime) 
-                elif project in GroupSetLPMS:
-                     TscPathname = StageInst2HoursLpmsRaw % project
-                     outputDebug(debug, lineNo(), 'TscPathname_lpms = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime)
-                else: 
-                    TscPathname = DataBlockDict['DataBlocks'][TableDataName][data] % project
-                    outputDebug(debug, lineNo(), 'TscPathname_in_data_block = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime)
-                    if TscPathname not in DbPathnameList:
-                        TscPathname = StageInst15minRevLrgs % project
-                        outputDebug(debug, lineNo(), 'TscPathname_not_in_data_block = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime)
-
+                TscPathname = stagePathname(debug, TableDataName, project, DbPathnameList)
                 try :
-                    Tsc = CwmsDb.get(TscPathname, startTime, endTime)
-                    PrevStage = Tsc.values[-1] # Previous day's midnight value
-                    Prev2xStage = Tsc.values[0] # 2 days previous midnight value
-                    outputDebug(debug, lineNo(), 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
-                    outputDebug(debug, lineNo(), 'TscPathname = ', str(TscPathname))
+                    PrevStage = StageData[TscPathname]['Last'] # Previous day's midnight value
+                    Prev2xStage = StageData[TscPathname]['First'] # 2 days previous midnight value
+                    outputDebug(debug, 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
+                    outputDebug(debug, 'TscPathname = ', TscPathname)
 
                     #TextFont = FontBold
 
-                    getGageZero29 = retrieveGageZero29( debug,          # Set to True to print all debug statements
-                                                        conn,           # 
-                                                        project,        # Full name of time series container
-                                                        )  
-                    outputDebug(debug, lineNo(), 'project = ', project, '\tgetGageZero29 = ', str(getGageZero29))                 
+                    getGageZero29 = LocationMeta[project]['GageZero29']
+                    outputDebug(debug, 'project = ', project, '\tgetGageZero29 = ', getGageZero29)                 
                     
                     if PrevStage == Constants.UNDEFINED : raise ValueError('Missing Stage data for %s' % project)
                     elif Prev2xStage == Constants.UNDEFINED : Prev2xStage = Missing 		
                     
-                    outputDebug(debug, lineNo(), 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
-                    outputDebug(debug, lineNo(), 'Location ID ============================================================ project = ', project)
-                    outputDebug(debug, lineNo(), 'PoolLakeLocation = ', str(PoolLakeLocation))
+                    outputDebug(debug, 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
+                    outputDebug(debug, 'Location ID ============================================================ project = ', project)
+                    outputDebug(debug, 'PoolLakeLocation = ', PoolLakeLocation)
 
                     #TscPathname = DataBlockDict['DataBlocks'][TableDataName][FloodStage] % project
                     #MVSFloodStage = retrieveLocationLevel(debug, conn, CwmsDb, TscPathname)                    
-                    outputDebug(debug, lineNo(), 'MVSFloodStage = ')
+                    outputDebug(debug, 'MVSFloodStage = ')
 
-                    outputDebug(debug, lineNo(), 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
+                    outputDebug(debug, 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
 
                     CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % PrevStage, TextFont))
                 except :
@@ -1391,20 +1398,20 @@ def table2Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
                     # Create a formatted string that will be added to the table
                     CellData = Phrase(Chunk(Missing, TextFont))
     
-                # Store value to DataDict
-                outputDebug(debug, lineNo(), 'Set %s %s = ' % (project, data), PrevStage)
-                DataBlockDict['DataBlocks'][TableDataName][project][data] = PrevStage
-                DataBlockDict['DataBlocks'][TableDataName][project][data + '2x'] = Prev2xStage
+                # Store the values in the row record
+                outputDebug(debug, 'Set ', project, ' ', data, ' = ', PrevStage)
+                Row.Stage = PrevStage
+                Row.Stage2x = Prev2xStage
 
 
             # 3 StageChange
             elif data == 'StageChange' :
                 try :
-                    if DataBlockDict['DataBlocks'][TableDataName][project]['Stage'] == Missing or \
-                        DataBlockDict['DataBlocks'][TableDataName][project]['Stage2x'] == Missing :
+                    if Row.Stage == Missing or Row.Stage2x == Missing :
                         raise ValueError('Cannot compute daily Stage change data for %s' % project)
             
-                    DlyStageChange = DataBlockDict['DataBlocks'][TableDataName][project]['Stage'] - DataBlockDict['DataBlocks'][TableDataName][project]['Stage2x']
+                    DlyStageChange = Row.Stage - Row.Stage2x
+                    Row.StageChange = DlyStageChange
 
                     if DlyStageChange < 0 :
                         #TextFont = Font10 # Change Font Color to RED
@@ -1416,21 +1423,22 @@ def table2Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
                     CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % DlyStageChange, TextFont))
                 except :
                     DlyStageChange = Missing
+                    Row.StageChange = DlyStageChange
                     # Create a formatted string that will be added to the table
                     CellData = Phrase(Chunk(Missing, TextFont))
 
 
             # 4 Consr - Current Storage Utilized 
             elif data == 'Consr' :
-                getStorage = retrieveStorageLake(debug,conn,project)
-                getTOC, getBOC, getTOF, getBOF = retrieveTopBottomLake(debug,conn,project)
+                getStorage = Lake.Storage
+                getTOC, getBOC, getTOF, getBOF = Lake.TOC, Lake.BOC, Lake.TOF, Lake.BOF
 
                 Storage = float(getStorage)
                 TOC = float(getTOC)
                 BOC = float(getBOC)
-                outputDebug(debug, lineNo(), 'getStorage = ', str(getStorage))
-                outputDebug(debug, lineNo(), 'getTOC = ', str(getTOC))
-                outputDebug(debug, lineNo(), 'getBOC = ', str(getBOC))
+                outputDebug(debug, 'getStorage = ', getStorage)
+                outputDebug(debug, 'getTOC = ', getTOC)
+                outputDebug(debug, 'getBOC = ', getBOC)
 
                 if Storage>0.0 and TOC>0.0 and BOC>=0.0:
                     if Storage < BOC:
@@ -1439,7 +1447,7 @@ def table2Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
                         Consr = 100.00
                     elif Storage <= TOC:
                         Consr = (((Storage - BOC)/(TOC - BOC))*100)
-                    outputDebug(debug, lineNo(), 'Consr = ', str(Consr))
+                    outputDebug(debug, 'Consr = ', Consr)
                     CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % Consr, TextFont))
                 else :
                     CellData = Phrase(Chunk(Missing, TextFont))
@@ -1447,16 +1455,16 @@ def table2Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
 
             # 5 Flood - Current Storage Utilized 
             elif data == 'Flood' :
-                getStorage = retrieveStorageLake(debug,conn,project)
-                getTOC, getBOC, getTOF, getBOF = retrieveTopBottomLake(debug,conn,project)
+                getStorage = Lake.Storage
+                getTOC, getBOC, getTOF, getBOF = Lake.TOC, Lake.BOC, Lake.TOF, Lake.BOF
 
                 Storage = float(getStorage)
                 TOF = float(getTOF)
                 BOF = float(getBOF)
 
-                outputDebug(debug, lineNo(), 'getStorage = ', str(getStorage))
-                outputDebug(debug, lineNo(), 'getTOC = ', str(getTOF))
-                outputDebug(debug, lineNo(), 'getBOC = ', str(getBOF))
+                outputDebug(debug, 'getStorage = ', getStorage)
+                outputDebug(debug, 'getTOC = ', getTOF)
+                outputDebug(debug, 'getBOC = ', getBOF)
 
                 if Storage>0.0 and TOF>0.0 and BOF>0.0:
 
@@ -1474,9 +1482,9 @@ def table2Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
 
             # 6 - Precip Lake
             elif data == 'PrecipLake' :
-                getPrecipLake = retrievePrecipLake(debug,conn,project)
+                getPrecipLake = Lake.Precip
                 if getPrecipLake != None:
-                    print 'getPrecipLake = ' + getPrecipLake
+                    outputDebug(debug, 'getPrecipLake = ', getPrecipLake)
                     PrecipLake = float(getPrecipLake)
                     #PrecipLake = getPrecipLake
                     CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % PrecipLake, TextFont))
@@ -1486,9 +1494,9 @@ def table2Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
 
             # 7 Yesterday Inflow 
             elif data == 'YesterdayInflow' :
-                getYesterdayInflow = retrieveYesterdayInflow(debug,conn,project)
+                getYesterdayInflow = Lake.YesterdayInflow
                 if getYesterdayInflow != None:
-                    print 'getPrecipLake = ' + getYesterdayInflow
+                    outputDebug(debug, 'getPrecipLake = ', getYesterdayInflow)
                     YesterdayInflow = float(getYesterdayInflow)
                     CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % YesterdayInflow, TextFont))
                 else :
@@ -1497,9 +1505,9 @@ def table2Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
 
             # 8 - Midnight
             elif data == 'MidnightOutflow' :
-                getMidnightOutflow = retrieveMidnight(debug,conn,project)
+                getMidnightOutflow = Lake.MidnightOutflow
                 if getMidnightOutflow != None:
-                    print 'getMidnightOutflow = ' + getMidnightOutflow
+                    outputDebug(debug, 'getMidnightOutflow = ', getMidnightOutflow)
                     MidnightOutflow = float(getMidnightOutflow)
                     CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % MidnightOutflow, TextFont))
                 else :
@@ -1508,9 +1516,9 @@ def table2Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
 
             # 9 - Evening Outflow
             elif data == 'EveningOutflow' :
-                getEveningOutflow = retrieveEveningOutflow(debug,conn,project)
+                getEveningOutflow = Lake.EveningOutflow
                 if getEveningOutflow != None:
-                    print 'getEveningOutflow = ' + getEveningOutflow
+                    outputDebug(debug, 'getEveningOutflow = ', getEveningOutflow)
                     EveningOutflow = float(getEveningOutflow)
                     CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % EveningOutflow, TextFont))
                 else :
@@ -1519,9 +1527,9 @@ def table2Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
 
             # 10 - Rule Curve
             elif data == 'RuleCurve' :
-                getRuleCurve = retrieveRuleCurve(debug,conn,project)
+                getRuleCurve = Lake.RuleCurve
                 if getRuleCurve != None:
-                    print 'getRuleCurve = ' + getRuleCurve
+                    outputDebug(debug, 'getRuleCurve = ', getRuleCurve)
                     RuleCurve = float(getRuleCurve)
                     CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % RuleCurve, TextFont))
                 else :
@@ -1530,10 +1538,10 @@ def table2Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
 
             # 11 - Crest
             elif data == 'CrestLake' :
-                getCrestLake, getCrestOption = retrieveCrestLake(debug,conn,project)
+                getCrestLake, getCrestOption = Lake.Crest, Lake.CrestOption
                 if getCrestOption != None:
-                    print 'getCrestLake = ' + str(getCrestLake)
-                    print 'getCrestOption = ' + str(getCrestOption)
+                    outputDebug(debug, 'getCrestLake = ', getCrestLake)
+                    outputDebug(debug, 'getCrestOption = ', getCrestOption)
                     if getCrestOption == "CG":
                         CrestOption = "Cresting"
                     else:
@@ -1545,9 +1553,9 @@ def table2Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
 
             # 12 - CrestDate
             elif data == 'CrestDateLake' :
-                getCrestDateLake = retrieveCrestLakeDate(debug,conn,project)  
+                getCrestDateLake = Lake.CrestDate
                 if getCrestDateLake is not None:
-                    print 'getCrestDateLake = ' + getCrestDateLake
+                    outputDebug(debug, 'getCrestDateLake = ', getCrestDateLake)
                 #if type(getCrestDateLake) == type('') : 
                     CrestDateLake = str(getCrestDateLake)
                     CellData = Phrase(Chunk(CrestDateLake, TextFont))
@@ -1561,24 +1569,23 @@ def table2Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
                     MVSRecordStage = Null
                     #CellData = Phrase(Chunk(Missing, TextFont))
                     CellData = Phrase(Chunk(Null, TextFont))
-                    TscPathname = DataBlockDict['DataBlocks'][TableDataName][data] % project
-                    MVSRecordStage = retrieveRecordStage(debug, conn, CwmsDb, TscPathname)
-                    outputDebug(debug, lineNo(), 'RecordStage Pathname = ', TscPathname, '\tMVSRecordStage = ', MVSRecordStage)
-                    if MVSRecordStage != Null and MVSRecordStage != 'None' :
+                    MVSRecordStage = LocationMeta[project]['RecordStage']
+                    outputDebug(debug, 'MVSRecordStage = ', MVSRecordStage)
+                    if MVSRecordStage != None and MVSRecordStage != Null and MVSRecordStage != 'None' :
                         # Create a formatted string that will be added to the table
                         CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % MVSRecordStage, TextFont))
                     else:
                         #CellData = Phrase(Chunk(Missing, TextFont))
                         CellData = Phrase(Chunk(Null, TextFont))
                 except Exception, e :
-                    outputDebug(debug, lineNo(), 'RecordStage Exception = ', str(e))
+                    outputDebug(debug, 'RecordStage Exception = ', e)
 
 
             # 14 - RecordStageDate
             elif data == 'RecordStageDate' :
-                getRecordStageDate = retrieveRecordStageDate(debug,conn,project)
+                getRecordStageDate = LocationMeta[project]['RecordStageDate']
                 if getRecordStageDate != None:
-                    print 'getRecordStageDate = ' + getRecordStageDate
+                    outputDebug(debug, 'getRecordStageDate = ', getRecordStageDate)
                 if type(getRecordStageDate) == type('') : 
                     RecordStageDate = str(getRecordStageDate)
                     #CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % RecordStageDate, TextFont))
@@ -1596,23 +1603,24 @@ def table2Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
             Table.addCell(Cell)
 
             # Add data to CsvData. Break data loop if column span reaches the total number columns before each data piece has been added to that table
-            outputDebug(debug, lineNo(), 'ColSpan = ', ColSpan)
+            outputDebug(debug, 'ColSpan = ', ColSpan)
             TotalColSpan += ColSpan
             UnformattedData = str(CellData[0]).replace(',', '')
-            outputDebug(debug, lineNo(), 'TotalColSpan = ', TotalColSpan)
-            print '==========================='    
+            outputDebug(debug, 'TotalColSpan = ', TotalColSpan)
+            outputDebug(debug, '===========================')
         #
         # Add Continued Heading for second page
         #
-    print '=================================================================================================Data2_END'
+    outputDebug(debug, '=================================================================================================Data2_END')
     return Table
 #
-# bulletinFooter Function   : Creates the footer for Table1 in the bulletin
+# bulletinFooter Function   : Creates the footer for Table1 in the bulletin. The footers are built before the pdf is written, so the
+#                               page number is passed in instead of read from the PdfWriter.
 # Author/Editor             : Ryan Larsen/Scott Hoffman
 # Modified                  : Ivan Nguyen
-# Last updated              : 12-12-2017
+# Last updated              : 10-18-2026
 #
-def bulletinFooter(debug, Footer) :
+def bulletinFooter(debug, Footer, PageNumber) :
     Cell = createCell(debug, Phrase(Chunk('', Font1)), TableLayoutDict['Table1']['RowSpan'], Table1Columns, TableLayoutDict['Table1']['HorizontalAlignment'], 
         TableLayoutDict['Table1']['VerticalAlignment'], TableLayoutDict['Table1']['CellPadding'], TableLayoutDict['Table1']['BorderColors'], 
         TableLayoutDict['Table1']['BorderWidths'], TableLayoutDict['Table1']['VariableBorders'], TableLayoutDict['Table1']['BackgroundColor'])
@@ -1621,7 +1629,7 @@ def bulletinFooter(debug, Footer) :
     Footer.addCell(Cell)
     #
     # Add the footer image to the footer
-    Img = Image.getInstance(FooterImage)
+    Img = getImage(debug, FooterImage)
     Img.scalePercent(20)
     # createCell(debug, CellData, RowSpan, ColSpan, HorizontalAlignment, VerticalAlignment, CellPadding, BorderColors, BorderWidths, VariableBorders, BackgroundColor)
     Cell = createCell(debug, Img, TableLayoutDict['Table1']['RowSpan'], TableLayoutDict['Table1']['ColSpan'], Element.ALIGN_LEFT, 
@@ -1632,7 +1640,7 @@ def bulletinFooter(debug, Footer) :
 
     # Add the page numbers to the footer
     # createCell(debug, CellData, RowSpan, ColSpan, HorizontalAlignment, VerticalAlignment, CellPadding, BorderColors, BorderWidths, VariableBorders, BackgroundColor)
-    Cell = createCell(debug, Phrase(Chunk('Page %d of 2' % Writer.getPageNumber(), TableLayoutDict['Table1']['TextFont'])), TableLayoutDict['Table1']['RowSpan'], 
+    Cell = createCell(debug, Phrase(Chunk('Page %d of 2' % PageNumber, TableLayoutDict['Table1']['TextFont'])), TableLayoutDict['Table1']['RowSpan'], 
         TableLayoutDict['Table1']['ColSpan'], TableLayoutDict['Table1']['HorizontalAlignment'], TableLayoutDict['Table1']['VerticalAlignment'], 
         TableLayoutDict['Table1']['CellPadding'], TableLayoutDict['Table1']['BorderColors'], TableLayoutDict['Table1']['BorderWidths'], 
         TableLayoutDict['Table1']['VariableBorders'], TableLayoutDict['Table1']['BackgroundColor'])
@@ -1652,7 +1660,7 @@ def table1Footnote(debug, TableFootnote,) :
     
     # ColSpan in createCell MUST BE EQUAL to Table1Columns in Properties.txt file
 
-    print "table1Footnote begin" 
+    outputDebug(debug, "table1Footnote begin")
     Cell = createCell(debug, Phrase(Chunk('', Font1)), TableLayoutDict['Table1']['RowSpan'], Table1Columns, TableLayoutDict['Table1']['HorizontalAlignment'], 
         TableLayoutDict['Table1']['VerticalAlignment'], TableLayoutDict['Table1']['CellPadding'], TableLayoutDict['Table1']['BorderColors'], 
         TableLayoutDict['Table1']['BorderWidths'], TableLayoutDict['Table1']['VariableBorders'], TableLayoutDict['Table1']['BackgroundColor'])
@@ -1695,7 +1703,7 @@ def table1Footnote(debug, TableFootnote,) :
     Cell.setFixedHeight(4)
     TableFootnote.addCell(Cell)
 
-    print "table1Footnote end" 
+    outputDebug(debug, "table1Footnote end")
     return TableFootnote
 #
 # table2Footnote Function   : Creates the footer for Table1 in the bulletin
@@ -1746,12 +1754,35 @@ def table2Footnote(debug, TableFootnote,) :
 
     return TableFootnote
 #
+# tableDataBlocks Function  : Generator that adds the data blocks of a table one at a time and yields the name of each data block. Used
+#                               with streamTable, so the rows of a data block are written to the pdf before the next data block is made.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+#
+def tableDataBlocks(    debug,          # Set to True to print all debug statements
+                        TableData,      # Data function of the table, table1Data or table2Data
+                        Table,          # PdfPTable the rows are added to
+                        TableName,      # Name of the table in DataBlockDict
+                        DataBlocks,     # List of data block names
+                        startTime,      # Start of time window
+                        endTime,        # End of time window
+                        startSysTime,   # Start of the storage time window
+                        endSysTime,     # End of the storage time window
+                        DbPathnameList, # PathnameCatalog of the pathnames in the database
+                        StageData,      # Stage values from retrieveStageData
+                        ) :
+    for DataBlock in DataBlocks :
+        outputDebug(debug, 'startTime = ', startTime)
+        outputDebug(debug, 'endTime = ', endTime)
+        with span(TableData.__name__, DataBlock = '%s%s' % (TableName, DataBlock)) :
+            TableData(debug, Table, TableName, DataBlock, startTime, endTime, startSysTime, endSysTime, DbPathnameList, StageData)
+        yield '%s%s' % (TableName, DataBlock)
+#
 try :   
     # -------------------------------------------------------------------
     # Date and Time Window Info
     # -------------------------------------------------------------------
-    print ''
-    print '================================================================================================= Main Script 1'
+    outputDebug(debug, '================================================================================================= Main Script 1')
     CurDateTime = datetime.datetime.now() # Time in UTC with format = 2022-08-23 22:21:03.607000
     CurDateTimeStr  = CurDateTime.strftime('%m-%d-%Y %H:%M') # Last updated time for bulletin formatted as mm-dd-yyyy hhmm (08-23-2022 22:21)
     ArchiveDateTimeStr  = CurDateTime.strftime('%d%m%Y') # Last updated time for bulletin formatted as ddmmyyyy (23082022)
@@ -1767,10 +1798,10 @@ try :
     # For the Last Updated in the Title Block
     if is_dst(str(Date)):
         CurDateTimeStrCST = (CurDateTime + datetime.timedelta(hours=-6)).strftime('%m-%d-%Y %H:%M')
-        outputDebug(debug, lineNo(), 'CurDateTimeStrCST = ', str(CurDateTimeStrCST))
+        outputDebug(debug, 'CurDateTimeStrCST = ', CurDateTimeStrCST)
     else:
         CurDateTimeStrCST = (CurDateTime + datetime.timedelta(hours=-5)).strftime('%m-%d-%Y %H:%M')
-        outputDebug(debug, lineNo(), 'CurDateTimeStrCST = ', str(CurDateTimeStrCST))
+        outputDebug(debug, 'CurDateTimeStrCST = ', CurDateTimeStrCST)
 
 
     #Database Time
@@ -1785,45 +1816,59 @@ try :
        StartTw             = StartTw - datetime.timedelta(hours=5) # Minus 5 Hours from StartTw = 2022-08-21 17:39:04.362000
        EndTribTwStr        = EndTribTwStr - datetime.timedelta(hours=5) #2022-08-23 17:39:04.362000
        EndMainStem         = EndTribTwStr.strftime('%d%b%Y 0600')
-       outputDebug(debug, lineNo(), 'EndMainStem = ', str(EndMainStem))
+       outputDebug(debug, 'EndMainStem = ', EndMainStem)
        StartMainStem       = StartTw.strftime('%d%b%Y 0600')
-       outputDebug(debug, lineNo(), 'StartMainStem = ', str(StartMainStem))
+       outputDebug(debug, 'StartMainStem = ', StartMainStem)
     else:
        #DST has ended (in November)
        StartTw             = StartTw - datetime.timedelta(hours=6) # Minus 5 Hours from StartTw = 2022-08-21 17:39:04.362000
        EndTribTwStr        = EndTribTwStr - datetime.timedelta(hours=6) #2022-08-23 17:39:04.362000
        EndMainStem         = EndTribTwStr.strftime('%d%b%Y 0600')
-       outputDebug(debug, lineNo(), 'EndMainStem = ', str(EndMainStem))
+       outputDebug(debug, 'EndMainStem = ', EndMainStem)
        StartMainStem       = StartTw.strftime('%d%b%Y 0600')
-       outputDebug(debug, lineNo(), 'StartMainStem = ', str(StartMainStem))
+       outputDebug(debug, 'StartMainStem = ', StartMainStem)
 
     StartTwStr          = StartTw.strftime('%d%b%Y 0600') # Hard Coded Time to 0600 Format = 21Aug2022 0600
-    outputDebug(debug, lineNo(), 'StartTwStr = ', str(StartTwStr))
+    outputDebug(debug, 'StartTwStr = ', StartTwStr)
     EndTwStr            = EndTribTwStr.strftime('%d%b%Y 0600') #23Aug2022 0600
-    outputDebug(debug, lineNo(), 'EndTwStr = ', str(EndTwStr))
+    outputDebug(debug, 'EndTwStr = ', EndTwStr)
 
     ProjectDate = CurDateTime- datetime.timedelta(hours=5) 
 
     StartMainStemStor   = ProjectDate.strftime('%d%b%Y 0600')
-    outputDebug(debug, lineNo(), 'StartMainStemStor = ', str(StartMainStemStor))
+    outputDebug(debug, 'StartMainStemStor = ', StartMainStemStor)
 
     ProjectDateTimeStr  = ProjectDate.strftime('%m-%d-%Y 06:00') 
-    outputDebug(debug, lineNo(), 'ProjectDateTimeStr = ', str(ProjectDateTimeStr))
+    outputDebug(debug, 'ProjectDateTimeStr = ', ProjectDateTimeStr)
 
-    outputDebug(debug, lineNo(), 'Start of Time Window = ', StartTwStr, '\tEnd of Time Window = ', EndTwStr, '\tProject Date and Time = ', ProjectDateTimeStr)
+    outputDebug(debug, 'Start of Time Window = ', StartTwStr, '\tEnd of Time Window = ', EndTwStr, '\tProject Date and Time = ', ProjectDateTimeStr)
     
     # -------------------------------------------------------------------
-    # Open database connection
+    # Database connections
     # -------------------------------------------------------------------
-    CwmsDb = DBAPI.open()
-    CwmsDb.setTimeZone('US/Central')
-    CwmsDb.setTimeWindow(StartTwStr, EndTwStr)
-    CwmsDb.setOfficeId('MVS')
-    CwmsDb.setTrimMissing(False)
-    conn = CwmsDb.getConnection()   # Create a java.sql.Connection
-    # Get list of pathnames in database
-    DbPathnameList = CwmsDb.getPathnameList()
-    #outputDebug(debug, lineNo(), 'DbPathnameList = ', str(DbPathnameList)) # Large outputDebug
+    # The retrieve functions borrow a connection from the shared MVS connection pool for each query. The pool is shared with the other
+    #   bulletins in a BulletinServer.py process and is closed when the process exits.
+    conn = getConnectionPool(debug, 'MVS')
+    # Get the indexed catalog of pathnames in database
+    with borrowConnection(conn) as PoolConn : DbPathnameList = loadPathnameCatalog(debug, conn.getCwmsDb(PoolConn))
+
+    # Retrieve all NWS forecasts, the lake values and the location groups used to pick the Stage pathname of each project up front. The
+    #   queries are independent, so they run at the same time on pooled connections. The table functions only do dictionary lookups.
+    Prefetch = fetchConcurrently(debug, {   'NWSForecast'       :   (retrieveNWSForecast, debug, conn),
+                                            'LakeSnapshot'      :   (retrieveLakeSnapshot, debug, conn),
+                                            'PoolLakeLocation'  :   (retrieveGroup, debug, conn, 'RDL_POOL_LAKE_ELEV_DISPLAY'),
+                                            'GroupSetLPMS'      :   (retrieveGroupLPMS, debug, conn),
+                                            }, QueryConcurrency)
+    NWSForecast = Prefetch['NWSForecast'].result()
+    LakeSnapshot = Prefetch['LakeSnapshot'].result()
+    PoolLakeLocation = Prefetch['PoolLakeLocation'].result()
+    outputDebug(debug, 'PoolLakeLocation = ', PoolLakeLocation)
+    GroupSetLPMS = Prefetch['GroupSetLPMS'].result()
+    outputDebug(debug, 'GroupSetLPMS = ', GroupSetLPMS)
+    # The reference values (public name, river mile, datums and levels) are read from the reference cache next to DatabasePathnames.txt
+    #   and are only retrieved from the database when they expire. Levels that are not constant are retrieved for the bulletin date
+    LocationMeta = retrieveLocationMetaCached(debug, conn, getProjectList(debug, DataBlockDict), ReferenceCachePathname, NWSForecast,
+        LevelTimeStr = Date.strftime('%d%b%Y 0000'))
 
     # -------------------------------------------------------------------
     # Create tables with a finite number of columns that will be written to the pdf file
@@ -1868,147 +1913,104 @@ try :
     BulletinFooter.setWidths([10] * FooterColumns)
     
     # Add data to Title Block that will be at the top of the bulletin
-    
     TitleBlock = titleBlock(debug, TitleBlock)
-    
-    # Add data to the heading for Table1
-    
+
+    # Add data to the heading for Table1. The heading is repeated on each page
     Table1 = table1Heading(debug, Table1)
-    
+    Table1.setHeaderRows(3)
+
+    Table1Footnote = table1Footnote(debug, Table1Footnote)
+
+    # Build the page footers. There are two pages in this report
+    BulletinFooter = bulletinFooter(debug, BulletinFooter, 1)
+    BulletinFooter2 = bulletinFooter(debug, BulletinFooter2, 2)
+
+    # Open the bulletin and its archive copy. The tables are written to both files while their rows are made, so the first page is
+    #   written while the later data blocks are still being made and the finished rows do not stay in memory.
+    filenames = [BulletinFilename, ArchiveBulletinFilename % ArchiveDateTimeStr]
+    BulletinLog.info('Writing %s', ', '.join(filenames))
+    BulletinPdf, WriterList = openBulletinPdf(debug, filenames, [LeftMargin, RightMargin, TopMargin, BottomMargin])
+    writeFooter(BulletinFooter, BulletinPdf, WriterList)
+    with span('BulletinPdf.add', Element = 'TitleBlock') : BulletinPdf.add(TitleBlock)
+
     # Add data to the data blocks for Table1
 
     #NumberOfDataBlocks = len(DataBlockDict['DataBlocks'].keys())
-    print '================================================================================================= Main Script DataBlocks 1'
+    outputDebug(debug, '================================================================================================= Main Script DataBlocks 1')
     NumberOfDataBlocks = 8
-    for x in range(1, NumberOfDataBlocks + 1, 1) :
-        DataBlock = 'Data%d' % x
-        startTime = StartMainStem
-        outputDebug(debug, lineNo(), 'startTime = ', startTime)
-        endTime = EndMainStem
-        outputDebug(debug, lineNo(), 'endTime = ', endTime)
-        Table1 = table1Data(debug, Table1, 'Table1', DataBlock, startTime, endTime, StartMainStemStor, endTime, DbPathnameList)
-    
-    # Create bulletin header that is repeated on each page
-    
-    Table1.setHeaderRows(3)
+    DataBlocks = ['Data%d' % x for x in range(1, NumberOfDataBlocks + 1, 1)]
+    # Retrieve the Stage data for every project in Table1 with one query
+    Table1StageData = retrieveStageData(debug, 'Table1', DataBlocks, StartMainStem, EndMainStem, DbPathnameList)
+    streamTable(debug, BulletinPdf, Table1, tableDataBlocks(debug, table1Data, Table1, 'Table1', DataBlocks, StartMainStem, EndMainStem,
+        StartMainStemStor, EndMainStem, DbPathnameList, Table1StageData))
+
+    writeFooter(BulletinFooter2, BulletinPdf, WriterList) # Need for second page Footer
+    with span('BulletinPdf.add', Element = 'Table1Footnote') : BulletinPdf.add(Table1Footnote)
     
-    Table1Footnote = table1Footnote(debug, Table1Footnote)
-    
-    # Create Pdf file and write tables to create bulletin
+    ######################################################################
+    # Second Table Start and End Time
+    ######################################################################
+
+    #DB Time For Pool Elev, Delta 1 Instead of 2
+    StartTwStr          = StartTw.strftime('%d%b%Y 0000') 
+    outputDebug(debug, 'StartTwStr = ', StartTwStr)
+
+    EndTwStr            = EndTribTwStr.strftime('%d%b%Y 0000')
+    outputDebug(debug, 'EndTwStr = ', EndTwStr)
     
-    print '=================================================================================================Main_Script_END5'
-    filenames = [BulletinFilename, ArchiveBulletinFilename % ArchiveDateTimeStr]
-    for filename in filenames :
-        BulletinPdf = Document()
-        Writer = PdfWriter.getInstance(BulletinPdf, FileOutputStream(filename))
-        BulletinPdf.setPageSize(PageSize.LETTER) # Set the page size
-        PageWidth = BulletinPdf.getPageSize().getWidth()
-        BulletinPdf.setMargins(LeftMargin, RightMargin, TopMargin, BottomMargin) # Left, Right, Top, Bottom
-        BulletinPdf.setMarginMirroring(True) 
-        BulletinPdf.open()
-        # Build a footer with page numbers and add to PDF. Only need to build it one time.
-        if filename == filenames[0] :
-            BulletinFooter = bulletinFooter(debug, BulletinFooter)
-        BulletinFooter.setTotalWidth(PageWidth - 48) # Total width is 612 pixels (8.5 inches) minus the left and right margins (24 pixels each)
-        BulletinFooter.writeSelectedRows(0, -1, 24, 36, Writer.getDirectContent())
-
-        BulletinPdf.add(TitleBlock) # Add TitleBlock to the PDF
-
-        BulletinPdf.add(Table1) # Add Table1 to the PDF
-
-        # Need for second page Footer
-        if filename == filenames[0] :
-            BulletinFooter2 = bulletinFooter(debug, BulletinFooter2)
-        BulletinFooter2.setTotalWidth(PageWidth - 48) # Total width is 612 pixels (8.5 inches) minus the left and right margins (24 pixels each)
-        BulletinFooter2.writeSelectedRows(0, -1, 24, 36, Writer.getDirectContent())
-
-        BulletinPdf.add(Table1Footnote) # Add Table1's footnotes
-
-        ######################################################################
-        # Second Table Start and End Time
-        ######################################################################
-
-        #DB Time For Pool Elev, Delta 1 Instead of 2
-        StartTwStr          = StartTw.strftime('%d%b%Y 0000') 
-        outputDebug(debug, lineNo(), 'StartTwStr = ', str(StartTwStr))
-
-        EndTwStr            = EndTribTwStr.strftime('%d%b%Y 0000')
-        outputDebug(debug, lineNo(), 'EndTwStr = ', str(EndTwStr))
-        
-        StartMainStemStor   = ProjectDate.strftime('%d%b%Y 0000') # ProjectDate setup in Main Script Above
-        outputDebug(debug, lineNo(), 'StartMainStemStor = ', str(StartMainStemStor))
-
-        ProjectDateTimeStr  = ProjectDate.strftime('%m-%d-%Y 00:00') 
-        outputDebug(debug, lineNo(), 'ProjectDateTimeStr = ', str(ProjectDateTimeStr))
-
-        # Table1: Contains all data and data headings
-        Table2 = PdfPTable(Table2Columns)
-
-        # Table1Footnote: Contains the footnotes for Table1
-        Table2Footnote = PdfPTable(Table2Columns)
-        DataOrder, ColumnWidths = [], []
-        for column in range(Table2Columns) :
-            # Column Key
-            ColumnKey = 'Column%d' % column
-
-            DataOrder.append(TableLayoutDict['Table2'][ColumnKey]['Key'])
-            ColumnWidths.append(TableLayoutDict['Table2'][ColumnKey]['ColumnWidth'])
-        Table2.setWidths(ColumnWidths)
-
-        # Table2Footnote Columns
-        Table2Footnote.setWidths([10] * Table2Columns)
-        # Add data to the heading for Table1
-        Table2 = table2Heading(debug, Table2)
-        #
-        DataBlocks = ['Data1']
-        for DataBlock in DataBlocks :
-            startTime = StartTwStr
-            outputDebug(debug, lineNo(), 'startTime = ', startTime)
-            endTime = EndTwStr
-            outputDebug(debug, lineNo(), 'endTime = ', endTime)
-            Table2 = table2Data(debug, Table2, 'Table2', DataBlock, startTime, endTime, StartMainStemStor, endTime, DbPathnameList)
-        #
-        # Create bulletin header that is repeated on each page
-        #
-        #Table2.setHeaderRows(3)
-        #
-        Table2Footnote = table2Footnote(debug, Table2Footnote)
-        #
-        # Create Pdf file and write tables to create bulletin
+    StartMainStemStor   = ProjectDate.strftime('%d%b%Y 0000') # ProjectDate setup in Main Script Above
+    outputDebug(debug, 'StartMainStemStor = ', StartMainStemStor)
 
-        ######################################################################
-        # Second table end
-        ######################################################################
+    ProjectDateTimeStr  = ProjectDate.strftime('%m-%d-%Y 00:00') 
+    outputDebug(debug, 'ProjectDateTimeStr = ', ProjectDateTimeStr)
 
+    # Table2: Contains all data and data headings
+    Table2 = PdfPTable(Table2Columns)
 
-        ######################################################################
-        # Second table end
-        ######################################################################
-        BulletinPdf.add(Table2) # Add Table2 to the PDF
-        BulletinPdf.add(Table2Footnote) # Add Table1's footnotes
-        ######################################################################
-        # Second table end
-        ######################################################################
+    # Table2Footnote: Contains the footnotes for Table2
+    Table2Footnote = PdfPTable(Table2Columns)
+    DataOrder, ColumnWidths = [], []
+    for column in range(Table2Columns) :
+        # Column Key
+        ColumnKey = 'Column%d' % column
 
+        DataOrder.append(TableLayoutDict['Table2'][ColumnKey]['Key'])
+        ColumnWidths.append(TableLayoutDict['Table2'][ColumnKey]['ColumnWidth'])
+    Table2.setWidths(ColumnWidths)
 
-        BulletinPdf.close()
-        Writer.close()
-        print '=================================================================================================Main_Script_END6'
+    # Table2Footnote Columns
+    Table2Footnote.setWidths([10] * Table2Columns)
+    # Add data to the heading for Table2
+    Table2 = table2Heading(debug, Table2)
+    
+    # Retrieve the Stage data for every project in Table2 with one query
+    DataBlocks = ['Data1']
+    Table2StageData = retrieveStageData(debug, 'Table2', DataBlocks, StartTwStr, EndTwStr, DbPathnameList)
+    streamTable(debug, BulletinPdf, Table2, tableDataBlocks(debug, table2Data, Table2, 'Table2', DataBlocks, StartTwStr, EndTwStr,
+        StartMainStemStor, EndTwStr, DbPathnameList, Table2StageData))
+
+    Table2Footnote = table2Footnote(debug, Table2Footnote)
+    with span('BulletinPdf.add', Element = 'Table2Footnote') : BulletinPdf.add(Table2Footnote)
+
+    # Closing the document closes both pdf files
+    with span('BulletinPdf.close') : BulletinPdf.close()
+    outputDebug(debug, '=================================================================================================Main_Script_END6')
 #
 # try Function   : Creates the footer for Table1 in the bulletin
 # Author/Editor             : Ryan Larsen/Scott Hoffman
 # Modified                  : Ivan Nguyen
 # Last updated              : 12-12-2017
 #
+except :
+    BulletinLog.exception('Could not create %s', BulletinFilename)
+    raise
 finally :
-    try : CwmsDb.done()
+    try : logCallSummary(CallSummaryPathname)
     except : pass
-    try : conn.close()
+    try : writeTrace(TracePathname)
     except : pass
     try : BulletinPdf.close()
     except : pass
-    try : Writer.close()
-    except : pass
     try : BulletinTsFile.close()
     except : pass
     try : BulletinProperties.close()
@@ -205,13 +205,13 @@ def table1Heading(debug, Table,) :
 	
    # QUERY TO GET NWS Date Day
     NWSDay1Date = retrieveNWSDay1Date(debug, conn) 
-    outputDebug(debug, lineNo(), 'NWSDay1Date = ', str(NWSDay1Date))
+    outputDebug(debug, 'NWSDay1Date = ', str(NWSDay1Date))
 
     NWSDay2Date = retrieveNWSDay2Date(debug, conn) 
-    outputDebug(debug, lineNo(), 'NWSDay2Date = ', str(NWSDay2Date))
+    outputDebug(debug, 'NWSDay2Date = ', str(NWSDay2Date))
 
     NWSDay3Date = retrieveNWSDay3Date(debug, conn) 
-    outputDebug(debug, lineNo(), 'NWSDay3Date = ', str(NWSDay3Date))
+    outputDebug(debug, 'NWSDay3Date = ', str(NWSDay3Date))
 
 
     #1
@@ -671,20 +671,20 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
 
     # QUERY TO GET PROJECT GROUP TO DISPLAY STAGE 29
     GroupSet = retrieveGroup(debug,conn,'RDL_POOL_LAKE_ELEV_DISPLAY') 
-    outputDebug(debug, lineNo(), 'GroupSet = ', str(GroupSet))
+    outputDebug(debug, 'GroupSet = ', str(GroupSet))
 
     # QUERY TO GET GAGES WITH LPMS DATA
     GroupSetLPMS = retrieveGroupLPMS(debug,conn) 
     #print 'GroupSetLPMS = ' + str(GroupSetLPMS)
-    outputDebug(debug, lineNo(), 'GroupSetLPMS = ', str(GroupSetLPMS))
+    outputDebug(debug, 'GroupSetLPMS = ', str(GroupSetLPMS))
            
     # Data
     for project in DataBlockDict['DataBlocks'][TableDataName]['ProjectList'] :
         # Retrieve Public Name and store it to the DataBlockDict
-        outputDebug(debug, lineNo(), 'Location ID ============================================================ project = ', project)
+        outputDebug(debug, 'Location ID ============================================================ project = ', project)
         PublicName = retrievePublicName(debug, conn, project)
         ###PublicName = PublicName.replace(' & Reservoir', '')
-        outputDebug(debug, lineNo(), 'Creating %s row' % PublicName)
+        outputDebug(debug, 'Creating %s row' % PublicName)
         
         # If adding the last project in the last data block, create a trigger to use a thick bottom border
         if DataName == 'Data%d' % NumberOfDataBlocks and project == DataBlockDict['DataBlocks'][TableDataName]['ProjectList'][-1] :
@@ -697,7 +697,7 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
         for data in DataOrder :
             print '==========================='
 
-            outputDebug(debug, lineNo(), 'Adding %s to the row' % data)
+            outputDebug(debug, 'Adding %s to the row' % data)
             # Create a variable within the DataDict. This will allow the user to store all data to a dictionary and access the variables throughout
             #   the script
             DataBlockDict['DataBlocks'][TableDataName].setdefault(project, {}).setdefault(data, None)
@@ -724,7 +724,7 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
 			# 1 - RiverMile
             if data == 'RiverMile' :
                 getRiverMile = retrieveRiverMile(debug,conn,project)
-                #outputDebug(True, lineNo(), 'getRiverMile = ' , type(getRiverMile))
+                #outputDebug(True, 'getRiverMile = ' , type(getRiverMile))
                 #stop
                 if type(getRiverMile) == type('') : 
                     RivMile = float(getRiverMile)
@@ -783,14 +783,14 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
                     CellData = Phrase(Chunk(Null, TextFont))
                     TscPathname = DataBlockDict['DataBlocks'][TableDataName][data] % project
                     MVSFloodStage = retrieveLocationLevel(debug, conn, CwmsDb, TscPathname)
-                    outputDebug(debug, lineNo(), 'Flood Stage Pathname = ', TscPathname, '\tMVSFloodStage = ', MVSFloodStage)
+                    outputDebug(debug, 'Flood Stage Pathname = ', TscPathname, '\tMVSFloodStage = ', MVSFloodStage)
                     if MVSFloodStage != Null and MVSFloodStage != 'None' :
                         # Create a formatted string that will be added to the table
                         CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % MVSFloodStage, TextFont))
                     else:
                         CellData = Phrase(Chunk(Null, TextFont))
                 except Exception, e :
-                    outputDebug(debug, lineNo(), 'FloodStage Exception = ', str(e))
+                    outputDebug(debug, 'FloodStage Exception = ', str(e))
 
 
             # 4 - RecordStage
@@ -801,7 +801,7 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
                     CellData = Phrase(Chunk(Null, TextFont))
                     TscPathname = DataBlockDict['DataBlocks'][TableDataName][data] % project
                     MVSRecordStage = retrieveRecordStage(debug, conn, CwmsDb, TscPathname)
-                    outputDebug(debug, lineNo(), 'RecordStage Pathname = ', TscPathname, '\tMVSRecordStage = ', MVSFloodStage)
+                    outputDebug(debug, 'RecordStage Pathname = ', TscPathname, '\tMVSRecordStage = ', MVSFloodStage)
                     if MVSRecordStage != Null and MVSRecordStage != 'None' :
                         # Create a formatted string that will be added to the table
                         CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % MVSRecordStage, TextFont))
@@ -809,7 +809,7 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
                         #CellData = Phrase(Chunk(Missing, TextFont))
                         CellData = Phrase(Chunk(Null, TextFont))
                 except Exception, e :
-                    outputDebug(debug, lineNo(), 'RecordStage Exception = ', str(e))
+                    outputDebug(debug, 'RecordStage Exception = ', str(e))
 
 
             # 4 - RecordStageDate
@@ -906,48 +906,48 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
             elif data == 'Stage' :
                 if project in GroupSet:
                     TscPathname = StageInst30min29 % project
-                    outputDebug(debug, lineNo(), 'TscPathname_project = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime) 
+                    outputDebug(debug, 'TscPathname_project = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime) 
                     if TscPathname == "Mel Price Pool-Mississippi.Stage.Inst.30Minutes.0.29":  
                        TscPathname = StageInst15min29 % project 
-                       outputDebug(debug, lineNo(), 'TscPathname_mel_price = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime) 
+                       outputDebug(debug, 'TscPathname_mel_price = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime) 
                 elif project in GroupSetLPMS:
                      TscPathname = StageInst2HoursLpmsRaw % project
-                     outputDebug(debug, lineNo(), 'TscPathname_lpms = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime)
+                     outputDebug(debug, 'TscPathname_lpms = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime)
                 else: 
                     TscPathname = DataBlockDict['DataBlocks'][TableDataName][data] % project
-                    outputDebug(debug, lineNo(), 'TscPathname_in_data_block = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime)
+                    outputDebug(debug, 'TscPathname_in_data_block = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime)
                     if TscPathname not in DbPathnameList:
                         TscPathname = StageInst15minRevLrgs % project
-                        outputDebug(debug, lineNo(), 'TscPathname_not_in_data_block = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime)
+                        outputDebug(debug, 'TscPathname_not_in_data_block = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime)
 
                 try :
                     Tsc = CwmsDb.get(TscPathname, startTime, endTime)
                     PrevStage = Tsc.values[-1] # Previous day's midnight value
                     Prev2xStage = Tsc.values[0] # 2 days previous midnight value
-                    outputDebug(debug, lineNo(), 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
-                    outputDebug(debug, lineNo(), 'TscPathname = ', str(TscPathname))
+                    outputDebug(debug, 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
+                    outputDebug(debug, 'TscPathname = ', str(TscPathname))
 
                     getGageZero29 = retrieveGageZero29( debug,          # Set to True to print all debug statements
                                                         conn,           # 
                                                         project,        # Full name of time series container
                                                         )  
-                    outputDebug(debug, lineNo(), 'project = ', project, '\tgetGageZero29 = ', str(getGageZero29))                 
+                    outputDebug(debug, 'project = ', project, '\tgetGageZero29 = ', str(getGageZero29))                 
                     
                     if PrevStage == Constants.UNDEFINED : raise ValueError('Missing Stage data for %s' % project)
                     elif Prev2xStage == Constants.UNDEFINED : Prev2xStage = Missing 		
                     
-                    outputDebug(debug, lineNo(), 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
-                    outputDebug(debug, lineNo(), 'Location ID ============================================================ project = ', project)
-                    outputDebug(debug, lineNo(), 'GroupSet = ', str(GroupSet))
+                    outputDebug(debug, 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
+                    outputDebug(debug, 'Location ID ============================================================ project = ', project)
+                    outputDebug(debug, 'GroupSet = ', str(GroupSet))
 
 
                     #TscPathname = DataBlockDict['DataBlocks'][TableDataName][FloodStage] % project
                     #MVSFloodStage = retrieveLocationLevel(debug, conn, CwmsDb, TscPathname)                    
-                    outputDebug(debug, lineNo(), 'MVSFloodStage = ')
+                    outputDebug(debug, 'MVSFloodStage = ')
 
 
                     #if project in GroupSet:
-                    #    outputDebug(debug, lineNo(), 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
+                    #    outputDebug(debug, 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
                     #    if str(MVSFloodStage)!='--':
                     #        print 'MVSFloodStage = ' + str(MVSFloodStage)
                     #        print 'getGageZero29 = ' + getGageZero29
@@ -955,11 +955,11 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
                     #        if (float(PrevStage) >= (float(MVSFloodStage) + float(getGageZero29))): BackgroundColor = Color10 # Red
                     #        print "colorset = Color10 (project)" 
                     #elif MVSFloodStage > 0:  
-                    #    outputDebug(debug, lineNo(), 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)   
+                    #    outputDebug(debug, 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)   
                     #    BackgroundColor = Color4
                     #    print "colorset = Color4 (white)"
                     #else:
-                    #    outputDebug(debug, lineNo(), 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
+                    #    outputDebug(debug, 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
                     #    if (float(PrevStage) >= float(MVSFloodStage)):
                     #        BackgroundColor = Color10
                     #        print "colorset = Color10 (red)"
@@ -972,7 +972,7 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
 
 
 
-                    outputDebug(debug, lineNo(), 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
+                    outputDebug(debug, 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
 
                     #if project in GroupSet:
                     #    print "Project in GroupSet: " + project
@@ -1001,7 +1001,7 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
                     CellData = Phrase(Chunk(Missing, TextFont))
     
                 # Store value to DataDict
-                outputDebug(debug, lineNo(), 'Set %s %s = ' % (project, data), PrevStage)
+                outputDebug(debug, 'Set %s %s = ' % (project, data), PrevStage)
                 DataBlockDict['DataBlocks'][TableDataName][project][data] = PrevStage
                 DataBlockDict['DataBlocks'][TableDataName][project][data + '2x'] = Prev2xStage
 
@@ -1058,10 +1058,10 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
             Table.addCell(Cell)
 
             # Add data to CsvData. Break data loop if column span reaches the total number columns before each data piece has been added to that table
-            outputDebug(debug, lineNo(), 'ColSpan = ', ColSpan)
+            outputDebug(debug, 'ColSpan = ', ColSpan)
             TotalColSpan += ColSpan
             UnformattedData = str(CellData[0]).replace(',', '')
-            outputDebug(debug, lineNo(), 'TotalColSpan = ', TotalColSpan)
+            outputDebug(debug, 'TotalColSpan = ', TotalColSpan)
             print '==========================='    
         #
         # Add Continued Heading for second page
@@ -1195,7 +1195,7 @@ try :
     StartMainStemStor   = EndTw.strftime('%d%b%Y 0600')
 
     ProjectDateTimeStr  = CurDateTime.strftime('%m-%d-%Y 06:00') 
-    outputDebug(debug, lineNo(), 'Start of Time Window = ', StartTwStr, '\tEnd of Time Window = ', EndTwStr, '\tProject Date and Time = ', ProjectDateTimeStr)
+    outputDebug(debug, 'Start of Time Window = ', StartTwStr, '\tEnd of Time Window = ', EndTwStr, '\tProject Date and Time = ', ProjectDateTimeStr)
     #
     # Open database connection
     #
@@ -1208,9 +1208,9 @@ try :
     # Get list of pathnames in database
     DbPathnameList = CwmsDb.getPathnameList()
     # PRINT OUT ALL CWMS TS ID
-    #outputDebug(debug, lineNo(), 'DbPathnameList = ', str(DbPathnameList))
+    #outputDebug(debug, 'DbPathnameList = ', str(DbPathnameList))
     #StationName = retrieveRiverMile(debug, conn, 'Hermann-Missouri')
-    #outputDebug(debug, lineNo(), 'Station Name = ', StationName)
+    #outputDebug(debug, 'Station Name = ', StationName)
     #stop
 
     #
@@ -1281,9 +1281,9 @@ try :
         #if DataBlock == 'Data1' or DataBlock == 'Data2' or DataBlock == 'Data3' or DataBlock == 'Data4' or DataBlock == 'Data5' or DataBlock == 'Data6' or DataBlock == 'Data7' or DataBlock == 'Data8' :
         #if DataBlock == 'Data1':
         startTime = StartMainStem
-        outputDebug(debug, lineNo(), 'startTime = ', startTime)
+        outputDebug(debug, 'startTime = ', startTime)
         endTime = EndMainStem
-        outputDebug(debug, lineNo(), 'endTime = ', endTime)
+        outputDebug(debug, 'endTime = ', endTime)
         print '=================================================================================================Main_Script_END3'
         Table1 = table1Data(debug, Table1, 'Table1', DataBlock, startTime, endTime, StartMainStemStor, endTime, DbPathnameList)
         print '=================================================================================================Main_Script_END4'
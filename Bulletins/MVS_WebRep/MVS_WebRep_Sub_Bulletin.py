@@ -57,6 +57,17 @@ print 'BulletinPropertiesPathname = ', BulletinPropertiesPathname
 if CronjobsDirectory not in sys.path : sys.path.append(CronjobsDirectory)
 if BulletinsDirectory not in sys.path : sys.path.append(BulletinsDirectory)
 if ScriptDirectory not in sys.path : sys.path.append(ScriptDirectory)
+
+# Call counts and latency of the Server_Utils functions, and the trace of the run, are written to these files at the end of the run
+CallSummaryPathname = ScriptDirectory + 'MVS_WebRep_Sub_Bulletin_Calls.json'
+TracePathname = ScriptDirectory + 'MVS_WebRep_Sub_Bulletin_Trace.json'
+
+# The properties files are loaded with the compiled properties cache in Server_Utils.py
+from Server_Utils import loadProperties, resetTrace, resetCallStats
+
+# Start the trace and count the calls of this run only before the properties are loaded, so they are in the trace and the call summary
+resetTrace('MVS_WebRep_Sub_Bulletin')
+resetCallStats()
 #
 # Load DatabasePathnames.txt and BulletinProperties
 #
@@ -69,19 +80,22 @@ while True :
     print 'DatabasePathnamesFile = ' + str(DatabasePathnamesFile)
     if not os.path.exists(DatabasePathnamesFile) :
         errorMessage = "DatabasePathnames.txt does not exist: %s" % DatabasePathnamesFile
-    with open(DatabasePathnamesFile, "r") as f : exec(f.read())
+    loadProperties(DatabasePathnamesFile, globals())
     break
 if errorMessage :
     print "ERROR : " + errorMessage
-BulletinProperties = open(BulletinPropertiesPathname, "r"); exec(BulletinProperties)
+loadProperties(BulletinPropertiesPathname, globals())
 
 # Import server utilities
-import Server_Utils
-reload(Server_Utils)
 from Server_Utils import lineNo, outputDebug, retrieveCrest, retrieveCrestDate, retrieveNWSDay1, retrieveNWSDay2, retrieveNWSDay3, \
     retrieveNWSForecastDate, retrieveLocationLevel, retrieveRecordStage, retrieveRecordStageDate, retrievePublicName, retrieveElevatonDatum, \
     retrieveRiverMile, retrieveGroup, retrieveGroupLPMS, retrieveGageZero29, retrieveBasin, retrieveLocationID, createCell, is_dst, \
-    checkTs, retrievePrecipLake, retrieveMidnightOutflow, retrieveEveningOutflow, retrieveRuleCurve, retrieveCrestLake, retrieveCrestDateLake
+    checkTs, loadPathnameCatalog, closeStatementCache, retrieveLakeSnapshot, EmptyLakeRecord, getImage, getConnectionPool, \
+    borrowConnection, fetchConcurrently, retrieveTimeSeries, QueryConcurrency, rowRecordClass, DataBlockRows, openBulletinPdf, writeFooter, \
+    streamTable, logCallSummary, span, writeTrace
+
+# Row records of each data block, keyed by data block name, e.g. Table1Data1. They are filled by the data functions
+TableRows = {}
 
 #
 # Input
@@ -106,7 +120,7 @@ def titleBlock(debug, TitleBlock,) :
     TitleLines = [TitleLine1, TitleLine2, TitleLine3, TitleLine4]
 
     # Add the USACE Logo to the TitleBlock
-    Img = Image.getInstance(UsaceLogo)
+    Img = getImage(debug, UsaceLogo)
     Cell = PdfPCell(Img, 1)
     Cell.setRowspan(len(TitleLines))
     Cell.setHorizontalAlignment(Element.ALIGN_LEFT); Cell.setVerticalAlignment(TableLayoutDict['Table1']['VerticalAlignment'])
@@ -133,7 +147,7 @@ def titleBlock(debug, TitleBlock,) :
 	# todo: check last update date/time.
 	
     # Add the seal to the TitleBlock
-    Img = Image.getInstance(Seal)
+    Img = getImage(debug, Seal)
     
     #ImgScaledWidth = Img.getScaledWidth()
     #ImgScaledHeight = Img.getScaledHeight()
@@ -488,9 +502,80 @@ def table1Heading(debug, Table,) :
 
     
 
+# stagePathname Function    : Returns the Stage pathname of a project. Pool lake projects use the NGVD29 Stage, LPMS gages use the LPMS
+#                               Stage and the other projects use the data block Stage if it is in the database.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+#
+def stagePathname(  debug,          # Set to True to print all debug statements
+                    TableDataName,  # Name of the data block, e.g. Table1Data1
+                    project,        # Location id of the project
+                    GroupSet,       # Projects in the RDL_POOL_LAKE_ELEV_DISPLAY group
+                    GroupSetLPMS,   # Projects with LPMS data
+                    DbPathnameList, # PathnameCatalog of the database
+                    ) :
+    if project in GroupSet :
+        TscPathname = StageInst30min29 % project
+        if TscPathname == "Mel Price Pool-Mississippi.Stage.Inst.30Minutes.0.29" : TscPathname = StageInst15min29 % project
+    elif project in GroupSetLPMS :
+        TscPathname = StageInst2HoursLpmsRaw % project
+    else :
+        TscPathname = DataBlockDict['DataBlocks'][TableDataName]['Stage'] % project
+        if TscPathname not in DbPathnameList : TscPathname = StageInst15minRevLrgs % project
+    outputDebug(debug, 'Stage TscPathname = ', TscPathname)
+    return TscPathname
+#
+# prefetchData Function     : Runs the independent queries of every project in a data block at the same time with up to
+#                               QueryConcurrency pooled connections and waits for them. Returns {(project, data) : QueryFuture}. The
+#                               table is then created from the results, and the exception of a query is raised by its result() in the
+#                               same place the direct call raised it.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+#
+def prefetchData(   debug,          # Set to True to print all debug statements
+                    TableDataName,  # Name of the data block, e.g. Table1Data1
+                    startTime,      # Start of the time window formatted as ddMonYYYY HHMM
+                    endTime,        # End of the time window formatted as ddMonYYYY HHMM
+                    GroupSet,       # Projects in the RDL_POOL_LAKE_ELEV_DISPLAY group
+                    GroupSetLPMS,   # Projects with LPMS data
+                    DbPathnameList, # PathnameCatalog of the database
+                    ) :
+    DataBlock = DataBlockDict['DataBlocks'][TableDataName]
+    MetDataList = [data for data in ['AirTempMax', 'AirTempMin', 'Precip'] if data in DataOrder and str(DataBlock.get(data)) != 'None']
+    Calls = {}
+    for project in DataBlock['ProjectList'] :
+        Calls[(project, 'PublicName')] = (retrievePublicName, debug, conn, project)
+        if 'RiverMile' in DataOrder : Calls[(project, 'RiverMile')] = (retrieveRiverMile, debug, conn, project)
+        if 'ElevDatum' in DataOrder and project not in ['FTPK', 'GARR', 'OAHE', 'BEND', 'FTRA', 'GAPT', 'SYS'] :
+            Calls[(project, 'ElevDatum')] = (retrieveElevatonDatum, debug, conn, project)
+        if 'FloodStage' in DataOrder and type(DataBlock.get('FloodStage')) == type('') :
+            Calls[(project, 'FloodStage')] = (retrieveLocationLevel, debug, conn, TimeZoneId, DataBlock['FloodStage'] % project,
+                LevelTimeStr)
+        if 'RecordStage' in DataOrder and type(DataBlock.get('RecordStage')) == type('') :
+            Calls[(project, 'RecordStage')] = (retrieveRecordStage, debug, conn, TimeZoneId, DataBlock['RecordStage'] % project,
+                LevelTimeStr)
+        if 'RecordStageDate' in DataOrder : Calls[(project, 'RecordStageDate')] = (retrieveRecordStageDate, debug, conn, project)
+        if 'Stage' in DataOrder :
+            TscPathname = stagePathname(debug, TableDataName, project, GroupSet, GroupSetLPMS, DbPathnameList)
+            Calls[(project, 'Stage')] = (retrieveTimeSeries, debug, conn, None, TscPathname, startTime, endTime)
+            Calls[(project, 'GageZero29')] = (retrieveGageZero29, debug, conn, project)
+        for data in MetDataList : Calls[(project, data + 'Exists')] = (checkTs, DataBlock[data] % project, conn)
+    Prefetch = fetchConcurrently(debug, Calls, QueryConcurrency)
+
+    # The met data is only retrieved for the time series that are in the database
+    Calls = {}
+    for project in DataBlock['ProjectList'] :
+        for data in MetDataList :
+            try : Exists = Prefetch[(project, data + 'Exists')].result() == 'true'
+            except : Exists = False
+            if Exists : Calls[(project, data)] = (retrieveTimeSeries, debug, conn, None, DataBlock[data] % project, startTime, endTime)
+    Prefetch.update(fetchConcurrently(debug, Calls, QueryConcurrency))
+    return Prefetch
+#
 # table1Data Function   : Creates the Data1 block for Table1 in the bulletin
 # Author/Editor         : Ryan Larsen
-# Last updated          : 12-12-2017
+# Modified              : Ivan Nguyen
+# Last updated          : 10-18-2026
 #
 print '=================================================================================================table1Data'
 def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTime, endSysTime, DbPathnameList) :
@@ -505,22 +590,32 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
 
     # QUERY TO GET PROJECT GROUP TO DISPLAY STAGE 29
     GroupSet = retrieveGroup(debug,conn,'RDL_POOL_LAKE_ELEV_DISPLAY') 
-    outputDebug(debug, lineNo(), 'GroupSet = ', str(GroupSet))
+    outputDebug(debug, 'GroupSet = ', GroupSet)
 
     # QUERY TO GET GAGES WITH LPMS DATA
     GroupSetLPMS = retrieveGroupLPMS(debug,conn) 
-    outputDebug(debug, lineNo(), 'GroupSetLPMS = ', str(GroupSetLPMS))
+    outputDebug(debug, 'GroupSetLPMS = ', GroupSetLPMS)
+
+    # Retrieve the values of every project in the data block at the same time
+    Prefetch = prefetchData(debug, TableDataName, startTime, endTime, GroupSet, GroupSetLPMS, DbPathnameList)
            
+    # Row records of the data block. The values that are computed for each row are kept in TableRows instead of the DataBlockDict
+    Rows = DataBlockRows(TableDataName, rowRecordClass('%sRow' % TableName, DataOrder + ['Stage2x']),
+        DataBlockDict['DataBlocks'][TableDataName]['ProjectList'])
+    TableRows[TableDataName] = Rows
+
     # Data
-    for project in DataBlockDict['DataBlocks'][TableDataName]['ProjectList'] :
+    for Row in Rows :
+        project = Row.Project
         # Retrieve Public Name and store it to the DataBlockDict
-        outputDebug(debug, lineNo(), 'Location ID ============================================================ project = ', project)
-        PublicName = retrievePublicName(debug, conn, project)
+        outputDebug(debug, 'Location ID ============================================================ project = ', project)
+        PublicName = Prefetch[(project, 'PublicName')].result()
         ###PublicName = PublicName.replace(' & Reservoir', '')
-        outputDebug(debug, lineNo(), 'Creating %s row' % PublicName)
+        Lake = LakeSnapshot.get(project, EmptyLakeRecord)
+        outputDebug(debug, 'Creating ', PublicName, ' row')
         
         # If adding the last project in the last data block, create a trigger to use a thick bottom border
-        if DataName == 'Data%d' % NumberOfDataBlocks and project == DataBlockDict['DataBlocks'][TableDataName]['ProjectList'][-1] :
+        if DataName == 'Data%d' % NumberOfDataBlocks and project == Rows.ProjectList[-1] :
             LastProject = True
         else : LastProject = False
 
@@ -530,10 +625,7 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
         for data in DataOrder :
             print '==========================='
 
-            outputDebug(debug, lineNo(), 'Adding %s to the row' % data)
-            # Create a variable within the DataDict. This will allow the user to store all data to a dictionary and access the variables throughout
-            #   the script
-            DataBlockDict['DataBlocks'][TableDataName].setdefault(project, {}).setdefault(data, None)
+            outputDebug(debug, 'Adding ', data, ' to the row')
 
             # Get column number
             ColumnKey = 'Column%d' % DataOrder.index(data)
@@ -556,8 +648,8 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
 			# todo: move stage and 24hr stage next to gage station
 			# 1 - RiverMile
             if data == 'RiverMile' :
-                getRiverMile = retrieveRiverMile(debug,conn,project)
-                #outputDebug(True, lineNo(), 'getRiverMile = ' , type(getRiverMile))
+                getRiverMile = Prefetch[(project, 'RiverMile')].result()
+                #outputDebug(True, 'getRiverMile = ' , type(getRiverMile))
                 #stop
                 if type(getRiverMile) == type('') : 
                     RivMile = float(getRiverMile)
@@ -597,7 +689,7 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
                         CellData = Phrase(Chunk(Null, TextFont))
                     else :
             			#Get the Elvation Datum
-            			ElevationDatum = retrieveElevatonDatum(debug, conn, project)  
+            			ElevationDatum = Prefetch[(project, 'ElevDatum')].result()
                     # Create a formatted string that will be added to the table
         			if ElevationDatum == Null or ElevationDatum == 'None' :
         			   CellData = Phrase(Chunk(Null, TextFont))
@@ -615,15 +707,15 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
                     MVSFloodStage = Null
                     CellData = Phrase(Chunk(Null, TextFont))
                     TscPathname = DataBlockDict['DataBlocks'][TableDataName][data] % project
-                    MVSFloodStage = retrieveLocationLevel(debug, conn, CwmsDb, TscPathname)
-                    outputDebug(debug, lineNo(), 'Flood Stage Pathname = ', TscPathname, '\tMVSFloodStage = ', MVSFloodStage)
+                    MVSFloodStage = Prefetch[(project, 'FloodStage')].result()
+                    outputDebug(debug, 'Flood Stage Pathname = ', TscPathname, '\tMVSFloodStage = ', MVSFloodStage)
                     if MVSFloodStage != Null and MVSFloodStage != 'None' :
                         # Create a formatted string that will be added to the table
                         CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % MVSFloodStage, TextFont))
                     else:
                         CellData = Phrase(Chunk(Null, TextFont))
                 except Exception, e :
-                    outputDebug(debug, lineNo(), 'FloodStage Exception = ', str(e))
+                    outputDebug(debug, 'FloodStage Exception = ', e)
 
 
             # 4 - RecordStage
@@ -633,8 +725,8 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
                     #CellData = Phrase(Chunk(Missing, TextFont))
                     CellData = Phrase(Chunk(Null, TextFont))
                     TscPathname = DataBlockDict['DataBlocks'][TableDataName][data] % project
-                    MVSRecordStage = retrieveRecordStage(debug, conn, CwmsDb, TscPathname)
-                    outputDebug(debug, lineNo(), 'RecordStage Pathname = ', TscPathname, '\tMVSRecordStage = ', MVSRecordStage)
+                    MVSRecordStage = Prefetch[(project, 'RecordStage')].result()
+                    outputDebug(debug, 'RecordStage Pathname = ', TscPathname, '\tMVSRecordStage = ', MVSRecordStage)
                     if MVSRecordStage != Null and MVSRecordStage != 'None' :
                         # Create a formatted string that will be added to the table
                         CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % MVSRecordStage, TextFont))
@@ -642,12 +734,12 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
                         #CellData = Phrase(Chunk(Missing, TextFont))
                         CellData = Phrase(Chunk(Null, TextFont))
                 except Exception, e :
-                    outputDebug(debug, lineNo(), 'RecordStage Exception = ', str(e))
+                    outputDebug(debug, 'RecordStage Exception = ', e)
 
 
             # 4 - RecordStageDate
             elif data == 'RecordStageDate' :
-                getRecordStageDate = retrieveRecordStageDate(debug,conn,project)
+                getRecordStageDate = Prefetch[(project, 'RecordStageDate')].result()
                 
                 
                 if getRecordStageDate != None:
@@ -669,50 +761,33 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
 
             # 5 - Stage
             elif data == 'Stage' :
-                if project in GroupSet:
-                    TscPathname = StageInst30min29 % project
-                    outputDebug(debug, lineNo(), 'TscPathname_project = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime) 
-                    if TscPathname == "Mel Price Pool-Mississippi.Stage.Inst.30Minutes.0.29":  
-                       TscPathname = StageInst15min29 % project 
-                       outputDebug(debug, lineNo(), 'TscPathname_mel_price = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime) 
-                elif project in GroupSetLPMS:
-                     TscPathname = StageInst2HoursLpmsRaw % project
-                     outputDebug(debug, lineNo(), 'TscPathname_lpms = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime)
-                else: 
-                    TscPathname = DataBlockDict['DataBlocks'][TableDataName][data] % project
-                    outputDebug(debug, lineNo(), 'TscPathname_in_data_block = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime)
-                    if TscPathname not in DbPathnameList:
-                        TscPathname = StageInst15minRevLrgs % project
-                        outputDebug(debug, lineNo(), 'TscPathname_not_in_data_block = ', TscPathname, '\tstartTime = ', startTime, '\tendTime = ', endTime)
+                TscPathname = stagePathname(debug, TableDataName, project, GroupSet, GroupSetLPMS, DbPathnameList)
 
                 try :
-                    Tsc = CwmsDb.get(TscPathname, startTime, endTime)
+                    Tsc = Prefetch[(project, 'Stage')].result()
                     PrevStage = Tsc.values[-1] # Previous day's midnight value
                     Prev2xStage = Tsc.values[0] # 2 days previous midnight value
-                    outputDebug(debug, lineNo(), 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
-                    outputDebug(debug, lineNo(), 'TscPathname = ', str(TscPathname))
-
-                    getGageZero29 = retrieveGageZero29( debug,          # Set to True to print all debug statements
-                                                        conn,           # 
-                                                        project,        # Full name of time series container
-                                                        )  
-                    outputDebug(debug, lineNo(), 'project = ', project, '\tgetGageZero29 = ', str(getGageZero29))                 
+                    outputDebug(debug, 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
+                    outputDebug(debug, 'TscPathname = ', TscPathname)
+
+                    getGageZero29 = Prefetch[(project, 'GageZero29')].result()
+                    outputDebug(debug, 'project = ', project, '\tgetGageZero29 = ', getGageZero29)                 
                     
                     if PrevStage == Constants.UNDEFINED : raise ValueError('Missing Stage data for %s' % project)
                     elif Prev2xStage == Constants.UNDEFINED : Prev2xStage = Missing 		
                     
-                    outputDebug(debug, lineNo(), 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
-                    outputDebug(debug, lineNo(), 'Location ID ============================================================ project = ', project)
-                    outputDebug(debug, lineNo(), 'GroupSet = ', str(GroupSet))
+                    outputDebug(debug, 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
+                    outputDebug(debug, 'Location ID ============================================================ project = ', project)
+                    outputDebug(debug, 'GroupSet = ', GroupSet)
 
 
                     #TscPathname = DataBlockDict['DataBlocks'][TableDataName][FloodStage] % project
                     #MVSFloodStage = retrieveLocationLevel(debug, conn, CwmsDb, TscPathname)                    
-                    outputDebug(debug, lineNo(), 'MVSFloodStage = ')
+                    outputDebug(debug, 'MVSFloodStage = ')
 
 
                     #if project in GroupSet:
-                    #    outputDebug(debug, lineNo(), 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
+                    #    outputDebug(debug, 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
                     #    if str(MVSFloodStage)!='--':
                     #        print 'MVSFloodStage = ' + str(MVSFloodStage)
                     #        print 'getGageZero29 = ' + getGageZero29
@@ -720,11 +795,11 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
                     #        if (float(PrevStage) >= (float(MVSFloodStage) + float(getGageZero29))): BackgroundColor = Color10 # Red
                     #        print "colorset = Color10 (project)" 
                     #elif MVSFloodStage > 0:  
-                    #    outputDebug(debug, lineNo(), 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)   
+                    #    outputDebug(debug, 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)   
                     #    BackgroundColor = Color4
                     #    print "colorset = Color4 (white)"
                     #else:
-                    #    outputDebug(debug, lineNo(), 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
+                    #    outputDebug(debug, 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
                     #    if (float(PrevStage) >= float(MVSFloodStage)):
                     #        BackgroundColor = Color10
                     #        print "colorset = Color10 (red)"
@@ -737,7 +812,7 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
 
 
 
-                    outputDebug(debug, lineNo(), 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
+                    outputDebug(debug, 'PrevStage = ', PrevStage, '\tPrev2xStage = ', Prev2xStage)
 
                     #if project in GroupSet:
                     #    print "Project in GroupSet: " + project
@@ -765,32 +840,33 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
                     # Create a formatted string that will be added to the table
                     CellData = Phrase(Chunk(Missing, TextFont))
     
-                # Store value to DataDict
-                outputDebug(debug, lineNo(), 'Set %s %s = ' % (project, data), PrevStage)
-                DataBlockDict['DataBlocks'][TableDataName][project][data] = PrevStage
-                DataBlockDict['DataBlocks'][TableDataName][project][data + '2x'] = Prev2xStage
+                # Store the values in the row record
+                outputDebug(debug, 'Set ', project, ' ', data, ' = ', PrevStage)
+                Row.Stage = PrevStage
+                Row.Stage2x = Prev2xStage
 
 
             # 6 StageChange
             elif data == 'StageChange' :
                 try :
-                    if DataBlockDict['DataBlocks'][TableDataName][project]['Stage'] == Missing or \
-                        DataBlockDict['DataBlocks'][TableDataName][project]['Stage2x'] == Missing :
+                    if Row.Stage == Missing or Row.Stage2x == Missing :
                         raise ValueError('Cannot compute daily Stage change data for %s' % project)
             
-                    DlyStageChange = DataBlockDict['DataBlocks'][TableDataName][project]['Stage'] - DataBlockDict['DataBlocks'][TableDataName][project]['Stage2x']
+                    DlyStageChange = Row.Stage - Row.Stage2x
+                    Row.StageChange = DlyStageChange
                     
                     # Create a formatted string that will be added to the table
                     CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % DlyStageChange, TextFont))
                 except :
                     DlyStageChange = Missing
+                    Row.StageChange = DlyStageChange
                     # Create a formatted string that will be added to the table
                     CellData = Phrase(Chunk(Missing, TextFont))
 
 
             # 4 - Precip Lake
             elif data == 'PrecipLake' :
-                getPrecipLake = retrievePrecipLake(debug,conn,project)
+                getPrecipLake = Lake.Precip
                 if getPrecipLake != None:
                     print 'getPrecipLake = ' + getPrecipLake
                     PrecipLake = float(getPrecipLake)
@@ -802,7 +878,7 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
 
             # 4 - Midnight Outflow
             elif data == 'MidnightOutflow' :
-                getMidnightOutflow = retrieveMidnightOutflow(debug,conn,project)
+                getMidnightOutflow = Lake.MidnightOutflow
                 if getMidnightOutflow != None:
                     print 'getMidnightOutflow = ' + getMidnightOutflow
                     MidnightOutflow = float(getMidnightOutflow)
@@ -814,7 +890,7 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
 
             # 4 - Evening Outflow
             elif data == 'EveningOutflow' :
-                getEveningOutflow = retrieveEveningOutflow(debug,conn,project)
+                getEveningOutflow = Lake.EveningOutflow
                 if getEveningOutflow != None:
                     print 'getEveningOutflow = ' + getEveningOutflow
                     EveningOutflow = float(getEveningOutflow)
@@ -825,7 +901,7 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
 
             # 4 - Rule Curve
             elif data == 'RuleCurve' :
-                getRuleCurve = retrieveRuleCurve(debug,conn,project)
+                getRuleCurve = Lake.RuleCurve
                 if getRuleCurve != None:
                     print 'getRuleCurve = ' + getRuleCurve
                     RuleCurve = float(getRuleCurve)
@@ -836,7 +912,7 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
 
             # 4 - Crest
             elif data == 'CrestLake' :
-                getCrestLake = retrieveCrestLake(debug,conn,project)
+                getCrestLake = Lake.Crest
                 if getCrestLake != None:
                     print 'getCrestLake = ' + str(getCrestLake)
                     CrestLake = float(getCrestLake)
@@ -847,7 +923,7 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
 
             # 4 - CrestDate
             elif data == 'CrestDateLake' :
-                getCrestDateLake = retrieveCrestDateLake(debug,conn,project)  
+                getCrestDateLake = Lake.CrestDate
 
                 #print 'type = ' + type(getCrestDateLake)  
 
@@ -864,13 +940,13 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
             elif data == 'AirTempMax' or data == 'AirTempMin' or data == 'Precip' :
                 if str(DataBlockDict['DataBlocks'][TableDataName][data]) != 'None' : 
                     TscPathname = DataBlockDict['DataBlocks'][TableDataName][data] % project
-                    if checkTs(TscPathname, conn) == 'true' :
+                    if (project, data) in Prefetch :
                     #if TscPathname in DbPathnameList :
                         # Set database time zone to GMT-6 so met data can be retrieved
                         try :
                             Value = 0.
                             CellData = Phrase(Chunk(Missing, TextFont))
-                            Tsc = CwmsDb.get(TscPathname, startTime, endTime)
+                            Tsc = Prefetch[(project, data)].result()
                             if Tsc != Null :
                                 Value = Tsc.values[-1]
                             else:
@@ -895,10 +971,10 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
             Table.addCell(Cell)
 
             # Add data to CsvData. Break data loop if column span reaches the total number columns before each data piece has been added to that table
-            outputDebug(debug, lineNo(), 'ColSpan = ', ColSpan)
+            outputDebug(debug, 'ColSpan = ', ColSpan)
             TotalColSpan += ColSpan
             UnformattedData = str(CellData[0]).replace(',', '')
-            outputDebug(debug, lineNo(), 'TotalColSpan = ', TotalColSpan)
+            outputDebug(debug, 'TotalColSpan = ', TotalColSpan)
             print '==========================='    
         #
         # Add Continued Heading for second page
@@ -907,14 +983,16 @@ def table1Data(debug, Table, TableName, DataName, startTime, endTime, startSysTi
     return Table
 print '=================================================================================================table1Data_END'
 #
-# bulletinFooter Function   : Creates a footer for the bulletin
+# bulletinFooter Function   : Creates a footer for the bulletin. The pdf is written to more than one file, so the page number is passed
+#                               in instead of read from the PdfWriter.
 # Author/Editor             : Ryan Larsen
-# Last updated              : 12-12-2017
+# Modified                  : Ivan Nguyen
+# Last updated              : 10-18-2026
 #
 
-def bulletinFooter(debug, Footer) :
+def bulletinFooter(debug, Footer, PageNumber) :
     # Add the footer image to the footer
-    Img = Image.getInstance(FooterImage)
+    Img = getImage(debug, FooterImage)
     Img.scalePercent(20)
     # createCell(debug, CellData, RowSpan, ColSpan, HorizontalAlignment, VerticalAlignment, CellPadding, BorderColors, BorderWidths, VariableBorders, BackgroundColor)
     Cell = createCell(debug, Img, TableLayoutDict['Table1']['RowSpan'], TableLayoutDict['Table1']['ColSpan'], Element.ALIGN_LEFT, 
@@ -925,7 +1003,7 @@ def bulletinFooter(debug, Footer) :
 
     # Add the page numbers to the footer
     # createCell(debug, CellData, RowSpan, ColSpan, HorizontalAlignment, VerticalAlignment, CellPadding, BorderColors, BorderWidths, VariableBorders, BackgroundColor)
-    Cell = createCell(debug, Phrase(Chunk('Page %d of 2' % Writer.getPageNumber(), TableLayoutDict['Table1']['TextFont'])), TableLayoutDict['Table1']['RowSpan'], 
+    Cell = createCell(debug, Phrase(Chunk('Page %d of 2' % PageNumber, TableLayoutDict['Table1']['TextFont'])), TableLayoutDict['Table1']['RowSpan'], 
         TableLayoutDict['Table1']['ColSpan'], TableLayoutDict['Table1']['HorizontalAlignment'], TableLayoutDict['Table1']['VerticalAlignment'], 
         TableLayoutDict['Table1']['CellPadding'], TableLayoutDict['Table1']['BorderColors'], TableLayoutDict['Table1']['BorderWidths'], 
         TableLayoutDict['Table1']['VariableBorders'], TableLayoutDict['Table1']['BackgroundColor'])
@@ -970,6 +1048,28 @@ def table1Footnote(debug, TableFootnote,) :
     TableFootnote.addCell(Cell)
 
     return TableFootnote
+#
+# tableDataBlocks Function  : Generator that adds the data blocks of Table1 one at a time and yields the name of each data block. Used
+#                               with streamTable, so the rows of a data block are written to the pdf before the next data block is made.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+#
+def tableDataBlocks(    debug,          # Set to True to print all debug statements
+                        Table,          # PdfPTable the rows are added to
+                        TableName,      # Name of the table in DataBlockDict
+                        DataBlocks,     # List of data block names
+                        startTime,      # Start of time window
+                        endTime,        # End of time window
+                        startSysTime,   # Start of the storage time window
+                        endSysTime,     # End of the storage time window
+                        DbPathnameList, # PathnameCatalog of the pathnames in the database
+                        ) :
+    for DataBlock in DataBlocks :
+        outputDebug(debug, 'startTime = ', startTime)
+        outputDebug(debug, 'endTime = ', endTime)
+        with span('table1Data', DataBlock = '%s%s' % (TableName, DataBlock)) :
+            table1Data(debug, Table, TableName, DataBlock, startTime, endTime, startSysTime, endSysTime, DbPathnameList)
+        yield '%s%s' % (TableName, DataBlock)
 
 
 ##################################################################
@@ -1016,21 +1116,25 @@ try :
     ProjectDateTimeStr  = CurDateTime.strftime('%m-%d-%Y 00:00') 
     #
     # Print the Start and End Time Window here
-    outputDebug(debug, lineNo(), 'Start of Time Window = ', StartTwStr, '\tEnd of Time Window = ', EndTwStr, '\tProject Date and Time = ', ProjectDateTimeStr)
+    outputDebug(debug, 'Start of Time Window = ', StartTwStr, '\tEnd of Time Window = ', EndTwStr, '\tProject Date and Time = ', ProjectDateTimeStr)
     #
     # Open database connection
     #
-    CwmsDb = DBAPI.open()
-    CwmsDb.setTimeZone('US/Central')
-    CwmsDb.setTimeWindow(StartTwStr, EndTwStr)
-    CwmsDb.setOfficeId('MVS')
-    CwmsDb.setTrimMissing(False)
-    conn = CwmsDb.getConnection()   # Create a java.sql.Connection
-    # Get list of pathnames in database
-    DbPathnameList = CwmsDb.getPathnameList()
+    # The retrieve functions borrow a connection from the shared MVS connection pool for each query, so the queries of the data blocks
+    #   can run at the same time. The pool is closed when the process exits.
+    conn = getConnectionPool(debug, 'MVS')
+    # Get the indexed catalog of pathnames in database. The DBAPI object is only used while its connection is borrowed. The worker
+    #   threads get the time zone of the pool and borrow their own connections
+    with borrowConnection(conn) as PoolConn :
+        DbPathnameList = loadPathnameCatalog(debug, conn.getCwmsDb(PoolConn))
+    TimeZoneId = conn.TimeZoneId
+    # The location levels are retrieved for the bulletin date, so a run of a historic date, or a replay of a recorded run, gets the same levels
+    LevelTimeStr = Date.strftime('%d%b%Y 0000')
+    # Retrieve the lake values for all of the lakes up front
+    LakeSnapshot = retrieveLakeSnapshot(debug, conn)
     #
     # Print all the cwms_ts_id here
-    #outputDebug(debug, lineNo(), 'DbPathnameList = ', str(DbPathnameList))
+    #outputDebug(debug, 'DbPathnameList = ', DbPathnameList)
     #
     # Create tables with a finite number of columns that will be written to the pdf file
     #
@@ -1072,66 +1176,44 @@ try :
     #
     TitleBlock = titleBlock(debug, TitleBlock)
     #
-    # Add data to the heading for Table1
+    # Add data to the heading for Table1. The heading is repeated on each page
     #
     Table1 = table1Heading(debug, Table1)
+    Table1.setHeaderRows(3)
     #
-    # Add data to the data blocks for Table1
+    Table1Footnote = table1Footnote(debug, Table1Footnote)
     #
-    print '=================================================================================================Main_Script_END2'
-    NumberOfDataBlocks = len(DataBlockDict['DataBlocks'].keys())
-    #NumberOfDataBlocks = 8
-    for x in range(1, NumberOfDataBlocks + 1, 1) :
-        DataBlock = 'Data%d' % x
-        #if DataBlock == 'Data1' or DataBlock == 'Data2' or DataBlock == 'Data3' or DataBlock == 'Data4' or DataBlock == 'Data5' or DataBlock == 'Data6' or DataBlock == 'Data7' or DataBlock == 'Data8' :
-        #if DataBlock == 'Data1':
-        startTime = StartMainStem
-        outputDebug(debug, lineNo(), 'startTime = ', startTime)
-        endTime = EndMainStem
-        outputDebug(debug, lineNo(), 'endTime = ', endTime)
-        print '=================================================================================================Main_Script_END3'
-        Table1 = table1Data(debug, Table1, 'Table1', DataBlock, startTime, endTime, StartMainStemStor, endTime, DbPathnameList)
-        print '=================================================================================================Main_Script_END4'
+    # Open the bulletin and its archive copy. Table1 is written to both files while its rows are made, so the finished rows do not
+    #   stay in memory.
     #
-    # Create bulletin header that is repeated on each page
+    print '=================================================================================================Main_Script_END2'
+    filenames = [BulletinFilename, ArchiveBulletinFilename % ArchiveDateTimeStr]
+    BulletinPdf, WriterList = openBulletinPdf(debug, filenames, [LeftMargin, RightMargin, TopMargin, BottomMargin])
+    # Build a footer with page numbers and add to PDF
+    BulletinFooter = bulletinFooter(debug, BulletinFooter, WriterList[0].getPageNumber())
+    writeFooter(BulletinFooter, BulletinPdf, WriterList)
+    with span('BulletinPdf.add', Element = 'TitleBlock') : BulletinPdf.add(TitleBlock) # Add TitleBlock to the PDF
     #
-    Table1.setHeaderRows(3)
+    # Add data to the data blocks for Table1
     #
-    Table1Footnote = table1Footnote(debug, Table1Footnote)
+    NumberOfDataBlocks = len(DataBlockDict['DataBlocks'].keys())
+    #NumberOfDataBlocks = 8
+    DataBlocks = ['Data%d' % x for x in range(1, NumberOfDataBlocks + 1, 1)]
+    streamTable(debug, BulletinPdf, Table1, tableDataBlocks(debug, Table1, 'Table1', DataBlocks, StartMainStem, EndMainStem,
+        StartMainStemStor, EndMainStem, DbPathnameList))
+    print '=================================================================================================Main_Script_END4'
     #
-    # Create Pdf file and write tables to create bulletin
+    with span('BulletinPdf.add', Element = 'Table1Footnote') : BulletinPdf.add(Table1Footnote) # Add Table1's footnotes
+    with span('BulletinPdf.close') : BulletinPdf.close() # Closing the document closes both pdf files
     #
-    print '=================================================================================================Main_Script_END5'
-    filenames = [BulletinFilename, ArchiveBulletinFilename % ArchiveDateTimeStr]
-    for filename in filenames :
-        BulletinPdf = Document()
-        Writer = PdfWriter.getInstance(BulletinPdf, FileOutputStream(filename))
-        BulletinPdf.setPageSize(PageSize.LETTER) # Set the page size
-        PageWidth = BulletinPdf.getPageSize().getWidth()
-        BulletinPdf.setMargins(LeftMargin, RightMargin, TopMargin, BottomMargin) # Left, Right, Top, Bottom
-        BulletinPdf.setMarginMirroring(True) 
-        BulletinPdf.open()
-        # Build a footer with page numbers and add to PDF. Only need to build it one time.
-        if filename == filenames[0] :
-            BulletinFooter = bulletinFooter(debug, BulletinFooter)
-        BulletinFooter.setTotalWidth(PageWidth - 48) # Total width is 612 pixels (8.5 inches) minus the left and right margins (24 pixels each)
-        BulletinFooter.writeSelectedRows(0, -1, 24, 36, Writer.getDirectContent())
-        BulletinPdf.add(TitleBlock) # Add TitleBlock to the PDF
-        BulletinPdf.add(Table1) # Add Table1 to the PDF
-        BulletinPdf.add(Table1Footnote) # Add Table1's footnotes
-        BulletinPdf.close()
-        Writer.close()
-        #
-        print '=================================================================================================Main_Script_END6'
+    print '=================================================================================================Main_Script_END6'
 finally :
-    try : CwmsDb.done()
+    try : logCallSummary(CallSummaryPathname)
     except : pass
-    try : conn.close()
+    try : writeTrace(TracePathname)
     except : pass
     try : BulletinPdf.close()
     except : pass
-    try : Writer.close()
-    except : pass
     try : BulletinTsFile.close()
     except : pass
     try : BulletinProperties.close()
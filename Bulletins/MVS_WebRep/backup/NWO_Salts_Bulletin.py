@@ -73,7 +73,7 @@ BulletinProperties = open(BulletinPropertiesPathname, "r"); exec(BulletinPropert
 # Import server utilities
 import Server_Utils
 reload(Server_Utils)
-from Server_Utils import lineNo, outputDebug, retrieveLocationLevel, retrievePublicName
+from Server_Utils import lineNo, outputDebug, retrieveLocationLevel, retrievePublicName, loadPathnameCatalog, closeStatementCache, rateValues
 
 #
 # Input
@@ -618,7 +618,7 @@ def table1Data( debug,      # Set to True to print all debug statements
             BulletinName = PublicName.replace(' & Reservoir', '')
             BulletinName += append
         else: BulletinName = PublicName.replace(' & Reservoir', '')
-        outputDebug(debug, lineNo(), 'Creating %s row' % BulletinName)
+        outputDebug(debug, 'Creating %s row' % BulletinName)
         
         # If adding the last project in the last data block, create a trigger to use a thick bottom border
         if DataName == DataBlocks[-1] and project == DataBlockDict['DataBlocks'][TableDataName]['ProjectList'][-1] :
@@ -627,9 +627,12 @@ def table1Data( debug,      # Set to True to print all debug statements
         
         # Reset TotalColSpan to 0
         TotalColSpan = 0
+
+        # Storages rated from the zone elevations of the project
+        ZoneStorDict = {}
         
         for data in DataOrder1 :
-            outputDebug(debug, lineNo(), 'Adding %s to the row' % data)
+            outputDebug(debug, 'Adding %s to the row' % data)
             # Create a variable within the DataDict. This will allow the user to store all data to a dictionary and access the variables throughout
             #   the script
             DataBlockDict['DataBlocks'][TableDataName].setdefault(project, {}).setdefault(data, None)
@@ -672,7 +675,7 @@ def table1Data( debug,      # Set to True to print all debug statements
                             #   exception so the value is shown as missing.
                         try :
                             MpElevZone = retrieveLocationLevel(debug, conn, CwmsDb, ElevZoneFullName)
-                            outputDebug(debug, lineNo(), '%s Mp Elev Zone = ' % ElevZoneFullName, MpElevZone)
+                            outputDebug(debug, '%s Mp Elev Zone = ' % ElevZoneFullName, MpElevZone)
                         except :
                             
                             raise ValueError
@@ -687,12 +690,12 @@ def table1Data( debug,      # Set to True to print all debug statements
                             #   exception so the value is shown as missing.
                         try :
                             MpElevZone = retrieveLocationLevel(debug, conn, CwmsDb, ElevZoneFullName)
-                            outputDebug(debug, lineNo(), '%s Mp Elev Zone = ' % ElevZoneFullName, MpElevZone)
+                            outputDebug(debug, '%s Mp Elev Zone = ' % ElevZoneFullName, MpElevZone)
                         except :
                             try :
                                 ElevZoneFullName = TopOfConsZone % project
                                 MpElevZone = retrieveLocationLevel(debug, conn, CwmsDb, ElevZoneFullName)
-                                outputDebug(debug, lineNo(), '%s Mp Elev Zone = ' % ElevZoneFullName, MpElevZone)
+                                outputDebug(debug, '%s Mp Elev Zone = ' % ElevZoneFullName, MpElevZone)
                             except :
                                 raise ValueError
                             
@@ -704,7 +707,7 @@ def table1Data( debug,      # Set to True to print all debug statements
                     CellData = Phrase(Chunk(Missing, TextFont))
 
                 # Store value to DataDict
-                outputDebug(debug, lineNo(), 'Set %s %s = ' % (project, data), MpElevZone)
+                outputDebug(debug, 'Set %s %s = ' % (project, data), MpElevZone)
                 DataBlockDict['DataBlocks'][TableDataName][project][data] = MpElevZone
 
                 # Change default cell properties
@@ -727,7 +730,7 @@ def table1Data( debug,      # Set to True to print all debug statements
                     CellData = Phrase(Chunk(Missing, TextFont))
 
                 # Store value to DataDict
-                outputDebug(debug, lineNo(), 'Set %s %s = ' % (project, data), FcElevZone)
+                outputDebug(debug, 'Set %s %s = ' % (project, data), FcElevZone)
                 DataBlockDict['DataBlocks'][TableDataName][project][data] = FcElevZone
 
                 # Change default cell properties
@@ -742,13 +745,12 @@ def table1Data( debug,      # Set to True to print all debug statements
                     elif MpElevZone == Missing :
                         raise ValueError
                     else :
-                        # Rate the elevation value
-                        System.setProperty('hec.data.cwmsRating.RatingSet.databaseLoadMethod', 'reference') # Load methods can be 'eager', 'lazy', or 'reference'. 'reference' is what 
-                                                                                                            #   CCP currently uses (11-17-2017) and seems to work the fastest
-                        ElevStorPdc = RatingSet.fromDatabase(conn, DataBlockDict['DataBlocks'][TableDataName]['RatingCurve'] % project)
+                        # Rate the MP and FC zone elevations with one call against the cached Pdc storage curve
                         PdcTime = int(TimeSinceEpoch * 1000) # Time used for retrieving the Pdc storage curves
-                        ElevStorPdc.setDefaultValueTime(PdcTime)
-                        MpStorZone = ElevStorPdc.rate(MpElevZone)
+                        ZoneElevList = [Elev for Elev in [MpElevZone, FcElevZone] if Elev not in [Null, Missing]]
+                        ZoneStorDict = dict(zip(ZoneElevList, rateValues(debug, conn, DataBlockDict['DataBlocks'][TableDataName]['RatingCurve'] % project,
+                            ZoneElevList, PdcTime)))
+                        MpStorZone = ZoneStorDict[MpElevZone]
                         MpStorZone = round(MpStorZone, 0)
                         
                         # Create a formatted string that will be added to the table
@@ -759,7 +761,7 @@ def table1Data( debug,      # Set to True to print all debug statements
                     CellData = Phrase(Chunk(Missing, TextFont))
 
                 # Store value to DataDict
-                outputDebug(debug, lineNo(), 'Set %s %s = ' % (project, data), MpStorZone)
+                outputDebug(debug, 'Set %s %s = ' % (project, data), MpStorZone)
                 DataBlockDict['DataBlocks'][TableDataName][project][data] = MpStorZone
 
                 # Change default cell properties
@@ -774,13 +776,13 @@ def table1Data( debug,      # Set to True to print all debug statements
                     elif FcElevZone == Missing :
                         raise ValueError
                     else :
-                        # Rate the elevation value
-                        System.setProperty('hec.data.cwmsRating.RatingSet.databaseLoadMethod', 'reference') # Load methods can be 'eager', 'lazy', or 'reference'. 'reference' is what 
-                                                                                                            #   CCP currently uses (11-17-2017) and seems to work the fastest
-                        ElevStorPdc = RatingSet.fromDatabase(conn, DataBlockDict['DataBlocks'][TableDataName]['RatingCurve'] % project)
-                        PdcTime = int(TimeSinceEpoch * 1000) # Time used for retrieving the Pdc storage curves
-                        ElevStorPdc.setDefaultValueTime(PdcTime)
-                        FcStorZone = ElevStorPdc.rate(FcElevZone)
+                        # Use the value rated with the MP zone elevation. Otherwise rate it against the cached Pdc storage curve
+                        if FcElevZone in ZoneStorDict :
+                            FcStorZone = ZoneStorDict[FcElevZone]
+                        else :
+                            PdcTime = int(TimeSinceEpoch * 1000) # Time used for retrieving the Pdc storage curves
+                            FcStorZone = rateValues(debug, conn, DataBlockDict['DataBlocks'][TableDataName]['RatingCurve'] % project, [FcElevZone],
+                                PdcTime)[0]
                         FcStorZone = round(FcStorZone, 0)
                         
                     # Create a formatted string that will be added to the table
@@ -791,7 +793,7 @@ def table1Data( debug,      # Set to True to print all debug statements
                     CellData = Phrase(Chunk(Missing, TextFont))
 
                 # Store value to DataDict
-                outputDebug(debug, lineNo(), 'Set %s %s = ' % (project, data), FcStorZone)
+                outputDebug(debug, 'Set %s %s = ' % (project, data), FcStorZone)
                 DataBlockDict['DataBlocks'][TableDataName][project][data] = FcStorZone
 
                 # Change default cell properties
@@ -817,7 +819,7 @@ def table1Data( debug,      # Set to True to print all debug statements
                     CellData = Phrase(Chunk(Missing, TextFont))
 
                 # Store value to DataDict
-                outputDebug(debug, lineNo(), 'Set %s %s = ' % (project, data), PrevElev)
+                outputDebug(debug, 'Set %s %s = ' % (project, data), PrevElev)
                 DataBlockDict['DataBlocks'][TableDataName][project][data] = PrevElev
                 DataBlockDict['DataBlocks'][TableDataName][project][data + '2x'] = Prev2xElev
 
@@ -848,7 +850,7 @@ def table1Data( debug,      # Set to True to print all debug statements
                     CellData = Phrase(Chunk(Missing, TextFont))
 
                 # Store value to DataDict
-                outputDebug(debug, lineNo(), 'Set %s %s = ' % (project, data), DlyElevChange)
+                outputDebug(debug, 'Set %s %s = ' % (project, data), DlyElevChange)
                 DataBlockDict['DataBlocks'][TableDataName][project][data] = DlyElevChange
 
                 # Change default cell properties
@@ -879,7 +881,7 @@ def table1Data( debug,      # Set to True to print all debug statements
                     CellData = Phrase(Chunk(Missing, TextFont))
 
                 # Store value to DataDict
-                outputDebug(debug, lineNo(), 'Set %s %s = ' % (project, data), Value)
+                outputDebug(debug, 'Set %s %s = ' % (project, data), Value)
                 DataBlockDict['DataBlocks'][TableDataName][project][data] = Value
 
                 # Change default cell properties
@@ -911,7 +913,7 @@ def table1Data( debug,      # Set to True to print all debug statements
                     CellData = Phrase(Chunk(Missing, TextFont))
                 
                 # Store value to DataDict
-                outputDebug(debug, lineNo(), 'Set %s %s = ' % (project, data), MpStorPercent)
+                outputDebug(debug, 'Set %s %s = ' % (project, data), MpStorPercent)
                 DataBlockDict['DataBlocks'][TableDataName][project][data] = MpStorPercent
 
                 # Change default cell properties
@@ -942,7 +944,7 @@ def table1Data( debug,      # Set to True to print all debug statements
                     CellData = Phrase(Chunk(Missing, TextFont))
 
                 # Store value to DataDict
-                outputDebug(debug, lineNo(), 'Set %s %s = ' % (project, data), FcStor)
+                outputDebug(debug, 'Set %s %s = ' % (project, data), FcStor)
                 DataBlockDict['DataBlocks'][TableDataName][project][data] = FcStor
 
                 # Change default cell properties
@@ -977,7 +979,7 @@ def table1Data( debug,      # Set to True to print all debug statements
                     CellData = Phrase(Chunk(Missing, TextFont))
 
                 # Store value to DataDict
-                outputDebug(debug, lineNo(), 'Set %s %s = ' % (project, data), FcStorPercent)
+                outputDebug(debug, 'Set %s %s = ' % (project, data), FcStorPercent)
                 DataBlockDict['DataBlocks'][TableDataName][project][data] = FcStorPercent
 
                 # Change default cell properties
@@ -990,12 +992,12 @@ def table1Data( debug,      # Set to True to print all debug statements
             Table.addCell(Cell)
 
             # Add data to CsvData. Break data loop if column span reaches the total number columns before each data piece has been added to that table
-            outputDebug(debug, lineNo(), 'ColSpan = ', ColSpan)
+            outputDebug(debug, 'ColSpan = ', ColSpan)
             TotalColSpan += ColSpan
             UnformattedData = str(CellData[0]).replace(',', '')
             CsvData += UnformattedData
             CsvData += ','
-            outputDebug(debug, lineNo(), 'TotalColSpan = ', TotalColSpan)
+            outputDebug(debug, 'TotalColSpan = ', TotalColSpan)
             if TotalColSpan == Table.getNumberOfColumns() :
                 CsvData += '\n'
                 break
@@ -1023,7 +1025,7 @@ def table2Data( debug,      # Set to True to print all debug statements
     for project in DataBlockDict['DataBlocks'][TableDataName]['ProjectList'] :
         # Retrieve Public Name and store it to the DataBlockDict
         BulletinName = retrievePublicName(debug, conn, project)
-        outputDebug(debug, lineNo(), 'Creating %s row' % BulletinName)
+        outputDebug(debug, 'Creating %s row' % BulletinName)
         
         # If adding the last project in the last data block, create a trigger to use a thick bottom border
         if DataName == DataBlocks[-1] and project == 'ALNE' :
@@ -1034,7 +1036,7 @@ def table2Data( debug,      # Set to True to print all debug statements
         TotalColSpan = 0
         
         for data in DataOrder2 :
-            outputDebug(debug, lineNo(), 'Adding %s to the row' % data)
+            outputDebug(debug, 'Adding %s to the row' % data)
             # Create a variable within the DataDict. This will allow the user to store all data to a dictionary and access the variables throughout
             #   the script
             DataBlockDict['DataBlocks'][TableDataName].setdefault(project, {}).setdefault(data, None)
@@ -1072,7 +1074,7 @@ def table2Data( debug,      # Set to True to print all debug statements
                 try :
                     Label = DataBlockDict['DataBlocks'][TableDataName][data][x]
                     
-                    outputDebug(debug, lineNo(), '%s Base Location = ' % project, Label)
+                    outputDebug(debug, '%s Base Location = ' % project, Label)
 
                     # Create a formatted string that will be added to the table
                     CellData = Phrase(Chunk(Label, TextFont))
@@ -1096,7 +1098,7 @@ def table2Data( debug,      # Set to True to print all debug statements
                 try :
                     MapLoc = DataBlockDict['DataBlocks'][TableDataName][data][x]
                     
-                    outputDebug(debug, lineNo(), '%s Map Location = ' % project, MapLoc)
+                    outputDebug(debug, '%s Map Location = ' % project, MapLoc)
                     
                     # Create a formatted string that will be added to the table
                     CellData = Phrase(Chunk(MapLoc, TextFont))
@@ -1161,7 +1163,7 @@ def table2Data( debug,      # Set to True to print all debug statements
                     CellData = Phrase(Chunk(Missing, TextFont))
                     
                 # Store value to DataDict
-                outputDebug(debug, lineNo(), 'Set %s %s = ' % (project, data), PrevSt)
+                outputDebug(debug, 'Set %s %s = ' % (project, data), PrevSt)
                 DataBlockDict['DataBlocks'][TableDataName][project][data] = PrevSt
                 DataBlockDict['DataBlocks'][TableDataName][project][data + '2x'] = Prev2xSt
 
@@ -1195,7 +1197,7 @@ def table2Data( debug,      # Set to True to print all debug statements
                     CellData = Phrase(Chunk(Missing, TextFont))
 
                 # Store value to DataDict
-                outputDebug(debug, lineNo(), 'Set %s %s = ' % (project, data), DlyStChange)
+                outputDebug(debug, 'Set %s %s = ' % (project, data), DlyStChange)
                 DataBlockDict['DataBlocks'][TableDataName][project][data] = DlyStChange
 
                 # Change default cell properties
@@ -1208,7 +1210,7 @@ def table2Data( debug,      # Set to True to print all debug statements
                 # First try grabbing version Raw-CODWR.  If ts doesn't exist, use Best-NWDM
                 try :
                     FlowTsFullName = DataBlockDict['DataBlocks'][TableDataName][data] % project
-                    FlowTsValid = FlowTsFullName in CwmsDb.getPathnameList()
+                    FlowTsValid = FlowTsFullName in DbPathnameList
                     if FlowTsValid == 0 :
                         FlowTsFullName = FlowInstHourBestNwdm % project
                     Tsc = CwmsDb.read(FlowTsFullName).getData()
@@ -1226,7 +1228,7 @@ def table2Data( debug,      # Set to True to print all debug statements
                     CellData = Phrase(Chunk(Missing, TextFont))
                     
                 # Store value to DataDict
-                outputDebug(debug, lineNo(), 'Set %s %s = ' % (project, data), PrevFlow)
+                outputDebug(debug, 'Set %s %s = ' % (project, data), PrevFlow)
                 DataBlockDict['DataBlocks'][TableDataName][project][data] = PrevFlow
                 
                 # Change default cell properties
@@ -1248,7 +1250,7 @@ def table2Data( debug,      # Set to True to print all debug statements
                     CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % ActionStage, TextFont))
 
                 # Store value to DataDict
-                outputDebug(debug, lineNo(), 'Set %s %s = ' % (project, data), ActionStage)
+                outputDebug(debug, 'Set %s %s = ' % (project, data), ActionStage)
                 DataBlockDict['DataBlocks'][TableDataName][project][data] = ActionStage
 
                 # Change default cell properties
@@ -1270,7 +1272,7 @@ def table2Data( debug,      # Set to True to print all debug statements
                     CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % MinorStage, TextFont))
 
                 # Store value to DataDict
-                outputDebug(debug, lineNo(), 'Set %s %s = ' % (project, data), MinorStage)
+                outputDebug(debug, 'Set %s %s = ' % (project, data), MinorStage)
                 DataBlockDict['DataBlocks'][TableDataName][project][data] = MinorStage
 
                 # Change default cell properties
@@ -1292,7 +1294,7 @@ def table2Data( debug,      # Set to True to print all debug statements
                     CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % ModerateStage, TextFont))
 
                 # Store value to DataDict
-                outputDebug(debug, lineNo(), 'Set %s %s = ' % (project, data), ModerateStage)
+                outputDebug(debug, 'Set %s %s = ' % (project, data), ModerateStage)
                 DataBlockDict['DataBlocks'][TableDataName][project][data] = ModerateStage
 
                 # Change default cell properties
@@ -1314,7 +1316,7 @@ def table2Data( debug,      # Set to True to print all debug statements
                     CellData = Phrase(Chunk(TableLayoutDict[TableName][ColumnKey]['Format'] % MajorStage, TextFont))
 
                 # Store value to DataDict
-                outputDebug(debug, lineNo(), 'Set %s %s = ' % (project, data), MajorStage)
+                outputDebug(debug, 'Set %s %s = ' % (project, data), MajorStage)
                 DataBlockDict['DataBlocks'][TableDataName][project][data] = MajorStage
 
                 # Change default cell properties
@@ -1327,12 +1329,12 @@ def table2Data( debug,      # Set to True to print all debug statements
             Table.addCell(Cell)
 
             # Add data to CsvData. Break data loop if column span reaches the total number columns before each data piece has been added to that table
-            outputDebug(debug, lineNo(), 'ColSpan = ', ColSpan)
+            outputDebug(debug, 'ColSpan = ', ColSpan)
             TotalColSpan += ColSpan
             UnformattedData = str(CellData[0]).replace(',', '')
             CsvData += UnformattedData
             CsvData += ','
-            outputDebug(debug, lineNo(), 'TotalColSpan = ', TotalColSpan)
+            outputDebug(debug, 'TotalColSpan = ', TotalColSpan)
             if TotalColSpan == Table.getNumberOfColumns() :
                 CsvData += '\n'
                 break
@@ -1536,7 +1538,7 @@ try :
         EndTwStr            = EndTw.strftime('%d%b%Y 2400') # End of time window for the database formatted as ddmmmyyyy 2400
         ProjectDateTimeStr  = CurDateTime.strftime('%m-%d-%Y 00:00') # Project date and time for bulletin formatted as mm-dd-yyyy 2400
         TimeSinceEpoch      = mktime(TimeObj) # Time object used for ratings
-        outputDebug(debug, lineNo(), 'Start of Time Window = ', StartTwStr, '\tEnd of Time Window = ', EndTwStr, 
+        outputDebug(debug, 'Start of Time Window = ', StartTwStr, '\tEnd of Time Window = ', EndTwStr, 
             '\tProject Date and Time = ', ProjectDateTimeStr, '\tTimeSinceEpoch = ', TimeSinceEpoch)
 
         #
@@ -1548,6 +1550,8 @@ try :
         CwmsDb.setOfficeId('NWDM')
         CwmsDb.setTrimMissing(False)
         conn = CwmsDb.getConnection()# Create a java.sql.Connection
+        # Get the indexed catalog of pathnames in database
+        DbPathnameList = loadPathnameCatalog(debug, CwmsDb)
 
         #
         # Create tables with a finite number of columns that will be written to the pdf file
@@ -1699,6 +1703,8 @@ try :
         exc_type, exc_value, exc_traceback = sys.exc_info()
         traceback.print_exception(exc_type, exc_value, exc_traceback, limit=None, file=sys.stdout)
 finally :
+    try : closeStatementCache(conn)
+    except : pass
     try : CwmsDb.done()
     except : pass
     try : conn.close()
@@ -0,0 +1,260 @@
+'''
+Author: Ivan Nguyen
+Last Updated: 10-18-2026
+Description: Microbenchmark and scale test of the table rendering of the bulletins. Measures the Phrase(Chunk()) pattern of the data
+    functions, createCell and the PdfPTable layout and serialization without a database, with the Table1 layout and fonts of
+    MVS_WebRep_Bulletin_Properties.txt. The pdf is written to memory, so only the rendering is measured.
+    Run the benchmark       : jython3 RenderBenchmark.py [options] [Scale ...]
+        --repeat <n>            Number of runs of each scale. The first run includes the class loading of the JVM
+        --json <pathname>       Also write the results to a json file
+    Scales                  :
+        WebRep                  Table1 of the WebRep bulletin, a heading row for each data block and a row for each project
+        Locations100            The data blocks of the 3 tiers of the MVS Cascade Delete report, about 100 locations
+        Rows1k                  1,000 rows in one data block. The 3 header rows are repeated on every page
+        Rows10k                 10,000 rows in one data block
+    Each scale is rendered twice. stream writes the table while its rows are made with streamTable, the way the bulletins do. whole
+    makes every row first and adds the complete table, so the heap grows with the table. The results are the time per cell of
+    Phrase(Chunk()), of createCell and of the layout and serialization, the heap high-water mark, the pages and the size of the pdf.
+'''
+# --------------------------------------------------------------------------------------------------------------------------------------
+# Required Imports
+# --------------------------------------------------------------------------------------------------------------------------------------
+from com.itextpdf.text      import Document, PageSize, Phrase, Chunk, Font, BaseColor, Element, Rectangle
+from com.itextpdf.text.Font import FontFamily
+from com.itextpdf.text.pdf  import PdfWriter, PdfPTable
+from java.io                import ByteArrayOutputStream
+from java.lang              import System
+from java.lang.management   import ManagementFactory, MemoryType
+import os, sys, re, json, time, argparse
+
+# --------------------------------------------------------------------------------------------------------------------------------------
+# Pathnames
+# --------------------------------------------------------------------------------------------------------------------------------------
+BulletinsDirectory = os.path.dirname(os.path.realpath(__file__)) + os.sep
+CronjobsDirectory = os.path.dirname(os.path.dirname(BulletinsDirectory)) + os.sep
+if CronjobsDirectory not in sys.path : sys.path.append(CronjobsDirectory)
+DatabasePathnamesFile = os.path.join(CronjobsDirectory, 'DatabasePathnames.txt')
+BulletinPropertiesPathname = os.path.join(BulletinsDirectory, 'MVS_WebRep', 'MVS_WebRep_Bulletin_Properties.txt')
+CascadeDeletePropertiesList = [os.path.join(CronjobsDirectory, 'MVS_Cascade_Delete_Report_Tier_%d_Bulletin_Properties.txt' % Tier)
+    for Tier in range(1, 4)]
+
+from Server_Utils import loadProperties, createCell, getTableCellStyle, streamTable
+
+# Names used by the properties files
+Properties = {  'BulletinsDirectory' : BulletinsDirectory, 'CronjobsDirectory' : CronjobsDirectory, 'BaseColor' : BaseColor, 'Font' : Font,
+                'FontFamily' : FontFamily, 'Element' : Element, 'Rectangle' : Rectangle}
+loadProperties(DatabasePathnamesFile, Properties)
+loadProperties(BulletinPropertiesPathname, Properties)
+TableLayout = Properties['TableLayoutDict']['Table1']
+TableColumns = Properties['Table1Columns']
+Margins = [Properties['LeftMargin'], Properties['RightMargin'], Properties['TopMargin'], Properties['BottomMargin']]
+
+# Number of header rows of Table1. They are repeated on every page
+HeaderRows = 3
+
+# scaleBlocks Function      : Returns the data blocks of a scale as a list of (heading, number of rows). A heading of None has no heading
+#                               row.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def scaleBlocks(    Scale,  # Name of the scale
+                    ) :
+    if Scale == 'WebRep' :
+        DataBlocks = Properties['DataBlockDict']['DataBlocks']
+        return [(DataBlocks[Name]['Heading'], len(DataBlocks[Name]['ProjectList'])) for Name in sorted(DataBlocks.keys(),
+            key = lambda Name : int(Name.replace('Table1Data', ''))) if Name.startswith('Table1Data')]
+    if Scale == 'Locations100' :
+        # The Cascade Delete properties are scanned, not loaded, the way BulletinBenchmark collects the project lists
+        Blocks = []
+        for Tier, PropertiesPathname in enumerate(CascadeDeletePropertiesList) :
+            PropertiesFile = open(PropertiesPathname, 'r')
+            try : Text = re.sub(r'(?m)^\s*#.*$', '', PropertiesFile.read())
+            finally : PropertiesFile.close()
+            for Heading, LocationList in re.findall(r"'Heading'\s*:\s*'([^']*)'\s*,\s*'LocationList'\s*:\s*\[([^\]]*)\]", Text) :
+                RowCount = len(re.findall(r"'([^']+)'", LocationList))
+                if RowCount > 0 : Blocks.append(('Tier %d %s' % (Tier + 1, Heading), RowCount))
+        return Blocks
+    if Scale == 'Rows1k' : return [(None, 1000)]
+    if Scale == 'Rows10k' : return [(None, 10000)]
+    raise ValueError('Unknown scale %s' % Scale)
+
+# rowValues Function        : Returns the text of the cells of a synthetic row, formatted with the Format of each column
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def rowValues(  Row,    # Row number
+                ) :
+    Values = []
+    for column in range(TableColumns) :
+        Column = TableLayout['Column%d' % column]
+        if Column['Key'] == 'PublicName' : Values.append('Location %d' % Row)
+        elif 'Date' in Column['Key'] : Values.append('10-18 06:00')
+        else : Values.append(Column.get('Format', '%.2f') % ((Row * 7 + column * 13) % 1000 / 10.))
+    return Values
+
+# headingCells Function     : Returns the cells of the 3 header rows of the table
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def headingCells() :
+    Style = getTableCellStyle(TableLayout)
+    Cells = [Style.replace(ColSpan = TableColumns, HorizontalAlignment = Element.ALIGN_LEFT).apply(Phrase(Chunk('NOTE: ALL WATER ' \
+        'LEVELS GIVEN IN STAGE, UNLESS INDICATED', TableLayout['TextFont'])))]
+    for HeadingRow in range(HeaderRows - 1) :
+        for column in range(TableColumns) :
+            Cells.append(Style.replace(HorizontalAlignment = Element.ALIGN_CENTER, BackgroundColor = Properties['Color5']).apply(
+                Phrase(Chunk(TableLayout['Column%d' % column]['Key'], TableLayout['TextFont2']))))
+    return Cells
+
+# blockRows Function        : Adds the heading row and the rows of each data block to the table. Yields the data block name after each
+#                               block, so it can be streamed with streamTable.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def blockRows(  Table,          # PdfPTable the rows are added to
+                Blocks,         # List of (heading, number of rows) from scaleBlocks
+                ) :
+    Row = 0
+    for x, (Heading, Rows) in enumerate(Blocks) :
+        if Heading != None :
+            Table.addCell(createCell(False, Phrase(Chunk(Heading, TableLayout['TextFont4'])), TableLayout['RowSpan'], TableColumns,
+                TableLayout['HorizontalAlignmentLeft'], TableLayout['VerticalAlignment'], TableLayout['CellPadding'],
+                TableLayout['BorderColors'], TableLayout['BorderWidths'], TableLayout['VariableBorders'], Properties['Color7']))
+        for BlockRow in range(Rows) :
+            Row += 1
+            for column, Value in enumerate(rowValues(Row)) :
+                if TableLayout['Column%d' % column]['Key'] == 'PublicName' : HorizontalAlignment = TableLayout['HorizontalAlignmentLeft']
+                else : HorizontalAlignment = TableLayout['HorizontalAlignment']
+                Table.addCell(createCell(False, Phrase(Chunk(Value, TableLayout['TextFont'])), TableLayout['RowSpan'],
+                    TableLayout['ColSpan'], HorizontalAlignment, TableLayout['VerticalAlignment'], TableLayout['CellPadding'],
+                    TableLayout['BorderColors'], TableLayout['BorderWidths'], TableLayout['VariableBorders'], TableLayout['BackgroundColor']))
+        yield 'Data%d' % (x + 1)
+
+# countCells Function       : Returns the number of body cells of a scale
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def countCells( Blocks, # List of (heading, number of rows) from scaleBlocks
+                ) :
+    return sum([Rows * TableColumns + (Heading != None) for Heading, Rows in Blocks])
+
+# timePhrases Function      : Returns the seconds to make a Phrase(Chunk()) for every body cell of a scale
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def timePhrases(    Blocks, # List of (heading, number of rows) from scaleBlocks
+                    ) :
+    Texts = [Value for Row in range(1, min(sum([Rows for Heading, Rows in Blocks]), 1000) + 1) for Value in rowValues(Row)]
+    Font = TableLayout['TextFont']
+    StartTime = time.time()
+    for x in xrange(countCells(Blocks)) : Phrase(Chunk(Texts[x % len(Texts)], Font))
+    return time.time() - StartTime
+
+# timeCells Function        : Returns the seconds of the createCell calls for every body cell of a scale. The phrase is made once
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def timeCells(  Blocks, # List of (heading, number of rows) from scaleBlocks
+                ) :
+    CellData = Phrase(Chunk('100.0', TableLayout['TextFont']))
+    StartTime = time.time()
+    for x in xrange(countCells(Blocks)) :
+        createCell(False, CellData, TableLayout['RowSpan'], TableLayout['ColSpan'], TableLayout['HorizontalAlignment'],
+            TableLayout['VerticalAlignment'], TableLayout['CellPadding'], TableLayout['BorderColors'], TableLayout['BorderWidths'],
+            TableLayout['VariableBorders'], TableLayout['BackgroundColor'])
+    return time.time() - StartTime
+
+# resetHeapPeak Function    : Runs the garbage collector and resets the peak usage of the heap memory pools
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def resetHeapPeak() :
+    System.gc()
+    for Pool in ManagementFactory.getMemoryPoolMXBeans() :
+        if Pool.getType() == MemoryType.HEAP : Pool.resetPeakUsage()
+
+# heapPeak Function         : Returns the bytes of the heap high-water mark since resetHeapPeak
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def heapPeak() :
+    return sum([Pool.getPeakUsage().getUsed() for Pool in ManagementFactory.getMemoryPoolMXBeans() if Pool.getType() == MemoryType.HEAP])
+
+# renderScale Function      : Renders the table of a scale to a pdf in memory and returns a result dictionary
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def renderScale(    Scale,  # Name of the scale
+                    Mode,   # stream or whole
+                    ) :
+    Blocks = scaleBlocks(Scale)
+    Cells = countCells(Blocks)
+    Result = {  'Scale' : Scale, 'Mode' : Mode, 'Rows' : sum([Rows for Heading, Rows in Blocks]), 'Cells' : Cells,
+                'PhraseSeconds' : timePhrases(Blocks), 'CellSeconds' : timeCells(Blocks)}
+
+    resetHeapPeak()
+    StartTime = time.time()
+    Output = ByteArrayOutputStream()
+    BulletinPdf = Document()
+    Writer = PdfWriter.getInstance(BulletinPdf, Output)
+    BulletinPdf.setPageSize(PageSize.LETTER)
+    BulletinPdf.setMargins(Margins[0], Margins[1], Margins[2], Margins[3])
+    BulletinPdf.open()
+    Table = PdfPTable(TableColumns)
+    Table.setWidths([TableLayout['Column%d' % column]['ColumnWidth'] for column in range(TableColumns)])
+    for Cell in headingCells() : Table.addCell(Cell)
+    Table.setHeaderRows(HeaderRows)
+    if Mode == 'stream' : streamTable(False, BulletinPdf, Table, blockRows(Table, Blocks))
+    else :
+        for DataBlock in blockRows(Table, Blocks) : pass
+        BulletinPdf.add(Table)
+    Pages = Writer.getPageNumber()
+    BulletinPdf.close()
+    Result['RenderSeconds'] = time.time() - StartTime
+    Result['HeapPeakBytes'] = heapPeak()
+    Result['Pages'] = Pages
+    Result['PdfBytes'] = Output.size()
+
+    # The render time includes making the phrases and cells, so the layout is what is left
+    Result['LayoutSeconds'] = max(Result['RenderSeconds'] - Result['PhraseSeconds'] - Result['CellSeconds'], 0.)
+    return Result
+
+# printResults Function     : Prints the results as a table. The times are in microseconds per cell
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def printResults(   Results,    # List of result dictionaries from renderScale
+                    ) :
+    print '%-14s%-8s%8s%9s%10s%12s%10s%11s%12s%7s%10s' % ('Scale', 'Mode', 'Rows', 'Cells', 'Phrase', 'createCell', 'Layout',
+        'Total (s)', 'Heap (MB)', 'Pages', 'Pdf (KB)')
+    for Result in Results :
+        PerCell = 1000000. / Result['Cells']
+        print '%-14s%-8s%8d%9d%10.1f%12.1f%10.1f%11.3f%12.1f%7d%10.1f' % (Result['Scale'], Result['Mode'], Result['Rows'], Result['Cells'],
+            Result['PhraseSeconds'] * PerCell, Result['CellSeconds'] * PerCell, Result['LayoutSeconds'] * PerCell, Result['RenderSeconds'],
+            Result['HeapPeakBytes'] / 1048576., Result['Pages'], Result['PdfBytes'] / 1024.)
+    print 'Phrase, createCell and Layout are in microseconds per cell'
+
+# --------------------------------------------------------------------------------------------------------------------------------------
+# Main Script
+# --------------------------------------------------------------------------------------------------------------------------------------
+if __name__ == '__main__' :
+    Scales = ['WebRep', 'Locations100', 'Rows1k', 'Rows10k']
+    Parser = argparse.ArgumentParser(description = 'Microbenchmark and scale test of the table rendering')
+    Parser.add_argument('Scales', nargs = '*', help = 'Scales to run, %s. All of them if none are given' % ', '.join(Scales))
+    Parser.add_argument('--repeat', type = int, default = 1, help = 'Number of runs of each scale')
+    Parser.add_argument('--json', help = 'Pathname of a json file for the results')
+    Options = Parser.parse_args()
+    for Scale in Options.Scales :
+        if Scale not in Scales : Parser.error('Unknown scale %s' % Scale)
+    Results = []
+    for Scale in Options.Scales or Scales :
+        for Run in range(Options.repeat) :
+            for Mode in ['stream', 'whole'] :
+                Result = renderScale(Scale, Mode)
+                Result['Run'] = Run + 1
+                Results.append(Result)
+    printResults(Results)
+    if Options.json :
+        JsonFile = open(Options.json, 'w')
+        try : json.dump(Results, JsonFile, indent = 2)
+        finally : JsonFile.close()
@@ -0,0 +1,48 @@
+'''
+Author: Ivan Nguyen
+Last Updated: 10-18-2026
+Description: Exports the rating tables of the rating curves in DatabasePathnames.txt to RatingTables.json, so storage columns and historical
+    backfills can be rated with Rating_Utils.py without a database connection. Run with jython after the ratings are updated.
+'''
+# --------------------------------------------------------------------------------------------------------------------------------------
+# Required Imports
+# --------------------------------------------------------------------------------------------------------------------------------------
+import os, sys, DBAPI
+
+# --------------------------------------------------------------------------------------------------------------------------------------
+# Pathnames
+# --------------------------------------------------------------------------------------------------------------------------------------
+CronjobsDirectory = os.path.dirname(os.path.realpath(__file__)) + os.sep
+if CronjobsDirectory not in sys.path : sys.path.append(CronjobsDirectory)
+DatabasePathnamesFile = os.path.join(CronjobsDirectory, "DatabasePathnames.txt")
+RatingTablesPathname = os.path.join(CronjobsDirectory, "RatingTables.json")
+
+from Server_Utils import retrieveRatingIds, exportRatingTables, closeStatementCache, loadProperties
+
+loadProperties(DatabasePathnamesFile, globals())
+
+debug = False
+
+# Rating curves to export. StageFlowUsgsExsaProduction is not exported, the USGS shifts and offsets of the stream ratings are not in the
+#   rating tables, so those flows are rated with RatingSet
+RatingTemplateList = [  ElevStorLinearStep, ElevAreaLinearStep, ElevStorStorageCurvesProduction, ElevEstStorUsgsExsaProduction,
+                        ElevEstAreaUsgsExsaProduction, StageFlowLinearLinear, StageFlowLinearStep,
+                        ]
+
+# --------------------------------------------------------------------------------------------------------------------------------------
+# Main Script
+# --------------------------------------------------------------------------------------------------------------------------------------
+try :
+    CwmsDb = DBAPI.open()
+    CwmsDb.setOfficeId('MVS')
+    conn = CwmsDb.getConnection()   # Create a java.sql.Connection
+    RatingIdList = retrieveRatingIds(debug, conn, RatingTemplateList)
+    RatingCount = exportRatingTables(debug, conn, RatingIdList, RatingTablesPathname)
+    print 'Exported %d of %d ratings to %s' % (RatingCount, len(RatingIdList), RatingTablesPathname)
+finally :
+    try : closeStatementCache(conn)
+    except : pass
+    try : CwmsDb.done()
+    except : pass
+    try : conn.close()
+    except : pass
@@ -0,0 +1,787 @@
+'''
+Author: Ivan Nguyen
+Last Updated: 10-18-2026
+Description: Offline stand-in for the CWMS DBAPI module and its java.sql.Connection, backed by a local SQLite fixture file. Used by
+    Bulletins/BulletinBenchmark.py to run the bulletins end to end without the CWMS database, e.g. on a laptop.
+    The fixture answers:
+        CwmsDb.getPathnameList()    : the pathnames in the catalog table
+        CwmsDb.get()                : the values in the time_series table for the time window
+        conn.prepareStatement()     : the rows in the query_result table for the same sql and bind values. checkTs is answered from the
+                                        catalog table. In a fixture made by seedFixture, the location queries of the helpers, e.g.
+                                        retrievePublicName, are answered with synthetic rows. Any other query returns no rows and is
+                                        counted as a miss.
+    Each query, get and catalog call can be delayed with a configurable latency to stand in for the network and the database, or with
+    the latency that was recorded for the call.
+    startRecording() captures the query traffic of a real run into a fixture. DBAPI is replaced by a recorder that passes every call to
+    the real DBAPI and java.sql.Connection and saves the sql, bind values, result rows, time series, catalog and latency of each call,
+    so the office's real query mix can be replayed offline.
+    Needs the sqlite-jdbc jar (org.sqlite.JDBC) on the jython classpath.
+'''
+# --------------------------------------------------------------------------------------------------------------------------------------
+# Required Imports
+# --------------------------------------------------------------------------------------------------------------------------------------
+from hec.io                 import TimeSeriesContainer
+from java.lang              import Class
+from java.sql               import DriverManager
+from java.text              import SimpleDateFormat
+from java.util              import Locale, TimeZone
+from jarray                 import array
+import json, math, re, threading, time
+
+# --------------------------------------------------------------------------------------------------------------------------------------
+# Settings
+# --------------------------------------------------------------------------------------------------------------------------------------
+Settings = {    'FixturePathname'   :   None,   # Pathname of the SQLite fixture file
+                'QueryLatency'      :   0.,     # Seconds added to every executeQuery
+                'GetLatency'        :   0.,     # Seconds added to every CwmsDb.get
+                'CatalogLatency'    :   0.,     # Seconds added to every CwmsDb.getPathnameList
+                'RecordedLatency'   :   False,  # Set to True to use the latency recorded for each call instead of the latencies above
+                }
+
+# Counters of the calls made since the last resetStats. Misses are the queries that are not in the fixture
+Stats = {}
+StatsLock = threading.Lock()
+
+# Fixture connection shared by all of the offline connections. SQLite connections are not thread safe, so it is guarded by FixtureLock
+FixtureConnections = {}
+FixtureLock = threading.Lock()
+
+# Minutes from the HecTime epoch (31Dec1899 2400) to 01Jan1970 0000
+HecEpochMinutes = 25568 * 1440
+
+# Interval of each E part of a pathname in minutes. Irregular time series are 0
+IntervalMinutes = { '1Minute' : 1, '5Minutes' : 5, '15Minutes' : 15, '30Minutes' : 30, '1Hour' : 60, '2Hours' : 120, '3Hours' : 180,
+                    '6Hours' : 360, '12Hours' : 720, '1Day' : 1440}
+
+FixtureSchema = [   'create table if not exists meta (name text primary key, value text)',
+                    'create table if not exists catalog (pathname text primary key)',
+                    'create table if not exists time_series (pathname text, date_time integer, value real, quality integer)',
+                    'create unique index if not exists time_series_index on time_series (pathname, date_time)',
+                    'create table if not exists query_result (sql_key text, binds text, row_number integer, row_values text)',
+                    'create index if not exists query_result_index on query_result (sql_key, binds)',
+                    'create table if not exists latency (kind text, call_key text, binds text, seconds real)',
+                    'create index if not exists latency_index on latency (kind, call_key, binds)',
+                    ]
+
+# configure Function        : Sets the fixture file and the latency of the offline database. Call before DBAPI.open()
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def configure(  FixturePathname,        # Pathname of the SQLite fixture file
+                QueryLatency = 0.,      # Seconds added to every executeQuery
+                GetLatency = 0.,        # Seconds added to every CwmsDb.get
+                CatalogLatency = 0.,    # Seconds added to every CwmsDb.getPathnameList
+                RecordedLatency = False,# Set to True to use the latency recorded for each call. The latencies above are used for the calls
+                                        #   that were not recorded
+                ) :
+    Settings.update({   'FixturePathname' : FixturePathname, 'QueryLatency' : QueryLatency, 'GetLatency' : GetLatency,
+                        'CatalogLatency' : CatalogLatency, 'RecordedLatency' : RecordedLatency})
+    resetStats()
+
+# resetStats Function       : Sets all of the counters to 0
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def resetStats() :
+    StatsLock.acquire()
+    try :
+        Stats.clear()
+        Stats.update({'Queries' : 0, 'Misses' : 0, 'Rows' : 0, 'Gets' : 0, 'Catalogs' : 0, 'Connections' : 0})
+    finally :
+        StatsLock.release()
+
+# countStat Function        : Adds to a counter
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def countStat(  Name,       # Name of the counter
+                Count = 1,  # Number added to the counter
+                ) :
+    StatsLock.acquire()
+    try : Stats[Name] = Stats.get(Name, 0) + Count
+    finally : StatsLock.release()
+
+# getStats Function         : Returns a copy of the counters
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def getStats() :
+    StatsLock.acquire()
+    try : return dict(Stats)
+    finally : StatsLock.release()
+
+# normalizeSql Function     : Returns the sql with the white space collapsed, so the same query matches however it is indented
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def normalizeSql(   Sql,    # SQL text
+                    ) :
+    return ' '.join(str(Sql).split())
+
+# bindKey Function          : Returns the bind values of a statement as a json list in the order of the parameter index
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def bindKey(    Parameters, # Dictionary of bind values keyed by parameter index
+                ) :
+    return json.dumps([Parameters.get(x) for x in range(1, max(Parameters.keys() + [0]) + 1)])
+
+# openFixture Function      : Returns the JDBC connection to a fixture file and creates its tables if they do not exist
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def openFixture(    FixturePathname,    # Pathname of the SQLite fixture file
+                    ) :
+    FixtureLock.acquire()
+    try :
+        if FixturePathname not in FixtureConnections :
+            try : Class.forName('org.sqlite.JDBC')
+            except : pass
+            Connection = DriverManager.getConnection('jdbc:sqlite:' + FixturePathname)
+            Statement = Connection.createStatement()
+            try :
+                for Sql in FixtureSchema : Statement.executeUpdate(Sql)
+            finally :
+                Statement.close()
+            FixtureConnections[FixturePathname] = Connection
+        return FixtureConnections[FixturePathname]
+    finally :
+        FixtureLock.release()
+
+# queryFixture Function     : Runs a query on the fixture and returns the rows as a list of lists
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def queryFixture(   Sql,            # SQL text for SQLite
+                    Parameters,     # List of bind values
+                    ) :
+    Connection = openFixture(Settings['FixturePathname'])
+    FixtureLock.acquire()
+    try :
+        Statement = Connection.prepareStatement(Sql)
+        try :
+            for x, Value in enumerate(Parameters) : Statement.setObject(x + 1, Value)
+            ResultSet = Statement.executeQuery()
+            Columns = ResultSet.getMetaData().getColumnCount()
+            Rows = []
+            while ResultSet.next() : Rows.append([ResultSet.getObject(x) for x in range(1, Columns + 1)])
+            ResultSet.close()
+            return Rows
+        finally :
+            Statement.close()
+    finally :
+        FixtureLock.release()
+
+# getMeta Function          : Returns a value from the meta table of the fixture, or Default if it is not set
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def getMeta(    Name,           # Name of the value
+                Default = None, # Returned when the value is not in the fixture
+                ) :
+    Rows = queryFixture('select value from meta where name = ?', [Name])
+    if len(Rows) == 0 : return Default
+    return str(Rows[0][0])
+
+# updateFixture Function    : Runs insert, update or delete statements on the fixture in one transaction
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def updateFixture(  Sql,            # SQL text for SQLite
+                    ParameterList,  # List of lists of bind values. The statement is run once for each list
+                    ) :
+    Connection = openFixture(Settings['FixturePathname'])
+    FixtureLock.acquire()
+    try :
+        Connection.setAutoCommit(False)
+        Statement = Connection.prepareStatement(Sql)
+        try :
+            for Parameters in ParameterList :
+                for x, Value in enumerate(Parameters) : Statement.setObject(x + 1, Value)
+                Statement.addBatch()
+            Statement.executeBatch()
+            Connection.commit()
+        finally :
+            Statement.close()
+            Connection.setAutoCommit(True)
+    finally :
+        FixtureLock.release()
+
+# setMeta Function          : Sets a value in the meta table of the fixture
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def setMeta(    Name,   # Name of the value
+                Value,  # Value
+                ) :
+    updateFixture('insert or replace into meta (name, value) values (?, ?)', [[Name, str(Value)]])
+
+# callLatency Function      : Returns the seconds a call is delayed. This is the average latency recorded for the call if RecordedLatency is
+#                               set and the call was recorded, otherwise Default.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def callLatency(    Kind,       # Kind of call, query, get or catalog
+                    CallKey,    # Normalized sql of a query or pathname of a get
+                    Binds,      # Bind values of a query as a json list, '' for the other calls
+                    Default,    # Seconds used if the call was not recorded
+                    ) :
+    if not Settings['RecordedLatency'] : return Default
+    Rows = queryFixture('select avg(seconds) from latency where kind = ? and call_key = ? and binds = ?', [Kind, CallKey, Binds])
+    if len(Rows) == 0 or Rows[0][0] == None : return Default
+    return float(Rows[0][0])
+
+# --------------------------------------------------------------------------------------------------------------------------------------
+# java.sql stand-ins
+# --------------------------------------------------------------------------------------------------------------------------------------
+
+# OfflineResultSet Class    : Rows of an offline query. Implements the ResultSet methods that are used by Server_Utils.py
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+class OfflineResultSet :
+    def __init__(   self,
+                    Rows,   # List of rows. Each row is a list of strings or None
+                    ) :
+        self.Rows = Rows
+        self.Index = -1
+
+    def next(self) :
+        self.Index += 1
+        return self.Index < len(self.Rows)
+
+    def getObject(self, Column) :
+        return self.Rows[self.Index][Column - 1]
+
+    def getString(self, Column) :
+        Value = self.getObject(Column)
+        if Value == None : return None
+        return unicode(Value)
+
+    def getDouble(self, Column) :
+        Value = self.getObject(Column)
+        if Value == None : return 0.
+        return float(Value)
+
+    def getInt(self, Column) :
+        Value = self.getObject(Column)
+        if Value == None : return 0
+        return int(float(Value))
+
+    def close(self) :
+        self.Rows = []
+
+# OfflineStatement Class    : Prepared statement of an offline connection. The bind values and the sql are looked up in the fixture
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+class OfflineStatement :
+    def __init__(   self,
+                    Connection, # OfflineConnection that prepared the statement
+                    Sql,        # SQL text
+                    ) :
+        self.Connection = Connection
+        self.SqlKey = normalizeSql(Sql)
+        self.Parameters = {}
+
+    def setString(self, Index, Value) :
+        if Value == None : self.Parameters[Index] = None
+        else : self.Parameters[Index] = unicode(Value)
+
+    setInt = setLong = setDouble = setObject = setString
+
+    def clearParameters(self) :
+        self.Parameters = {}
+
+    def executeQuery(self) :
+        countStat('Queries')
+        Binds = bindKey(self.Parameters)
+        Latency = callLatency('query', self.SqlKey, Binds, Settings['QueryLatency'])
+        if Latency > 0 : time.sleep(Latency)
+        Rows = None
+        for Pattern, Handler in QueryHandlers :
+            if Pattern.search(self.SqlKey) :
+                Rows = Handler(self)
+                break
+        if Rows == None :
+            Rows = [json.loads(Row[0]) for Row in queryFixture('select row_values from query_result where sql_key = ? and binds = ? ' \
+                'order by row_number', [self.SqlKey, Binds])]
+            # A query that was recorded with no rows is not a miss. A seeded fixture answers the location queries with synthetic rows
+            if len(Rows) == 0 and len(queryFixture('select 1 from latency where kind = ? and call_key = ? limit 1', ['query',
+                self.SqlKey])) == 0 :
+                Rows = syntheticRows(self)
+                if Rows == None :
+                    Rows = []
+                    countStat('Misses')
+        countStat('Rows', len(Rows))
+        return OfflineResultSet(Rows)
+
+    def close(self) :
+        self.Parameters = {}
+
+# catalogRows Function      : Answers checkTs from the catalog table
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def catalogRows(    Statement,  # OfflineStatement
+                    ) :
+    return queryFixture('select pathname from catalog where pathname = ?', [Statement.Parameters.get(1)])
+
+# Queries that are answered from the other fixture tables instead of query_result. Each item is (pattern of the normalized sql, handler)
+QueryHandlers = [   (re.compile(r'from CWMS_20\.av_cwms_ts_id where cwms_ts_id = (:1|\?)$', re.I), catalogRows),
+                    ]
+
+# --------------------------------------------------------------------------------------------------------------------------------------
+# Synthetic query results
+# --------------------------------------------------------------------------------------------------------------------------------------
+
+# Synthetic location levels of each specified level, as a number of SyntheticValues ranges above the base value of the parameter
+SyntheticLevels = {'Flood' : 2., 'Record Stage' : 4.}
+
+# locationOffset Function   : Returns a number that is the same for a location in every run, used to vary the synthetic values
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def locationOffset( Location,   # Location id
+                    ) :
+    return sum([ord(Character) for Character in str(Location)])
+
+# syntheticLevel Function   : Returns the synthetic value of a location level id, e.g. St Louis-Mississippi.Stage.Inst.0.Flood
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def syntheticLevel( LocationLevelId,    # Location level id
+                    ) :
+    Parts = str(LocationLevelId).split('.')
+    if Parts[1] == 'Height' : return 400. + locationOffset(Parts[0]) % 100
+    Base, Range = SyntheticValues.get(Parts[1].split('-')[0], (100., 10.))
+    return Base + Range * SyntheticLevels.get(Parts[-1], 2.)
+
+# locationBinds Function    : Returns the location ids bound to a location query. FirstIndex is the index of the first location
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def locationBinds(  Statement,  # OfflineStatement
+                    FirstIndex, # Parameter index of the first location id
+                    ) :
+    return [Statement.Parameters[x] for x in sorted(Statement.Parameters.keys()) if x >= FirstIndex]
+
+# syntheticNameRows Function        : Answers retrievePublicName and retrieveLongName with the location id
+# syntheticElevationRows Function   : Answers retrieveElevatonDatum
+# syntheticLocationRows Function    : Answers the public name and elevation query of retrieveLocationMeta
+# syntheticStationRows Function     : Answers retrieveRiverMile
+# syntheticStationListRows Function : Answers the river mile query of retrieveLocationMeta
+# syntheticLevelValueRows Function  : Answers retrieveLocationLevel and retrieveRecordStage with one level value at the start time
+# syntheticConstantRows Function    : Answers retrieveGageZero29 and retrieveLocationLevel2
+# syntheticLevelDateRows Function   : Answers retrieveRecordStageDate
+# syntheticLevelListRows Function   : Answers the location level query of retrieveLocationMeta
+# Author/Editor                     : Ivan Nguyen
+# Last updated                      : 10-18-2026
+
+def syntheticNameRows(Statement) :
+    return [[Location] for Location in locationBinds(Statement, 2)]
+
+def syntheticElevationRows(Statement) :
+    return [[unicode(400. + locationOffset(Location) % 100)] for Location in locationBinds(Statement, 2)]
+
+def syntheticLocationRows(Statement) :
+    return [[Location, Location, unicode(400. + locationOffset(Location) % 100)] for Location in locationBinds(Statement, 2)]
+
+def syntheticStationRows(Statement) :
+    return [[unicode(locationOffset(Statement.Parameters.get(1)) % 300 + .5)]]
+
+def syntheticStationListRows(Statement) :
+    return [[Location, unicode(locationOffset(Location) % 300 + .5)] for Location in locationBinds(Statement, 2)]
+
+def syntheticLevelValueRows(Statement) :
+    return [[Statement.Parameters.get(3), unicode(syntheticLevel(Statement.Parameters.get(1)))]]
+
+def syntheticConstantRows(Statement) :
+    if 'NGVD29' in Statement.SqlKey : return [[unicode(syntheticLevel(Statement.Parameters.get(1) + '.Height.Inst.0.NGVD29'))]]
+    return [[unicode(syntheticLevel(Statement.Parameters.get(1) + '.Stage.Inst.0.Flood'))]]
+
+def syntheticLevelDateRows(Statement) :
+    return [['05-20-19']]
+
+def syntheticLevelListRows(Statement) :
+    Rows = []
+    for Location in locationBinds(Statement, 1) :
+        for LevelId, SpecifiedLevelId in [  ('%s.Stage.Inst.0.Flood', 'Flood'), ('%s.Stage.Inst.0.Record Stage', 'Record Stage'),
+                                            ('%s.Height.Inst.0.NGVD29', 'NGVD29')] :
+            LevelDate = SpecifiedLevelId == 'Record Stage' and '05-20-19' or None
+            Rows.append([Location, LevelId % Location, SpecifiedLevelId, unicode(syntheticLevel(LevelId % Location)), LevelDate])
+    return Rows
+
+# Location queries that a seeded fixture answers with synthetic rows when they are not in query_result. Each item is (pattern of the
+#   normalized sql, handler)
+SyntheticHandlers = [   (re.compile(r'^select distinct bl\.(public|long)_name ', re.I), syntheticNameRows),
+                        (re.compile(r'^select distinct bl\.elevation ', re.I), syntheticElevationRows),
+                        (re.compile(r'^select distinct bl\.location_id ,bl\.public_name ', re.I), syntheticLocationRows),
+                        (re.compile(r'^select station from CWMS_20\.AV_STREAM_LOCATION ', re.I), syntheticStationRows),
+                        (re.compile(r'^select location_id, station from CWMS_20\.AV_STREAM_LOCATION ', re.I), syntheticStationListRows),
+                        (re.compile(r'cwms_level\.retrieve_location_level_values\(', re.I), syntheticLevelValueRows),
+                        (re.compile(r'^select constant_level from CWMS_20\.AV_LOCATION_LEVEL ', re.I), syntheticConstantRows),
+                        (re.compile(r'^select to_char\(level_date, \'MM-DD-YY\'\) as level_date from CWMS_20\.AV_LOCATION_LEVEL ', re.I),
+                            syntheticLevelDateRows),
+                        (re.compile(r'^select location_id ,location_level_id ,specified_level_id ,constant_level ', re.I), syntheticLevelListRows),
+                        ]
+
+# syntheticRows Function    : Returns the synthetic rows of a location query if the fixture was made by seedFixture, otherwise None
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def syntheticRows(  Statement,  # OfflineStatement
+                    ) :
+    if getMeta('Synthetic') != 'true' : return None
+    for Pattern, Handler in SyntheticHandlers :
+        if Pattern.search(Statement.SqlKey) :
+            countStat('Synthetic')
+            return Handler(Statement)
+    return None
+
+# OfflineConnection Class   : Stand-in for the java.sql.Connection of a DBAPI object
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+class OfflineConnection :
+    def __init__(self) :
+        self.Closed = False
+        countStat('Connections')
+
+    def prepareStatement(self, Sql) :
+        return OfflineStatement(self, Sql)
+
+    def isClosed(self) :
+        return self.Closed
+
+    def isValid(self, Timeout) :
+        return not self.Closed
+
+    def close(self) :
+        self.Closed = True
+
+# --------------------------------------------------------------------------------------------------------------------------------------
+# DBAPI stand-in
+# --------------------------------------------------------------------------------------------------------------------------------------
+
+# OfflineDb Class           : Stand-in for the object returned by DBAPI.open()
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+class OfflineDb :
+    def __init__(self) :
+        self.OfficeId = getMeta('OfficeId', 'MVS')
+        self.TimeZoneName = 'US/Central'
+        self.TimeWindow = (None, None)
+        self.TrimMissing = True
+        self.Connection = None
+
+    def setOfficeId(self, OfficeId) : self.OfficeId = OfficeId
+    def getOfficeId(self) : return self.OfficeId
+    def setTimeZone(self, TimeZoneName) : self.TimeZoneName = TimeZoneName
+    def getTimeZoneName(self) : return self.TimeZoneName
+    def setTimeWindow(self, StartTimeStr, EndTimeStr) : self.TimeWindow = (StartTimeStr, EndTimeStr)
+    def setTrimMissing(self, TrimMissing) : self.TrimMissing = TrimMissing
+
+    def getConnection(self) :
+        if self.Connection == None or self.Connection.isClosed() : self.Connection = OfflineConnection()
+        return self.Connection
+
+    def getPathnameList(self) :
+        countStat('Catalogs')
+        Latency = callLatency('catalog', self.OfficeId, '', Settings['CatalogLatency'])
+        if Latency > 0 : time.sleep(Latency)
+        return [str(Row[0]) for Row in queryFixture('select pathname from catalog order by pathname', [])]
+
+    # Returns the time in milliseconds since epoch of a ddMonYYYY HHMM string in the time zone of the object
+    def parseTime(self, TimeStr) :
+        DateFormat = SimpleDateFormat('ddMMMyyyy HHmm', Locale.US)
+        DateFormat.setTimeZone(TimeZone.getTimeZone(self.TimeZoneName))
+        return DateFormat.parse(TimeStr).getTime()
+
+    # Returns a TimeSeriesContainer with the values of the fixture in the time window
+    def get(self, Pathname, StartTimeStr = None, EndTimeStr = None) :
+        countStat('Gets')
+        Pathname = str(Pathname)
+        Latency = callLatency('get', Pathname, '', Settings['GetLatency'])
+        if Latency > 0 : time.sleep(Latency)
+        if StartTimeStr == None : StartTimeStr, EndTimeStr = self.TimeWindow
+        if len(queryFixture('select 1 from catalog where pathname = ?', [Pathname])) == 0 :
+            raise ValueError('%s is not in the catalog' % Pathname)
+        StartTime, EndTime = self.parseTime(StartTimeStr), self.parseTime(EndTimeStr)
+        Rows = queryFixture('select date_time, value, quality from time_series where pathname = ? and date_time >= ? and date_time <= ? ' \
+            'order by date_time', [Pathname, StartTime, EndTime])
+        countStat('Rows', len(Rows))
+        Zone = TimeZone.getTimeZone(self.TimeZoneName)
+        Parts = Pathname.split('.')
+        Tsc = TimeSeriesContainer()
+        Tsc.fullName = Pathname
+        Tsc.location, Tsc.parameter, Tsc.version = Parts[0], Parts[1], Parts[-1]
+        Tsc.type = Parts[2]
+        Tsc.interval = IntervalMinutes.get(Parts[3], 0)
+        Tsc.units = getMeta('Units.' + Parts[1], '')
+        Tsc.times = array([int(HecEpochMinutes + (Row[0] + Zone.getOffset(Row[0])) / 60000) for Row in Rows], 'i')
+        Tsc.values = array([float(Row[1]) for Row in Rows], 'd')
+        Tsc.quality = array([int(Row[2] or 0) for Row in Rows], 'i')
+        Tsc.numberValues = len(Rows)
+        if len(Rows) > 0 : Tsc.startTime, Tsc.endTime = Tsc.times[0], Tsc.times[-1]
+        return Tsc
+
+    def done(self) :
+        if self.Connection != None : self.Connection.close()
+
+    close = done
+
+# open Function             : Stand-in for DBAPI.open()
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def open(*Arguments) :
+    if Settings['FixturePathname'] == None : raise ValueError('Call Offline_DBAPI.configure() with the fixture file first')
+    return OfflineDb()
+
+# --------------------------------------------------------------------------------------------------------------------------------------
+# Recording
+# --------------------------------------------------------------------------------------------------------------------------------------
+
+# recordQuery Function      : Saves the result rows and the latency of a query. The rows replace the rows recorded before for the same
+#                               sql and bind values.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def recordQuery(    SqlKey,     # Normalized sql
+                    Binds,      # Bind values as a json list
+                    Rows,       # List of rows. Each row is a list of strings or None
+                    Seconds,    # Latency of the query
+                    ) :
+    updateFixture('delete from query_result where sql_key = ? and binds = ?', [[SqlKey, Binds]])
+    updateFixture('insert into query_result (sql_key, binds, row_number, row_values) values (?, ?, ?, ?)',
+        [[SqlKey, Binds, x, json.dumps(Row)] for x, Row in enumerate(Rows)])
+    updateFixture('insert into latency (kind, call_key, binds, seconds) values (?, ?, ?, ?)', [['query', SqlKey, Binds, Seconds]])
+
+# recordTimeSeries Function : Saves the values and the latency of a CwmsDb.get. The times of the container are in the time zone of the
+#                               DBAPI object and are saved in milliseconds since epoch.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def recordTimeSeries(   Tsc,            # TimeSeriesContainer returned by the real DBAPI
+                        TimeZoneName,   # Time zone of the DBAPI object
+                        Seconds,        # Latency of the call
+                        ) :
+    Pathname = str(Tsc.fullName)
+    Zone = TimeZone.getTimeZone(TimeZoneName)
+    ParameterList = []
+    for x in range(Tsc.numberValues) :
+        LocalTime = long(Tsc.times[x] - HecEpochMinutes) * 60000
+        if Tsc.quality != None and len(Tsc.quality) > x : Quality = Tsc.quality[x]
+        else : Quality = 0
+        ParameterList.append([Pathname, LocalTime - Zone.getOffset(LocalTime), Tsc.values[x], Quality])
+    updateFixture('insert or ignore into catalog (pathname) values (?)', [[Pathname]])
+    updateFixture('insert or replace into time_series (pathname, date_time, value, quality) values (?, ?, ?, ?)', ParameterList)
+    updateFixture('insert into latency (kind, call_key, binds, seconds) values (?, ?, ?, ?)', [['get', Pathname, '', Seconds]])
+
+# RecordingStatement Class  : Wraps a real prepared statement. The bind values are kept and the result rows of each query are read, saved
+#                               in the fixture and returned as an OfflineResultSet.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+class RecordingStatement :
+    def __init__(   self,
+                    Statement,  # Real PreparedStatement
+                    Sql,        # SQL text
+                    ) :
+        self.Statement = Statement
+        self.SqlKey = normalizeSql(Sql)
+        self.Parameters = {}
+
+    def bind(self, Method, Index, Value) :
+        getattr(self.Statement, Method)(Index, Value)
+        if Value == None : self.Parameters[Index] = None
+        else : self.Parameters[Index] = unicode(Value)
+
+    def setString(self, Index, Value) : self.bind('setString', Index, Value)
+    def setInt(self, Index, Value) : self.bind('setInt', Index, Value)
+    def setLong(self, Index, Value) : self.bind('setLong', Index, Value)
+    def setDouble(self, Index, Value) : self.bind('setDouble', Index, Value)
+    def setObject(self, Index, Value) : self.bind('setObject', Index, Value)
+
+    def clearParameters(self) :
+        self.Statement.clearParameters()
+        self.Parameters = {}
+
+    def executeQuery(self) :
+        countStat('Queries')
+        StartTime = time.time()
+        ResultSet = self.Statement.executeQuery()
+        try :
+            Columns = ResultSet.getMetaData().getColumnCount()
+            Rows = []
+            while ResultSet.next() : Rows.append([ResultSet.getString(x) for x in range(1, Columns + 1)])
+        finally :
+            ResultSet.close()
+        recordQuery(self.SqlKey, bindKey(self.Parameters), Rows, time.time() - StartTime)
+        countStat('Rows', len(Rows))
+        return OfflineResultSet(Rows)
+
+    def close(self) :
+        self.Statement.close()
+
+# RecordingConnection Class : Wraps a real java.sql.Connection, so its prepared statements are recorded. Every other call is passed to the
+#                               real connection.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+class RecordingConnection :
+    def __init__(   self,
+                    Connection, # Real java.sql.Connection
+                    ) :
+        self.Connection = Connection
+        countStat('Connections')
+
+    def prepareStatement(self, Sql) :
+        return RecordingStatement(self.Connection.prepareStatement(Sql), Sql)
+
+    def __getattr__(self, Name) :
+        return getattr(self.Connection, Name)
+
+# RecordingDb Class         : Wraps the object returned by the real DBAPI.open(). get, read and getPathnameList are recorded and every
+#                               other call is passed to the real object.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+class RecordingDb :
+    def __init__(   self,
+                    CwmsDb, # Object returned by the real DBAPI.open()
+                    ) :
+        self.CwmsDb = CwmsDb
+        self.Connection = None
+        self.OfficeId = 'MVS'
+        self.TimeZoneName = 'US/Central'
+
+    def setOfficeId(self, OfficeId) :
+        self.CwmsDb.setOfficeId(OfficeId)
+        self.OfficeId = str(OfficeId)
+        setMeta('OfficeId', OfficeId)
+
+    def setTimeZone(self, TimeZoneName) :
+        self.CwmsDb.setTimeZone(TimeZoneName)
+        self.TimeZoneName = str(TimeZoneName)
+
+    def getConnection(self) :
+        Connection = self.CwmsDb.getConnection()
+        if self.Connection == None or self.Connection.Connection is not Connection : self.Connection = RecordingConnection(Connection)
+        return self.Connection
+
+    def getPathnameList(self) :
+        countStat('Catalogs')
+        StartTime = time.time()
+        PathnameList = self.CwmsDb.getPathnameList()
+        Seconds = time.time() - StartTime
+        updateFixture('insert or ignore into catalog (pathname) values (?)', [[str(Pathname)] for Pathname in PathnameList])
+        updateFixture('insert into latency (kind, call_key, binds, seconds) values (?, ?, ?, ?)',
+            [['catalog', self.OfficeId, '', Seconds]])
+        return PathnameList
+
+    def get(self, *Arguments) :
+        countStat('Gets')
+        StartTime = time.time()
+        Tsc = self.CwmsDb.get(*Arguments)
+        recordTimeSeries(Tsc, self.TimeZoneName, time.time() - StartTime)
+        countStat('Rows', Tsc.numberValues)
+        return Tsc
+
+    def read(self, *Arguments) :
+        countStat('Gets')
+        StartTime = time.time()
+        Math = self.CwmsDb.read(*Arguments)
+        recordTimeSeries(Math.getData(), self.TimeZoneName, time.time() - StartTime)
+        return Math
+
+    def __getattr__(self, Name) :
+        return getattr(self.CwmsDb, Name)
+
+# RecordingDBAPI Class      : Stand-in for the DBAPI module while recording. open() opens the real DBAPI object and wraps it
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+class RecordingDBAPI :
+    def __init__(   self,
+                    DBAPI,  # Real DBAPI module
+                    ) :
+        self.DBAPI = DBAPI
+
+    def open(self, *Arguments) :
+        return RecordingDb(self.DBAPI.open(*Arguments))
+
+    def __getattr__(self, Name) :
+        return getattr(self.DBAPI, Name)
+
+# startRecording Function   : Records the query traffic of the bulletins that run in this process into a fixture. Replaces DBAPI in
+#                               sys.modules with a RecordingDBAPI of the real module. Returns the RecordingDBAPI.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def startRecording( FixturePathname,    # Pathname of the SQLite fixture file. Calls are added to a fixture that already exists
+                    ) :
+    import sys
+    DBAPI = sys.modules.get('DBAPI')
+    if DBAPI == None or isinstance(DBAPI, RecordingDBAPI) or DBAPI.__name__ == __name__ : DBAPI = __import__('DBAPI')
+    configure(FixturePathname)
+    openFixture(FixturePathname)
+    Recorder = RecordingDBAPI(DBAPI)
+    sys.modules['DBAPI'] = Recorder
+    return Recorder
+
+# --------------------------------------------------------------------------------------------------------------------------------------
+# Fixture builder
+# --------------------------------------------------------------------------------------------------------------------------------------
+
+# Base value and daily range of the synthetic values of each parameter
+SyntheticValues = { 'Stage' : (15., 2.), 'Elev' : (600., 1.), 'Flow' : (50000., 10000.), 'Precip' : (0.1, 0.1), 'Temp' : (60., 10.),
+                    'Stor' : (500000., 5000.)}
+
+# seedFixture Function      : Adds pathnames to the catalog of the fixture and fills the time series with hourly synthetic values around
+#                               the bulletin date. The bulletin date is stored in the fixture, so the benchmark always runs the same day.
+#                               The fixture is marked as synthetic, so the location queries are answered by the SyntheticHandlers.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def seedFixture(    FixturePathname,    # Pathname of the SQLite fixture file
+                    PathnameList,       # List of time series pathnames
+                    BulletinDate,       # Date of the bulletin formatted as ddMonYYYY HHMM
+                    Days = 10,          # Number of days of values before the bulletin date
+                    OfficeId = 'MVS',   # Office id of the fixture
+                    ) :
+    Settings['FixturePathname'] = FixturePathname
+    Connection = openFixture(FixturePathname)
+    DateFormat = SimpleDateFormat('ddMMMyyyy HHmm', Locale.US)
+    DateFormat.setTimeZone(TimeZone.getTimeZone('US/Central'))
+    EndTime = DateFormat.parse(BulletinDate).getTime()
+    StartTime = EndTime - Days * 86400000
+    FixtureLock.acquire()
+    try :
+        Connection.setAutoCommit(False)
+        Statement = Connection.prepareStatement('insert or replace into meta (name, value) values (?, ?)')
+        for Name, Value in [('BulletinDate', BulletinDate), ('OfficeId', OfficeId), ('Synthetic', 'true')] :
+            Statement.setString(1, Name); Statement.setString(2, Value); Statement.executeUpdate()
+        Statement.close()
+        CatalogStatement = Connection.prepareStatement('insert or ignore into catalog (pathname) values (?)')
+        DeleteStatement = Connection.prepareStatement('delete from time_series where pathname = ?')
+        ValueStatement = Connection.prepareStatement('insert into time_series (pathname, date_time, value, quality) values (?, ?, ?, 0)')
+        for x, Pathname in enumerate(sorted(set(PathnameList))) :
+            CatalogStatement.setString(1, Pathname); CatalogStatement.executeUpdate()
+            DeleteStatement.setString(1, Pathname); DeleteStatement.executeUpdate()
+            Base, Range = SyntheticValues.get(Pathname.split('.')[1].split('-')[0], (100., 10.))
+            for DateTime in range(StartTime, EndTime + 1, 3600000) :
+                Hours = (DateTime - StartTime) / 3600000.
+                ValueStatement.setString(1, Pathname)
+                ValueStatement.setLong(2, DateTime)
+                ValueStatement.setDouble(3, Base + Range * math.sin(Hours * math.pi / 12. + x))
+                ValueStatement.addBatch()
+            ValueStatement.executeBatch()
+        for Statement in [CatalogStatement, DeleteStatement, ValueStatement] : Statement.close()
+        Connection.commit()
+    finally :
+        Connection.setAutoCommit(True)
+        FixtureLock.release()
+    return len(set(PathnameList))
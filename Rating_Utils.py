@@ -0,0 +1,87 @@
+'''
+Author: Ivan Nguyen
+Last Updated: 10-18-2026
+Description: Rates values against rating tables exported by Export_Rating_Tables.py. Only uses the python standard library, so ratings
+    can be done without a database connection or hec.data.cwmsRating.RatingSet, e.g. for storage columns and historical backfills.
+'''
+
+from array                  import array
+from bisect                 import bisect_left, bisect_right
+import json, math
+
+# loadRatingTables Function : Reads the rating tables file. Returns a dictionary keyed by rating id. Each rating id has a list of ratings
+#                               sorted by effective date. Each rating is a dictionary with the EffectiveDate in milliseconds since epoch,
+#                               the in range Method and the sorted Ind and Dep value arrays.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def loadRatingTables(   debug,          # Set to True to print all debug statements
+                        Pathname,       # Pathname of the rating tables json file
+                        ) :
+    RatingFile = open(Pathname, 'r')
+    try : RatingData = json.load(RatingFile)
+    finally : RatingFile.close()
+
+    RatingTables = {}
+    for RatingId, RatingList in RatingData['Ratings'].items() :
+        RatingTables[str(RatingId)] = sorted([{ 'EffectiveDate'     :   Rating['EffectiveDate'],
+                                                'Method'            :   str(Rating.get('Method', 'LINEAR')),
+                                                'Units'             :   str(Rating.get('Units', '')),
+                                                'Ind'               :   array('d', Rating['Ind']),
+                                                'Dep'               :   array('d', Rating['Dep']),
+                                                } for Rating in RatingList], key = lambda Rating : Rating['EffectiveDate'])
+    if debug : print('Loaded %d rating tables from %s' % (len(RatingTables), Pathname))
+    return RatingTables
+
+# findRating Function       : Returns the rating that is in effect at the time. This is the latest rating with an effective date at or
+#                               before the time. Returns None for times before all of the effective dates, no rating is in effect then.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def findRating( RatingTables,           # Dictionary from loadRatingTables
+                RatingId,               # Rating specification id
+                EffectiveTime = None,   # Time in milliseconds since epoch. Uses the latest rating if None
+                ) :
+    RatingList = RatingTables[RatingId]
+    if EffectiveTime == None : return RatingList[-1]
+    Index = bisect_right([Rating['EffectiveDate'] for Rating in RatingList], EffectiveTime) - 1
+    if Index < 0 : return None
+    return RatingList[Index]
+
+# rateTable Function        : Rates a list of values with binary search and interpolation of the rating table in effect at the time.
+#                               Values outside the range of the table, or None, are returned as None. All of the values are returned as
+#                               None if the time is before the effective date of the first rating.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def rateTable(  debug,                  # Set to True to print all debug statements
+                RatingTables,           # Dictionary from loadRatingTables
+                RatingId,               # Rating specification id
+                Values,                 # List of independent values
+                EffectiveTime = None,   # Time in milliseconds since epoch. Uses the latest rating if None
+                ) :
+    Rating = findRating(RatingTables, RatingId, EffectiveTime)
+    if Rating == None :
+        if debug : print('No rating of %s is in effect at %s' % (RatingId, EffectiveTime))
+        return [None] * len(Values)
+    Ind, Dep, Method = Rating['Ind'], Rating['Dep'], Rating['Method']
+    RatedValues = []
+    for Value in Values :
+        if Value == None or len(Ind) == 0 or Value < Ind[0] or Value > Ind[-1] :
+            RatedValues.append(None)
+            continue
+        Index = bisect_left(Ind, Value)
+        if Ind[Index] == Value :
+            RatedValues.append(Dep[Index])
+        elif Method == 'PREVIOUS' :
+            RatedValues.append(Dep[Index - 1])
+        elif Method == 'NEXT' :
+            RatedValues.append(Dep[Index])
+        elif Method == 'LOGARITHMIC' and Ind[Index - 1] > 0 and Dep[Index - 1] > 0 and Dep[Index] > 0 :
+            Fraction = (math.log(Value) - math.log(Ind[Index - 1])) / (math.log(Ind[Index]) - math.log(Ind[Index - 1]))
+            RatedValues.append(math.exp(math.log(Dep[Index - 1]) + Fraction * (math.log(Dep[Index]) - math.log(Dep[Index - 1]))))
+        else :
+            Fraction = (Value - Ind[Index - 1]) / (Ind[Index] - Ind[Index - 1])
+            RatedValues.append(Dep[Index - 1] + Fraction * (Dep[Index] - Dep[Index - 1]))
+    if debug : print('Rated %d values with %s' % (len(Values), RatingId))
+    return RatedValues
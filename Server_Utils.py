@@ -10,10 +10,20 @@ from hec.heclib.util        import HecTime
 from hec.io                 import TimeSeriesContainer
 from hec.script             import Constants, AxisMarker
 from java.util              import Locale, Calendar, TimeZone
-from com.itextpdf.text.pdf  import  PdfPCell, BaseFont
+from com.itextpdf.text      import Chunk, Document, Image, PageSize, Phrase
+from com.itextpdf.text.pdf  import  PdfPCell, PdfPTable, PdfWriter, BaseFont
+from java.io                import FileOutputStream
 from java.text              import SimpleDateFormat
 from hec.script.Constants   import TRUE, FALSE
-import inspect, math
+from hec.data.cwmsRating    import RatingSet
+from java.lang              import System
+from java.lang.management   import ManagementFactory
+from jarray                 import array
+from collections            import OrderedDict, namedtuple
+from logging.handlers       import RotatingFileHandler
+from contextlib             import contextmanager
+from Queue                  import Queue
+import atexit, imp, inspect, json, logging, math, os, re, sys, thread, threading, time
 
 # createBlankTimeSeries Function : Create a blank time series for plotting purposes
 # Author/Editor                  : Ryan Larsen
@@ -120,9 +130,9 @@ def createPlot( debug,               # Set to True or False to print debug state
     for x in range(len(ViewportLayoutsInfo)) :
         TimeSeriesParameter = ViewportLayoutsInfo[x][1].parameter
         TimeSeriesSubParameter = ViewportLayoutsInfo[x][1].subParameter
-        outputDebug(debug, lineNo(), 'Time series: %s' % ViewportLayoutsInfo[x][1].fullName)
+        outputDebug(debug, 'Time series: ', ViewportLayoutsInfo[x][1].fullName)
         InitialTscValues = ViewportLayoutsInfo[x][1].values
-        outputDebug(debug, lineNo(), 'IntitialTscValues = ', InitialTscValues)
+        outputDebug(debug, 'IntitialTscValues = ', InitialTscValues)
         # Substitute missing values with maximum value. This is only for scaling purposes. Plots will still contain all of the data
         if InitialTscValues == None or len(InitialTscValues) == 0 or all(x == Constants.UNDEFINED for x in InitialTscValues) == True :
             TscValues = [0.0, 0.5]
@@ -143,13 +153,13 @@ def createPlot( debug,               # Set to True or False to print debug state
             MinMaxDict[ViewportName][ViewportLayoutsInfo[x][2]]['MaxValues'].append(MaxValue)
         except : 
             # Add min and max values to dictionary
-            outputDebug(debug, lineNo(), 'AxisName = ', ViewportLayoutsInfo[x][2])
+            outputDebug(debug, 'AxisName = ', ViewportLayoutsInfo[x][2])
             MinMaxDict.setdefault(ViewportName, {}).setdefault(ViewportLayoutsInfo[x][2], {}).setdefault('MinValues', [MinValue])
             MinMaxDict.setdefault(ViewportName, {}).setdefault(ViewportLayoutsInfo[x][2], {}).setdefault('MaxValues', [MaxValue])
 
             # Add viewports to dictionary
             MinMaxDict[ViewportName].setdefault('Viewport', Viewport)
-        outputDebug(debug, lineNo(), 'ViewportName = ', ViewportName, '  MinValues = ', MinMaxDict[ViewportName][ViewportLayoutsInfo[x][2]]['MinValues'], 
+        outputDebug(debug, 'ViewportName = ', ViewportName, '  MinValues = ', MinMaxDict[ViewportName][ViewportLayoutsInfo[x][2]]['MinValues'], 
                     '  MaxValues = ', MinMaxDict[ViewportName][ViewportLayoutsInfo[x][2]]['MaxValues'])
         
         for y in range(len(ViewportLayoutsInfo)) :
@@ -160,20 +170,20 @@ def createPlot( debug,               # Set to True or False to print debug state
                 OtherTimeSeriesSubParameter = ViewportLayoutsInfo[y][1].subParameter
                 
                 if OtherTimeSeriesParameter == TimeSeriesParameter and OtherTimeSeriesSubParameter == TimeSeriesSubParameter :
-                    outputDebug(debug, lineNo(), 'Parameter is in another viewport. Add values to %s' % OtherViewportName)
+                    outputDebug(debug, 'Parameter is in another viewport. Add values to ', OtherViewportName)
                     try : 
                         # Append min and max values to dictionary
                         MinMaxDict[OtherViewportName][ViewportLayoutsInfo[y][2]]['MinValues'].append(MinValue)
                         MinMaxDict[OtherViewportName][ViewportLayoutsInfo[y][2]]['MaxValues'].append(MaxValue)
                     except : 
                         # Add min and max values to dictionary
-                        outputDebug(debug, lineNo(), 'AxisName = ', ViewportLayoutsInfo[y][2])
+                        outputDebug(debug, 'AxisName = ', ViewportLayoutsInfo[y][2])
                         MinMaxDict.setdefault(OtherViewportName, {}).setdefault(ViewportLayoutsInfo[y][2], {}).setdefault('MinValues', [MinValue])
                         MinMaxDict.setdefault(OtherViewportName, {}).setdefault(ViewportLayoutsInfo[y][2], {}).setdefault('MaxValues', [MaxValue])
             
                         # Add viewports to dictionary
                         MinMaxDict[OtherViewportName].setdefault('Viewport', OtherViewport)
-                    outputDebug(debug, lineNo(), 'OtherViewportName = ', OtherViewportName, '  MinValues = ', MinMaxDict[OtherViewportName][ViewportLayoutsInfo[y][2]]['MinValues'], 
+                    outputDebug(debug, 'OtherViewportName = ', OtherViewportName, '  MinValues = ', MinMaxDict[OtherViewportName][ViewportLayoutsInfo[y][2]]['MinValues'], 
                                 '  MaxValues = ', MinMaxDict[OtherViewportName][ViewportLayoutsInfo[y][2]]['MaxValues'])
     
     # Set axis label. When running on the server, the units are sometimes left off the axis label.
@@ -193,7 +203,7 @@ def createPlot( debug,               # Set to True or False to print debug state
     for key in MarkerKeys :
         if MarkerProperties[key][0] and MarkerProperties[key][2] != None :
             marker = AxisMarker()
-            outputDebug(debug, lineNo(), 'Marker Value = ', MarkerProperties[key][2])
+            outputDebug(debug, 'Marker Value = ', MarkerProperties[key][2])
             marker.value = '%s' % MarkerProperties[key][2]
             Viewport = plot.getViewport(MarkerProperties[key][3])
             ViewportName = Viewport.getName()
@@ -213,7 +223,7 @@ def createPlot( debug,               # Set to True or False to print debug state
                 TscFullName = ViewportLayoutsInfo[x][1].fullName
                 if MarkerProperties[key][3].fullName == TscFullName : 
                     AxisName = ViewportLayoutsInfo[x][2]
-                    outputDebug(debug, lineNo(), 'AxisName = ', AxisName)
+                    outputDebug(debug, 'AxisName = ', AxisName)
                 
             # Add markers to min and max values so the auto scaling with include the values only if marker is on Y axis
             if MarkerProperties[key][6] == 'Y1' or MarkerProperties[key][6] == 'Y2' : 
@@ -230,7 +240,7 @@ def createPlot( debug,               # Set to True or False to print debug state
         # Set yaxis scale
         AxesList = MinMaxDict[key].keys()[1 :] # The first key is 'Viewport'. Only want the axes
         for axis in AxesList :
-            outputDebug(debug, lineNo(), 'ViewportName = ', key, '  Axis = ', axis)
+            outputDebug(debug, 'ViewportName = ', key, '  Axis = ', axis)
             MaxValue = max(MinMaxDict[key][axis]['MaxValues'])
             MinValue = min(MinMaxDict[key][axis]['MinValues'])
             NumberOfTics = 5.
@@ -261,12 +271,12 @@ def createPlot( debug,               # Set to True or False to print debug state
             YAxis.setViewLimits(minscale, maxscale)
             YAxis.setMajorTicInterval(YAxisMajorTic)
             YAxis.setMaximumFactionDigits(YAxisDigits)
-            outputDebug(debug, lineNo(), 'MaxValue = ', MaxValue, '  MinValue = ', MinValue, '  YAxisMajorTic = ', YAxisMajorTic, 
+            outputDebug(debug, 'MaxValue = ', MaxValue, '  MinValue = ', MinValue, '  YAxisMajorTic = ', YAxisMajorTic, 
                         '  maxscale = ', maxscale, '  minscale = ', minscale)
             YAxisScaleMax = YAxis.getScaleMax()
             YAxisScaleMin = YAxis.getScaleMin()
             YAxisMajorTic = YAxis.getMajorTic()
-            outputDebug(debug, lineNo(), Location, '\tFinal minscale = ', minscale, '\tYAxis scale max = ', YAxisScaleMax, '\tYAxis scale min = ', YAxisScaleMin,
+            outputDebug(debug, Location, '\tFinal minscale = ', minscale, '\tYAxis scale max = ', YAxisScaleMax, '\tYAxis scale min = ', YAxisScaleMin,
                 '\tFinal maxscale = ', maxscale, '\tFinal YAxis Major Tic = ', YAxisMajorTic)
          
     # Plot Title
@@ -288,25 +298,920 @@ def createPlot( debug,               # Set to True or False to print debug state
 def lineNo() :
     return inspect.currentframe().f_back.f_lineno
 
-# outputDebug Function  : Debugging function that prints specified arguments
+# DebugMessage Class    : Statement of an outputDebug call. The arguments are only joined into a string when the statement is written
+# Author/Editor         : Ivan Nguyen
+# Last updated          : 10-18-2026
+
+class DebugMessage(object) :
+    __slots__ = ('LineNumber', 'Arguments')
+
+    def __init__(   self,
+                    LineNumber, # Line number of the outputDebug call
+                    Arguments,  # Tuple of the arguments that are joined
+                    ) :
+        self.LineNumber = LineNumber
+        self.Arguments = Arguments
+
+    def __str__(self) :
+        return 'Debug Line %d   |\t' % self.LineNumber + ''.join([str(Argument) for Argument in self.Arguments])
+
+# outputDebug Function  : Debugging function that prints specified arguments. Nothing is done if the first argument is False. The
+#                           statement is written to the bulletin log file if configureLogging was called, otherwise it is printed.
+#                           The line number of the call is only looked up after the debug check, and the arguments are only joined
+#                           when the bulletin log writes the statement, so the calls pass raw values and do not need a guard.
 # Author/Editor         : Ryan Larsen
-# Last updated          : 04-10-2017
+# Last updated          : 10-18-2026
 
 def outputDebug(    *args
                     ) :
     ArgCount = len(args)
-    if ArgCount < 2 :
-        raise ValueError('Expected at least 2 arguments, got %d' % argCount)
+    if ArgCount < 1 :
+        raise ValueError('Expected at least 1 argument, got %d' % ArgCount)
     if type(args[0]) != type(True) :
         raise ValueError('Expected first argument to be either True or False')
-    if type(args[1]) != type(1) :
-        raise ValueError('Expected second argument to be line number')
 
-    if args[0] == True: 
-        DebugStatement = 'Debug Line %d   |\t' % args[1]
-        for x in range(2, ArgCount, 1) :
-            DebugStatement += str(args[x])
-        print DebugStatement
+    if args[0] != True : return
+    Message = DebugMessage(sys._getframe(1).f_lineno, args[1 :])
+    if BulletinLog.handlers : BulletinLog.debug(Message)
+    else : print Message
+
+#########################################################################
+# Properties
+#########################################################################
+
+# loadProperties Function   : Runs a properties file, e.g. DatabasePathnames.txt or a *_Properties.txt file, in the namespace of the
+#                               bulletin. Replaces exec() of the file. The file is copied to a <name>_compiled.py module next to it when
+#                               its modification time or size changes, and the module is loaded with imp, so python caches the compiled
+#                               module (.pyc, or $py.class in jython) and only compiles it again after the properties file is changed.
+#                               The names defined by the bulletin are available to the properties file the same way they were with
+#                               exec(). If the namespace has a PropertyOverrides dictionary (set by BulletinServer.py for a job), those
+#                               properties replace the values from the file.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def loadProperties( Pathname,   # Pathname of the properties file
+                    Namespace,  # Dictionary the properties are added to. Use globals() of the bulletin
+                    ) :
+    Directory, Filename = os.path.split(os.path.abspath(Pathname))
+    ModuleName = re.sub(r'\W', '_', os.path.splitext(Filename)[0]) + '_compiled'
+    ModulePathname = os.path.join(Directory, ModuleName + '.py')
+
+    # Only write the module when the properties change, so the compiled module stays valid. The module gets the modification time of the
+    #   properties file, so a change is found by comparing the time and size of the two files without reading them
+    PropertiesStat = os.stat(Pathname)
+    if not os.path.isfile(ModulePathname) or (int(os.path.getmtime(ModulePathname)), os.path.getsize(ModulePathname)) != \
+        (int(PropertiesStat.st_mtime), PropertiesStat.st_size) :
+        PropertiesFile = open(Pathname, 'r')
+        try : Source = PropertiesFile.read()
+        finally : PropertiesFile.close()
+        # The module is written to a temporary file first and renamed, so a bulletin running at the same time never loads a partial module
+        TempPathname = '%s.%d.tmp' % (ModulePathname, os.getpid())
+        try :
+            ModuleFile = open(TempPathname, 'w')
+            try : ModuleFile.write(Source)
+            finally : ModuleFile.close()
+            os.utime(TempPathname, (PropertiesStat.st_atime, PropertiesStat.st_mtime))
+            if os.name == 'nt' and os.path.exists(ModulePathname) : os.remove(ModulePathname)
+            os.rename(TempPathname, ModulePathname)
+        except :
+            try : os.remove(TempPathname)
+            except : pass
+            raise
+        # The module can now be older than its compiled module, so remove the compiled module
+        for Extension in ['$py.class', '.pyc'] :
+            try : os.remove(os.path.join(Directory, ModuleName + Extension))
+            except OSError : pass
+
+    # imp runs the module in the module that is already in sys.modules, so the properties can use the names of the bulletin
+    Module = imp.new_module(ModuleName)
+    for Name, Value in Namespace.items() :
+        if not Name.startswith('__') : setattr(Module, Name, Value)
+    sys.modules[ModuleName] = Module
+    try :
+        # jython compiles the source again in load_module, so load the $py.class it wrote last time if it is up to date
+        CompiledPathname = os.path.join(Directory, ModuleName + '$py.class')
+        if os.path.isfile(CompiledPathname) and os.path.getmtime(CompiledPathname) >= os.path.getmtime(ModulePathname) :
+            ModuleFile, FoundPathname, Description = open(CompiledPathname, 'rb'), CompiledPathname, ('$py.class', 'rb', imp.PY_COMPILED)
+        else :
+            ModuleFile, FoundPathname, Description = imp.find_module(ModuleName, [Directory])
+        try : imp.load_module(ModuleName, ModuleFile, FoundPathname, Description)
+        finally :
+            if ModuleFile : ModuleFile.close()
+    finally :
+        del sys.modules[ModuleName]
+    for Name, Value in Module.__dict__.items() :
+        if not Name.startswith('__') : Namespace[Name] = Value
+    Namespace.update(Namespace.get('PropertyOverrides') or {})
+    return Namespace
+
+#########################################################################
+# Logging
+#########################################################################
+
+# Logger used by the bulletins. Nothing is written until configureLogging adds the rotating log file.
+BulletinLog = logging.getLogger('Bulletins')
+BulletinLog.propagate = False
+
+# configureLogging Function : Writes the bulletin log to a rotating log file and sets the log level. The BULLETIN_LOG_LEVEL environment
+#                               variable overrides the level, so debugging can be turned on for one run without editing the bulletin.
+#                               Returns True if debug statements are written, which is used as the debug flag of the bulletin.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def configureLogging(   LogPathname,                # Pathname of the log file
+                        Level = 'INFO',             # DEBUG, INFO, WARNING or ERROR
+                        MaxBytes = 5 * 1024 * 1024, # Size of the log file before it is rotated
+                        BackupCount = 5,            # Number of rotated log files that are kept
+                        ) :
+    Level = os.environ.get('BULLETIN_LOG_LEVEL', Level)
+    if type(Level) != type(1) : Level = getattr(logging, str(Level).upper(), logging.INFO)
+    for Handler in BulletinLog.handlers[:] :
+        BulletinLog.removeHandler(Handler)
+        Handler.close()
+    Handler = RotatingFileHandler(LogPathname, maxBytes = MaxBytes, backupCount = BackupCount)
+    Handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)-8s %(message)s'))
+    BulletinLog.addHandler(Handler)
+    BulletinLog.setLevel(Level)
+    return BulletinLog.isEnabledFor(logging.DEBUG)
+
+#########################################################################
+# Instrumentation
+#########################################################################
+
+# Statistics of each instrumented call since the last resetCallStats, keyed by call name. Each value is [Calls, Rows, TotalSeconds,
+#   MaxSeconds]. The retrieve functions, checkTs and loadProperties are instrumented at the end of this file, and the
+#   DBAPI.open, CwmsDb.get, CwmsDb.getPathnameList and RatingSet.fromDatabase calls are timed with timeCall. The time of a function
+#   includes the instrumented calls it makes, and the times of calls made by several threads add up, so the total can be more than the
+#   run time.
+CallStats = {}
+CallStatsLock = threading.Lock()
+
+# resetCallStats Function   : Clears the call statistics. Called at the start of each bulletin, so a bulletin server reports each run
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def resetCallStats() :
+    CallStatsLock.acquire()
+    try : CallStats.clear()
+    finally : CallStatsLock.release()
+
+# countRows Function        : Returns the number of rows in the result of a call. A list, tuple or dictionary counts its items, a time
+#                               series container counts its values, None counts 0 and any other result counts 1.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def countRows(  Result, # Result of the call
+                ) :
+    if Result == None : return 0
+    if isinstance(Result, (list, tuple, dict, set)) : return len(Result)
+    if isinstance(Result, TimeSeriesContainer) : return Result.numberValues
+    return 1
+
+# recordCall Function       : Adds one call to the call statistics
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def recordCall( Name,       # Call name, e.g. retrieveNWSDay1 or CwmsDb.get
+                Seconds,    # Latency of the call
+                Rows,       # Number of rows returned by the call
+                ) :
+    CallStatsLock.acquire()
+    try :
+        Stats = CallStats.get(Name)
+        if Stats == None : CallStats[Name] = [1, Rows, Seconds, Seconds]
+        else :
+            Stats[0] += 1
+            Stats[1] += Rows
+            Stats[2] += Seconds
+            if Seconds > Stats[3] : Stats[3] = Seconds
+    finally :
+        CallStatsLock.release()
+
+# timeCall Function         : Calls a function, adds the call to the call statistics and the trace and returns the result. Used for the
+#                               java calls that cannot be instrumented, e.g. timeCall('CwmsDb.get', CwmsDb.get, TscPathname, StartTimeStr,
+#                               EndTimeStr)
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def timeCall(   Name,           # Call name
+                Function,       # Function or java method to call
+                *Arguments,     # Arguments of the function
+                **Keywords      # Keyword arguments of the function
+                ) :
+    StartTime = time.time()
+    Result = None
+    try :
+        Result = Function(*Arguments, **Keywords)
+        return Result
+    finally :
+        EndTime = time.time()
+        recordCall(Name, EndTime - StartTime, countRows(Result))
+        traceEvent(Name, StartTime, EndTime, spanAttributes())
+
+# instrumented Function     : Returns a function that calls Function through timeCall
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def instrumented(   Function,   # Function to instrument
+                    Name,       # Call name
+                    ) :
+    def InstrumentedFunction(*Arguments, **Keywords) : return timeCall(Name, Function, *Arguments, **Keywords)
+    InstrumentedFunction.__name__ = Function.__name__
+    InstrumentedFunction.__doc__ = Function.__doc__
+    InstrumentedFunction.Function = Function
+    return InstrumentedFunction
+
+# getCallSummary Function   : Returns the call statistics as a list of dictionaries sorted by total time, the slowest first
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def getCallSummary() :
+    CallStatsLock.acquire()
+    try : Items = [(Name, list(Stats)) for Name, Stats in CallStats.items()]
+    finally : CallStatsLock.release()
+    Summary = [{'Name' : Name, 'Calls' : Calls, 'Rows' : Rows, 'TotalSeconds' : round(TotalSeconds, 6), 'MaxSeconds' : round(MaxSeconds, 6),
+        'AverageSeconds' : round(TotalSeconds / Calls, 6)} for Name, (Calls, Rows, TotalSeconds, MaxSeconds) in Items]
+    Summary.sort(key = lambda Call : Call['TotalSeconds'], reverse = True)
+    return Summary
+
+# logCallSummary Function   : Prints the call statistics as a table sorted by total time, writes the table to the bulletin log and writes
+#                               the statistics to a json file
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def logCallSummary( Pathname,   # Pathname of the json file. Set to None to only log the table
+                    ) :
+    Summary = getCallSummary()
+    Lines = ['Call summary sorted by total time', '%-32s%8s%10s%12s%12s%12s' % ('Call', 'Calls', 'Rows', 'Total (s)', 'Max (s)', 'Avg (ms)')]
+    for Call in Summary :
+        Lines.append('%-32s%8d%10d%12.3f%12.3f%12.2f' % (Call['Name'], Call['Calls'], Call['Rows'], Call['TotalSeconds'], Call['MaxSeconds'],
+            Call['AverageSeconds'] * 1000.))
+    for Line in Lines : print Line
+    BulletinLog.info('\n'.join(Lines))
+    if Pathname :
+        SummaryFile = open(Pathname, 'w')
+        try : json.dump({'Created' : time.strftime('%Y-%m-%d %H:%M:%S'), 'Calls' : Summary}, SummaryFile, indent = 2)
+        finally : SummaryFile.close()
+    return Summary
+
+#########################################################################
+# Tracing
+#########################################################################
+
+# Trace of the run in the Chrome trace event format, written by writeTrace. Open the file in chrome://tracing or https://ui.perfetto.dev.
+#   Each span is a complete event, so the viewer nests the spans of each thread by their times. Events are only kept between resetTrace
+#   and writeTrace, so scripts that do not write a trace do not collect events in a bulletin server.
+TraceEvents = []
+TraceThreads = set()    # Threads with a thread name event
+TraceLock = threading.Lock()
+TraceStack = threading.local()  # Open spans of each thread
+TraceState = {'Root' : None, 'JvmTraced' : False}
+
+# Time Server_Utils was imported. The JVM start span of the first trace in the process ends here
+ImportTime = time.time()
+
+# TraceSpan Class           : Span that was started and not ended yet
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+class TraceSpan(object) :
+    __slots__ = ('Name', 'StartTime', 'Attributes')
+
+    def __init__(   self,
+                    Name,       # Name of the span, e.g. table1Data
+                    Attributes, # Dictionary of attributes shown with the span, e.g. DataBlock and Project
+                    ) :
+        self.Name = Name
+        self.StartTime = time.time()
+        self.Attributes = Attributes
+
+# openSpans Function        : Returns the list of the spans the current thread has open, the innermost last
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def openSpans() :
+    try : return TraceStack.Spans
+    except AttributeError :
+        TraceStack.Spans = []
+        return TraceStack.Spans
+
+# spanAttributes Function   : Returns a copy of the attributes of the innermost open span of the current thread
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def spanAttributes() :
+    Spans = openSpans()
+    if len(Spans) == 0 : return {}
+    return dict(Spans[-1].Attributes)
+
+# traceEvent Function       : Adds a complete event to the trace
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def traceEvent( Name,       # Name of the event
+                StartTime,  # Start time in seconds since epoch
+                EndTime,    # End time in seconds since epoch
+                Attributes, # Dictionary of attributes
+                ) :
+    if TraceState['Root'] == None : return
+    ThreadId = thread.get_ident()
+    Event = {   'name' : Name, 'cat' : 'bulletin', 'ph' : 'X', 'pid' : os.getpid(), 'tid' : ThreadId, 'ts' : int(StartTime * 1000000),
+                'dur' : max(int((EndTime - StartTime) * 1000000), 0),
+                'args' : dict([(str(Key), str(Value)) for Key, Value in Attributes.items()])}
+    TraceLock.acquire()
+    try :
+        if ThreadId not in TraceThreads :
+            TraceThreads.add(ThreadId)
+            TraceEvents.append({'name' : 'thread_name', 'ph' : 'M', 'pid' : os.getpid(), 'tid' : ThreadId,
+                'args' : {'name' : threading.currentThread().getName()}})
+        TraceEvents.append(Event)
+    finally :
+        TraceLock.release()
+
+# startSpan Function        : Starts a span in the current thread and returns it. The span has the attributes of the span it is in, so
+#                               the calls made for a project are shown with the data block and the project. End it with endSpan.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def startSpan(  Name,           # Name of the span
+                **Attributes    # Attributes of the span, e.g. DataBlock = 'Table1Data1'
+                ) :
+    SpanAttributes = spanAttributes()
+    SpanAttributes.update(Attributes)
+    Span = TraceSpan(Name, SpanAttributes)
+    openSpans().append(Span)
+    return Span
+
+# endSpan Function          : Ends a span and adds it to the trace
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def endSpan(    Span,           # TraceSpan from startSpan
+                **Attributes    # Attributes added to the span, e.g. the number of rows
+                ) :
+    Spans = openSpans()
+    for x in range(len(Spans) - 1, -1, -1) :
+        if Spans[x] is Span :
+            del Spans[x]
+            break
+    Span.Attributes.update(Attributes)
+    traceEvent(Span.Name, Span.StartTime, time.time(), Span.Attributes)
+
+# span Function             : Context manager that traces the statements in the with block, e.g.
+#                               with span('table1Data', DataBlock = 'Table1Data1') : table1Data(...)
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+@contextmanager
+def span(   Name,           # Name of the span
+            **Attributes    # Attributes of the span
+            ) :
+    Span = startSpan(Name, **Attributes)
+    try : yield Span
+    finally : endSpan(Span)
+
+# resetTrace Function       : Clears the trace and starts the span of the whole run. The first trace of the process starts with a span from
+#                               the start of the JVM to the import of Server_Utils. Called at the start of each bulletin.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def resetTrace( Name,   # Name of the run, e.g. MVS_WebRep_Bulletin
+                ) :
+    TraceLock.acquire()
+    try :
+        del TraceEvents[:]
+        TraceThreads.clear()
+    finally :
+        TraceLock.release()
+    TraceStack.Spans = []
+    TraceState['Root'] = startSpan(Name)
+    if not TraceState['JvmTraced'] :
+        TraceState['JvmTraced'] = True
+        try : traceEvent('JVM start', ManagementFactory.getRuntimeMXBean().getStartTime() / 1000., ImportTime, {})
+        except : pass
+
+# writeTrace Function       : Ends the span of the run and writes the trace to a json file. No more events are kept until resetTrace.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def writeTrace( Pathname,   # Pathname of the trace file
+                ) :
+    if TraceState['Root'] == None : return
+    endSpan(TraceState['Root'])
+    TraceState['Root'] = None
+    TraceLock.acquire()
+    try : Events = list(TraceEvents)
+    finally : TraceLock.release()
+    TraceFile = open(Pathname, 'w')
+    try : json.dump({'traceEvents' : Events, 'displayTimeUnit' : 'ms'}, TraceFile)
+    finally : TraceFile.close()
+
+#########################################################################
+# Statement Cache
+#########################################################################
+
+# Maximum number of prepared statements kept open for each connection. The least recently used statement is closed when the cache is full.
+StatementCacheSize = 100
+
+# Statement cache of each connection, keyed by connection. Each cache is an OrderedDict of CachedStatement keyed by sql. A connection is
+#   only used by one thread at a time, so only adding and removing the caches is locked.
+StatementCaches = {}
+StatementCacheLock = threading.Lock()
+
+# CachedStatement Class     : Wraps a prepared statement that is kept in the statement cache. Calling close() only clears the parameters
+#                               so the retrieve functions can keep closing their statements. close() also closes the result set of the
+#                               last executeQuery, so the result set is never read after the connection was returned to a
+#                               ConnectionPool. If the connection was borrowed from a ConnectionPool, close() also returns the
+#                               connection to the pool. The statement is closed by
+#                               closeStatementCache.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+class CachedStatement :
+    def __init__(   self,
+                    Statement,  # java.sql.PreparedStatement
+                    conn,       # SQL connection of the statement
+                    ) :
+        self.Statement = Statement
+        self.Connection = conn
+        self.Pool = None
+        self.ResultSet = None
+
+    def __getattr__(self, Name) :
+        return getattr(self.Statement, Name)
+
+    def executeQuery(self) :
+        self.ResultSet = self.Statement.executeQuery()
+        return self.ResultSet
+
+    def close(self) :
+        if self.ResultSet != None :
+            ResultSet, self.ResultSet = self.ResultSet, None
+            try : ResultSet.close()
+            except : pass
+        try : self.Statement.clearParameters()
+        except : pass
+        if self.Pool != None :
+            Pool, self.Pool = self.Pool, None
+            Pool.release(self.Connection)
+
+# prepareStatement Function : Returns a prepared statement for the connection and sql from the statement cache of the connection. The
+#                               statement is prepared the first time the sql is used on the connection. conn can be a ConnectionPool, in
+#                               which case a connection is borrowed until the statement is closed.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def prepareStatement(   conn,       # SQL connection or ConnectionPool
+                        Sql,        # SQL text
+                        ) :
+    Pool = None
+    if isinstance(conn, ConnectionPool) : Pool, conn = conn, conn.borrow()
+    try :
+        StatementCacheLock.acquire()
+        try : Cache = StatementCaches.setdefault(conn, OrderedDict())
+        finally : StatementCacheLock.release()
+        Statement = Cache.pop(Sql, None)
+        if Statement == None :
+            Statement = CachedStatement(conn.prepareStatement(Sql), conn)
+            while len(Cache) >= StatementCacheSize :
+                OldSql, OldStatement = Cache.popitem(last = False)
+                try : OldStatement.Statement.close()
+                except : pass
+        Cache[Sql] = Statement # Most recently used statement is at the end
+    except :
+        if Pool != None : Pool.release(conn)
+        raise
+    Statement.Pool = Pool
+    return Statement
+
+# closeStatementCache Function  : Closes the cached statements. Only the statements for conn are closed if conn is given. Call it in
+#                                   the bulletin finally block before the connection is closed. The statements of pooled connections are
+#                                   closed by the pool when it closes the connection, so nothing is done for a ConnectionPool.
+# Author/Editor                 : Ivan Nguyen
+# Last updated                  : 10-18-2026
+
+def closeStatementCache(    conn = None,    # SQL connection
+                            ) :
+    if isinstance(conn, ConnectionPool) : return
+    StatementCacheLock.acquire()
+    try :
+        if conn == None : CacheList = StatementCaches.values(); StatementCaches.clear()
+        else : CacheList = [StatementCaches.pop(conn, {})]
+    finally :
+        StatementCacheLock.release()
+    for Cache in CacheList :
+        for Statement in Cache.values() :
+            try : Statement.Statement.close()
+            except : pass
+
+#########################################################################
+# Connection Pool
+#########################################################################
+
+# Default number of connections in a pool. Each connection is a database session, so keep it small for the shared CWMS database.
+ConnectionPoolSize = 4
+
+# ConnectionPool Class      : Bounded pool of database connections that are shared by the retrieve functions, the bulletins in a
+#                               BulletinServer.py process and the threads of a bulletin. Each connection keeps its own statement cache.
+#                               Connections are validated when they are borrowed, and connections that are idle longer than IdleSeconds
+#                               are closed. Pass the pool as conn to the retrieve functions, or use borrowConnection for other queries.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+class ConnectionPool :
+    def __init__(   self,
+                    debug,                              # Set to True to print all debug statements
+                    OfficeId = 'MVS',                   # Office id of the connections
+                    MaxConnections = ConnectionPoolSize,# Maximum number of open connections
+                    IdleSeconds = 10 * 60,              # Seconds a connection can be idle before it is closed
+                    ValidateSeconds = 5,                # Seconds to wait for a borrowed connection to be validated
+                    BorrowTimeout = 10 * 60,            # Seconds to wait for a connection when all of them are in use
+                    TimeZoneId = 'US/Central',          # Time zone of the DBAPI objects
+                    ) :
+        self.debug = debug
+        self.OfficeId, self.MaxConnections, self.IdleSeconds = OfficeId, MaxConnections, IdleSeconds
+        self.ValidateSeconds, self.BorrowTimeout, self.TimeZoneId = ValidateSeconds, BorrowTimeout, TimeZoneId
+        self.Condition = threading.Condition()
+        self.IdleList = []      # List of [Last used time, connection], the most recently used connection is at the end
+        self.CwmsDbs = {}       # DBAPI object of each open connection, keyed by connection
+        self.Size = 0           # Number of open connections and connections being opened
+        self.Closed = False
+
+    # Opens a new connection. The DBAPI object is kept so it can be closed with the connection
+    def open(self) :
+        import DBAPI
+        CwmsDb = timeCall('DBAPI.open', DBAPI.open)
+        CwmsDb.setOfficeId(self.OfficeId)
+        CwmsDb.setTimeZone(self.TimeZoneId)
+        CwmsDb.setTrimMissing(False)
+        conn = CwmsDb.getConnection()
+        self.Condition.acquire()
+        try : self.CwmsDbs[conn] = CwmsDb
+        finally : self.Condition.release()
+        if self.debug : outputDebug(self.debug, 'Opened pooled connection for ', self.OfficeId)
+        return conn
+
+    # Returns the DBAPI object of a borrowed connection, e.g. for CwmsDb.getPathnameList()
+    def getCwmsDb(self, conn) :
+        return self.CwmsDbs[conn]
+
+    # Closes a connection and its statements and makes room for a new connection
+    def discard(self, conn) :
+        closeStatementCache(conn)
+        self.Condition.acquire()
+        try :
+            CwmsDb = self.CwmsDbs.pop(conn, None)
+            self.Size -= 1
+            self.Condition.notify()
+        finally :
+            self.Condition.release()
+        try : CwmsDb.done()
+        except : pass
+        try : conn.close()
+        except : pass
+
+    # Closes the connections that have been idle longer than IdleSeconds
+    def evictIdle(self) :
+        self.Condition.acquire()
+        try :
+            EvictList = [conn for LastUsed, conn in self.IdleList if time.time() - LastUsed > self.IdleSeconds]
+            self.IdleList = [Idle for Idle in self.IdleList if Idle[1] not in EvictList]
+        finally :
+            self.Condition.release()
+        for conn in EvictList : self.discard(conn)
+
+    # Returns a valid connection. Waits up to BorrowTimeout seconds if all of the connections are in use
+    def borrow(self) :
+        Deadline = time.time() + self.BorrowTimeout
+        while True :
+            self.evictIdle()
+            conn = None
+            self.Condition.acquire()
+            try :
+                while not self.Closed and len(self.IdleList) == 0 and self.Size >= self.MaxConnections :
+                    if time.time() >= Deadline : raise RuntimeError('Timed out waiting for a %s database connection' % self.OfficeId)
+                    self.Condition.wait(Deadline - time.time())
+                if self.Closed : raise RuntimeError('The %s connection pool is closed' % self.OfficeId)
+                if len(self.IdleList) > 0 : conn = self.IdleList.pop()[1]
+                else : self.Size += 1
+            finally :
+                self.Condition.release()
+            if conn == None :
+                try : return self.open()
+                except :
+                    self.Condition.acquire()
+                    try :
+                        self.Size -= 1
+                        self.Condition.notify()
+                    finally :
+                        self.Condition.release()
+                    raise
+            try : Valid = not conn.isClosed() and conn.isValid(self.ValidateSeconds)
+            except : Valid = False
+            if Valid : return conn
+            if self.debug : outputDebug(self.debug, 'Discarding invalid pooled connection')
+            self.discard(conn)
+
+    # Returns a borrowed connection to the pool
+    def release(self, conn) :
+        self.Condition.acquire()
+        try :
+            if not self.Closed :
+                self.IdleList.append([time.time(), conn])
+                self.Condition.notify()
+                return
+        finally :
+            self.Condition.release()
+        self.discard(conn)
+
+    # Closes the idle connections. Borrowed connections are closed when they are released
+    def close(self) :
+        self.Condition.acquire()
+        try :
+            self.Closed = True
+            IdleList, self.IdleList = self.IdleList, []
+            self.Condition.notifyAll()
+        finally :
+            self.Condition.release()
+        for LastUsed, conn in IdleList : self.discard(conn)
+
+# Connection pools shared by everything in the process, keyed by office id
+ConnectionPools = {}
+
+# getConnectionPool Function    : Returns the shared connection pool of the office. The pool is created the first time it is used and
+#                                   is closed when the process exits.
+# Author/Editor                 : Ivan Nguyen
+# Last updated                  : 10-18-2026
+
+def getConnectionPool(  debug,                              # Set to True to print all debug statements
+                        OfficeId = 'MVS',                   # Office id of the connections
+                        MaxConnections = ConnectionPoolSize,# Maximum number of open connections
+                        ) :
+    StatementCacheLock.acquire()
+    try :
+        Pool = ConnectionPools.get(OfficeId)
+        if Pool == None or Pool.Closed :
+            Pool = ConnectionPools[OfficeId] = ConnectionPool(debug, OfficeId, MaxConnections)
+            atexit.register(Pool.close)
+    finally :
+        StatementCacheLock.release()
+    return Pool
+
+# borrowConnection Function : Context manager that borrows a connection from a pool for queries that do not use prepareStatement, e.g.
+#                               with borrowConnection(conn) as PoolConn : RatingSet.fromDatabase(PoolConn, RatingId). A plain
+#                               connection is used as is.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+@contextmanager
+def borrowConnection(   conn,   # SQL connection or ConnectionPool
+                        ) :
+    if not isinstance(conn, ConnectionPool) :
+        yield conn
+        return
+    PoolConn = conn.borrow()
+    try :
+        yield PoolConn
+    finally :
+        conn.release(PoolConn)
+
+#########################################################################
+# Concurrent Queries
+#########################################################################
+
+# Default number of queries that run at the same time. Keep it at or below the connection pool size so the shared database is not
+#   overloaded and the workers do not wait for connections.
+QueryConcurrency = ConnectionPoolSize
+
+# QueryFuture Class         : Result of a query that was submitted to a QueryExecutor. result() waits for the query and returns its
+#                               value, or raises the exception of the query, so the caller handles errors the same way as a direct call.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+class QueryFuture :
+    def __init__(self) :
+        self.Finished = threading.Event()
+        self.Value = None
+        self.Error = None
+
+    def done(self) :
+        return self.Finished.isSet()
+
+    def result(self, Timeout = None) :
+        self.Finished.wait(Timeout)
+        if not self.Finished.isSet() : raise RuntimeError('Timed out waiting for the query')
+        if self.Error != None : raise self.Error[0], self.Error[1], self.Error[2]
+        return self.Value
+
+# QueryExecutor Class       : Runs independent queries in up to MaxWorkers threads. Jython threads run in parallel on the JVM, so the
+#                               time of a group of queries is close to the time of the slowest queries instead of their sum. Pass a
+#                               ConnectionPool as conn to the retrieve functions, so each thread borrows its own connection.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+class QueryExecutor :
+    def __init__(   self,
+                    MaxWorkers = QueryConcurrency,   # Maximum number of queries that run at the same time
+                    ) :
+        self.MaxWorkers = max(1, MaxWorkers)
+        self.Queue = Queue()
+        self.Workers = []
+
+    # Queues Function(*Args, **Kwargs) and returns its QueryFuture. A worker is started for each call until there are MaxWorkers
+    def submit(self, Function, *Args, **Kwargs) :
+        Future = QueryFuture()
+        self.Queue.put((Future, Function, Args, Kwargs))
+        if len(self.Workers) < self.MaxWorkers :
+            Worker = threading.Thread(target = self.work)
+            Worker.setDaemon(True)
+            Worker.start()
+            self.Workers.append(Worker)
+        return Future
+
+    def work(self) :
+        while True :
+            Item = self.Queue.get()
+            if Item == None : return
+            Future, Function, Args, Kwargs = Item
+            try : Future.Value = Function(*Args, **Kwargs)
+            except : Future.Error = sys.exc_info()
+            Future.Finished.set()
+
+    # Waits for the queued queries to finish and stops the workers
+    def shutdown(self) :
+        for Worker in self.Workers : self.Queue.put(None)
+        for Worker in self.Workers : Worker.join()
+        self.Workers = []
+
+    def __enter__(self) :
+        return self
+
+    def __exit__(self, ExceptionType, ExceptionValue, ExceptionTraceback) :
+        self.shutdown()
+        return False
+
+# fetchConcurrently Function    : Runs a dictionary of independent calls, {Key : (Function, Arg1, Arg2, ...)}, with a QueryExecutor and
+#                                   waits for all of them. Returns {Key : QueryFuture}. An exception of a call is raised by its result().
+# Author/Editor                 : Ivan Nguyen
+# Last updated                  : 10-18-2026
+
+def fetchConcurrently(  debug,                          # Set to True to print all debug statements
+                        Calls,                          # Dictionary of (Function, Arg1, Arg2, ...) tuples
+                        MaxWorkers = QueryConcurrency,  # Maximum number of queries that run at the same time
+                        ) :
+    StartTime = time.time()
+    Futures = {}
+    with QueryExecutor(MaxWorkers) as Executor :
+        for Key, Call in Calls.items() : Futures[Key] = Executor.submit(Call[0], *Call[1 :])
+    outputDebug(debug, 'Ran %d queries with %d workers in %.2f seconds' % (len(Calls), MaxWorkers, time.time() - StartTime))
+    return Futures
+
+# retrieveTimeSeries Function   : Retrieves a time series container with CwmsDb.get. If conn is a ConnectionPool, a connection is
+#                                   borrowed and its own DBAPI object is used, so the time series can be retrieved from several threads.
+# Author/Editor                 : Ivan Nguyen
+# Last updated                  : 10-18-2026
+
+def retrieveTimeSeries( debug,          # Set to True to print all debug statements
+                        conn,           # SQL connection or ConnectionPool
+                        CwmsDb,         # DBAPI object. Only used when conn is not a ConnectionPool
+                        TscPathname,    # Full name of the time series
+                        StartTimeStr,   # Start of the time window formatted as ddMonYYYY HHMM
+                        EndTimeStr,     # End of the time window formatted as ddMonYYYY HHMM
+                        ) :
+    if not isinstance(conn, ConnectionPool) : return timeCall('CwmsDb.get', CwmsDb.get, TscPathname, StartTimeStr, EndTimeStr)
+    with borrowConnection(conn) as PoolConn :
+        return timeCall('CwmsDb.get', conn.getCwmsDb(PoolConn).get, TscPathname, StartTimeStr, EndTimeStr)
+
+#########################################################################
+# Ratings
+#########################################################################
+
+# Ratings loaded from the database, keyed by rating id. The effective time is set on the RatingSet each time it is used, so a bulletin
+#   server keeps one RatingSet per rating. The lock is held while a rating is loaded and while a value time is set and rated with it
+RatingCache = {}
+RatingLock = threading.RLock()
+
+# getRatingSet Function     : Returns the RatingSet for the rating id from the rating cache with its default value time set to the
+#                               effective time. The rating is loaded from the database the first time it is used. Callers that rate with
+#                               the RatingSet hold RatingLock, so another thread does not change the time before the values are rated.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def getRatingSet(   debug,                      # Set to True to print all debug statements
+                    conn,                       # SQL connection
+                    RatingId,                   # Rating specification id, e.g. 'Fort Peck Dam.Elev;Stor.Linear.Step'
+                    EffectiveTime,              # Time of the rating in milliseconds since epoch
+                    LoadMethod = 'reference',   # Load methods can be 'eager', 'lazy', or 'reference'. 'reference' is what CCP currently
+                                                #   uses (11-17-2017) and seems to work the fastest
+                    ) :
+    RatingLock.acquire()
+    try :
+        if RatingId not in RatingCache :
+            System.setProperty('hec.data.cwmsRating.RatingSet.databaseLoadMethod', LoadMethod)
+            with borrowConnection(conn) as PoolConn :
+                RatingCache[RatingId] = timeCall('RatingSet.fromDatabase', RatingSet.fromDatabase, PoolConn, RatingId)
+            outputDebug(debug, 'Loaded rating ', RatingId)
+        Rating = RatingCache[RatingId]
+        Rating.setDefaultValueTime(EffectiveTime)
+        return Rating
+    finally :
+        RatingLock.release()
+
+# rateValues Function       : Rates a list of values with one call against the cached rating. Returns a list of rated values.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def rateValues( debug,          # Set to True to print all debug statements
+                conn,           # SQL connection
+                RatingId,       # Rating specification id
+                Values,         # List of independent values
+                EffectiveTime,  # Time of the rating in milliseconds since epoch
+                ) :
+    if len(Values) == 0 : return []
+    RatingLock.acquire()
+    try :
+        Rating = getRatingSet(debug, conn, RatingId, EffectiveTime)
+        return list(Rating.rate(array([float(Value) for Value in Values], 'd')))
+    finally :
+        RatingLock.release()
+
+# retrieveRatingIds Function    : Retrieves the rating ids of the office that match the rating templates, e.g. '%s.Elev;Stor.Linear.Step'
+# Author/Editor                 : Ivan Nguyen
+# Last updated                  : 10-18-2026
+
+def retrieveRatingIds(  debug,          # Set to True to print all debug statements
+                        conn,           # SQL connection
+                        TemplateList,   # List of rating pathnames with %s for the location
+                        OfficeId = 'MVS', # Office of the ratings
+                        ) :
+    RatingIdList = []
+    for Template in TemplateList :
+        try :
+            stmt = prepareStatement(conn, '''
+                                        select rating_id from CWMS_20.AV_RATING_SPEC
+                                        where office_id = :1 and rating_id like :2
+                                        order by rating_id
+                                        ''')
+            stmt.setString(1, OfficeId)
+            stmt.setString(2, Template.replace('%s', '%'))
+            rs = stmt.executeQuery()
+            while rs.next() :
+                RatingIdList.append(str(rs.getString(1)))
+        finally :
+            try : stmt.close()
+            except : pass
+            try : rs.close()
+            except : pass
+    outputDebug(debug, 'Found %d rating ids' % len(RatingIdList))
+    return RatingIdList
+
+# exportRatingTables Function   : Loads the ratings from the database and writes the rating table values of every effective date to a json
+#                                   file that Rating_Utils.py can rate against without a database connection. Ratings that are not tables
+#                                   (e.g. expression ratings) are skipped, and so are USGS stream ratings, because their shifts and offsets
+#                                   are not in the base table and the exported table would rate wrong values.
+# Author/Editor                 : Ivan Nguyen
+# Last updated                  : 10-18-2026
+
+def exportRatingTables( debug,          # Set to True to print all debug statements
+                        conn,           # SQL connection or ConnectionPool
+                        RatingIdList,   # List of rating ids
+                        Pathname,       # Pathname of the rating tables json file
+                        ) :
+    RatingData = {'Exported' : int(time.time() * 1000), 'Ratings' : {}}
+    System.setProperty('hec.data.cwmsRating.RatingSet.databaseLoadMethod', 'eager') # All of the rating values are needed
+    with borrowConnection(conn) as PoolConn :
+        for RatingId in RatingIdList :
+            try :
+                RatingList = []
+                for Rating in timeCall('RatingSet.fromDatabase', RatingSet.fromDatabase, PoolConn, RatingId).getRatings() :
+                    if hasattr(Rating, 'getShifts') :
+                        outputDebug(debug, 'Skipped stream rating ', RatingId, ', its shifts and offsets are not exported')
+                        continue
+                    try : RatingValues = Rating.getRatingValues()
+                    except AttributeError : continue
+                    if RatingValues == None : continue
+                    try : Method = str(Rating.getInRangeMethod())
+                    except : Method = 'LINEAR'
+                    try : Units = str(Rating.getRatingUnitsId())
+                    except : Units = ''
+                    RatingList.append({ 'EffectiveDate'     :   Rating.getEffectiveDate(),
+                                        'Method'            :   Method,
+                                        'Units'             :   Units,
+                                        'Ind'               :   [Value.getIndValue() for Value in RatingValues],
+                                        'Dep'               :   [Value.getDepValue() for Value in RatingValues],
+                                        })
+                if len(RatingList) > 0 : RatingData['Ratings'][RatingId] = RatingList
+            except Exception, e :
+                outputDebug(debug, 'Could not export %s : %s' % (RatingId, e))
+
+    TempPathname = '%s.%d.tmp' % (Pathname, os.getpid())
+    RatingFile = open(TempPathname, 'w')
+    try : json.dump(RatingData, RatingFile, separators = (',', ':'), sort_keys = True)
+    finally : RatingFile.close()
+    if os.name == 'nt' and os.path.exists(Pathname) : os.remove(Pathname)
+    os.rename(TempPathname, Pathname)
+    outputDebug(debug, 'Exported %d ratings to %s' % (len(RatingData['Ratings']), Pathname))
+    return len(RatingData['Ratings'])
 
 #########################################################################
 # Webrep Report
@@ -317,7 +1222,7 @@ def retrieveElevatonDatum( debug,                   # Set to True to print all d
                             BaseLocation,   # Full name of time series container
                             ) :
     try :
-        stmt = conn.prepareStatement('''
+        stmt = prepareStatement(conn, '''
                                     select distinct
                                     bl.elevation as base_location_elevation
                                     from cwms_v_loc loc
@@ -344,26 +1249,40 @@ def retrieveElevatonDatum( debug,                   # Set to True to print all d
     return ElevationDatum
 
 
+# timeZoneName Function : Returns the name of a time zone given as a name or as a CwmsDb. The bulletins written before the level
+#                           functions took a time zone name still pass their CwmsDb
+# Author/Editor         : Ivan Nguyen
+# Last updated          : 10-18-2026
+
+def timeZoneName(   TimeZone,   # Time zone name, e.g. 'US/Central', or a CwmsDb
+                    ) :
+    if hasattr(TimeZone, 'getTimeZoneName') : return TimeZone.getTimeZoneName()
+    return TimeZone
+
+
 def retrieveLocationLevel( debug,                   # Set to True to print all debug statements
                             conn,           # SQL connection
-                            CwmsDb,         # DBAPI connection
+                            TimeZoneId,     # Time zone of the level values, e.g. CwmsDb.getTimeZoneName(), or the CwmsDb
+                                            #   the zone is read from
                             TscFullName,    # Full name of time series container
+                            LevelTimeStr = None, # Time of the level value formatted as ddMonYYYY HHMM, e.g. the bulletin date at 0000.
+                                            #   Today at 0000 if not given
                             ) :
     import datetime
-    print '================= Server_Utils START'
-    outputDebug(debug, lineNo(), 'conn = ', str(conn) )
-    outputDebug(debug, lineNo(), 'cwmsdb = ', str(CwmsDb))
-    outputDebug(debug, lineNo(), 'tscpathname = ', str(TscFullName))
+    outputDebug(debug, 'conn = ', conn)
+    TimeZoneId = timeZoneName(TimeZoneId)
+    outputDebug(debug, 'TimeZoneId = ', TimeZoneId)
+    outputDebug(debug, 'tscpathname = ', TscFullName)
 
-    CurDate         = datetime.datetime.now() # Current date
-    StartTimeStr    = CurDate.strftime('%d%b%Y ') + '0000' # Start date formatted as ddmmmyyy 0000
-    EndTimeStr      = CurDate.strftime('%d%b%Y ') + '0000' # End date formatted as ddmmmyyy 0000
+    if LevelTimeStr == None : LevelTimeStr = datetime.datetime.now().strftime('%d%b%Y ') + '0000' # Current date formatted as ddmmmyyy 0000
+    StartTimeStr    = LevelTimeStr # Start date formatted as ddmmmyyy 0000
+    EndTimeStr      = LevelTimeStr # End date formatted as ddmmmyyy 0000
 
     level_1a = TimeSeriesContainer()
     level_1a_parts = TscFullName.split('.')
     level_1aId_parts = level_1a_parts[:]
     level_1aId = '.'.join(level_1aId_parts)  
-    outputDebug(debug, lineNo(), 'level_1a_parts = ', level_1a_parts, '\tlevel_1aId_parts = ', level_1aId_parts, '\tlevel_1aId = ', level_1aId)
+    outputDebug(debug, 'level_1a_parts = ', level_1a_parts, '\tlevel_1aId_parts = ', level_1aId_parts, '\tlevel_1aId = ', level_1aId)
     level_1a.fullName  = TscFullName
     level_1a.location  = level_1a_parts[0]
     level_1a.parameter = level_1a_parts[1]
@@ -375,7 +1294,7 @@ def retrieveLocationLevel( debug,                   # Set to True to print all d
     level_1a.type      = 'INST-VAL'
     
     try :
-        stmt = conn.prepareStatement('''
+        stmt = prepareStatement(conn, '''
                               select * from table(cwms_level.retrieve_location_level_values(
                               p_location_level_id => :1,
                               p_level_units       => :2,
@@ -387,7 +1306,7 @@ def retrieveLocationLevel( debug,                   # Set to True to print all d
         stmt.setString(2, level_1a.units)
         stmt.setString(3, StartTimeStr)
         stmt.setString(4, EndTimeStr)
-        stmt.setString(5, CwmsDb.getTimeZoneName())
+        stmt.setString(5, TimeZoneId)
         rs = stmt.executeQuery()
         
         while rs.next() : 
@@ -397,32 +1316,34 @@ def retrieveLocationLevel( debug,                   # Set to True to print all d
         stmt.close()
         rs.close()
         
-    outputDebug(debug, lineNo(), 'LocationLevel = ', LocationLevel)
-    print '================= Server_Utils END'
+    outputDebug(debug, 'LocationLevel = ', LocationLevel)
     return LocationLevel
 
 
 def retrieveRecordStage( debug,                     # Set to True to print all debug statements
                            conn,           # SQL connection
-                           CwmsDb,         # DBAPI connection
+                           TimeZoneId,     # Time zone of the level values, e.g. CwmsDb.getTimeZoneName(), or the CwmsDb
+                                           #   the zone is read from
                            TscFullName,    # Full name of time series container
+                           LevelTimeStr = None, # Time of the level value formatted as ddMonYYYY HHMM, e.g. the bulletin date at 0000.
+                                           #   Today at 0000 if not given
                            ) :
     import datetime
     
-    outputDebug(debug, lineNo(), 'conn = ', str(conn) )
-    outputDebug(debug, lineNo(), 'cwmsdb = ', str(CwmsDb))
-    outputDebug(debug, lineNo(), 'tscpathname = ', str(TscFullName))
+    outputDebug(debug, 'conn = ', conn)
+    TimeZoneId = timeZoneName(TimeZoneId)
+    outputDebug(debug, 'TimeZoneId = ', TimeZoneId)
+    outputDebug(debug, 'tscpathname = ', TscFullName)
 
-    CurDate         = datetime.datetime.now() # Current date
-    StartTimeStr    = CurDate.strftime('%d%b%Y ') + '0000' # Start date formatted as ddmmmyyy 0000
-    EndTimeStr      = CurDate.strftime('%d%b%Y ') + '0000' # End date formatted as ddmmmyyy 0000
+    if LevelTimeStr == None : LevelTimeStr = datetime.datetime.now().strftime('%d%b%Y ') + '0000' # Current date formatted as ddmmmyyy 0000
+    StartTimeStr    = LevelTimeStr # Start date formatted as ddmmmyyy 0000
+    EndTimeStr      = LevelTimeStr # End date formatted as ddmmmyyy 0000
 
     level_1a = TimeSeriesContainer()
     level_1a_parts = TscFullName.split('.')
     level_1aId_parts = level_1a_parts[:]
     level_1aId = '.'.join(level_1aId_parts)
-    print '===========================Server_Utils'  
-    outputDebug(debug, lineNo(), 'level_1a_parts = ', level_1a_parts, '\tlevel_1aId_parts = ', level_1aId_parts, '\tlevel_1aId = ', level_1aId)
+    outputDebug(debug, 'level_1a_parts = ', level_1a_parts, '\tlevel_1aId_parts = ', level_1aId_parts, '\tlevel_1aId = ', level_1aId)
     level_1a.fullName  = TscFullName
     level_1a.location  = level_1a_parts[0]
     level_1a.parameter = level_1a_parts[1]
@@ -434,7 +1355,7 @@ def retrieveRecordStage( debug,                     # Set to True to print all d
     level_1a.type      = 'INST-VAL'
     
     try :
-        stmt = conn.prepareStatement('''
+        stmt = prepareStatement(conn, '''
                               select * from table(cwms_level.retrieve_location_level_values(
                               p_location_level_id => :1,
                               p_level_units       => :2,
@@ -446,7 +1367,7 @@ def retrieveRecordStage( debug,                     # Set to True to print all d
         stmt.setString(2, level_1a.units)
         stmt.setString(3, StartTimeStr)
         stmt.setString(4, EndTimeStr)
-        stmt.setString(5, CwmsDb.getTimeZoneName())
+        stmt.setString(5, TimeZoneId)
         rs = stmt.executeQuery()
         
         while rs.next() : 
@@ -456,7 +1377,7 @@ def retrieveRecordStage( debug,                     # Set to True to print all d
         stmt.close()
         rs.close()
         
-    outputDebug(debug, lineNo(), 'RecordStage = ', RecordStage)
+    outputDebug(debug, 'RecordStage = ', RecordStage)
     return RecordStage
 
 
@@ -466,7 +1387,7 @@ def retrieveRecordStageDate ( debug,                # Set to True to print all d
                                 ) :
     try :
         level_date = None
-        stmt = conn.prepareStatement('''
+        stmt = prepareStatement(conn, '''
                                     select to_char(level_date, 'MM-DD-YY') as level_date 
                                     from CWMS_20.AV_LOCATION_LEVEL where specified_level_id = 'Record Stage' and location_id = :1 and unit_system = 'EN' 
                                     FETCH FIRST 1 ROWS ONLY
@@ -489,7 +1410,7 @@ def retrieveLongName( debug,                        # Set to True to print all d
                         BaseLocation,   # Full name of time series container
                         ) :
     try :
-        stmt = conn.prepareStatement('''
+        stmt = prepareStatement(conn, '''
                                     select distinct
                                     bl.long_name as base_location_long_name
                                     from cwms_v_loc loc 
@@ -519,7 +1440,7 @@ def retrievePublicName( debug,                      # Set to True to print all d
                         BaseLocation,   # Full name of time series container
                         ) :
     try :
-        stmt = conn.prepareStatement('''
+        stmt = prepareStatement(conn, '''
                                     select distinct
                                     bl.public_name as base_location_public_name
                                     from cwms_v_loc loc 
@@ -549,7 +1470,7 @@ def retrieveRiverMile( debug,                       # Set to True to print all d
                         BaseLocation,   # Full name of time series container
                         ) :
     try :
-        stmt = conn.prepareStatement('''
+        stmt = prepareStatement(conn, '''
                                     select station from CWMS_20.AV_STREAM_LOCATION where location_id = :1 and unit_system = 'EN' and db_office_id = :2
                                     ''')   
         stmt.setString(1, BaseLocation)
@@ -572,7 +1493,7 @@ def retrieveCrest( debug,                           # Set to True to print all d
                      ) :
     try :
         Crest = None
-        stmt = conn.prepareStatement('''
+        stmt = prepareStatement(conn, '''
                                     select value
                                     from cwms_v_tsv_dqu 
                                     where cwms_ts_id like '%Stage.Inst.6Hours.0.RVFShef-FX' 
@@ -599,7 +1520,7 @@ def retrieveCrestDate( debug,                       # Set to True to print all d
                          ) :
     try :
         CrestDate=None
-        stmt = conn.prepareStatement('''
+        stmt = prepareStatement(conn, '''
                                     select to_char(date_time,'mm/dd am') as date_time
                                     from cwms_v_tsv_dqu 
                                     where cwms_ts_id like '%Stage.Inst.6Hours.0.RVFShef-FX' 
@@ -626,7 +1547,7 @@ def retrieveNWSDay1( debug,                         # Set to True to print all d
                        ) :
     try :
         Day1 = None
-        stmt = conn.prepareStatement('''
+        stmt = prepareStatement(conn, '''
                                     select value from cwms_v_tsv_dqu 
                                     where cwms_ts_id like '%Stage.Inst.6Hours.0.RVFShef-FF' 
                                     and cwms_ts_id like :1 || '%'
@@ -650,7 +1571,7 @@ def retrieveNWSDay1Date( debug,                     # Set to True to print all d
                            ) :
     try :
         Day1Date = None
-        stmt = conn.prepareStatement('''
+        stmt = prepareStatement(conn, '''
                                     select to_char(cwms_util.change_timezone(date_time, 'UTC', 'CST6CDT' ), 'mm-dd') as date_time
                                     from cwms_v_tsv_dqu 
                                     where cwms_ts_id like '%Stage.Inst.6Hours.0.RVFShef-FF' 
@@ -674,7 +1595,7 @@ def retrieveNWSForecastDate( debug,                 # Set to True to print all d
                         ) :
     try :
         NWSForecastDate=None
-        stmt = conn.prepareStatement('''
+        stmt = prepareStatement(conn, '''
                                     select to_char(data_entry_date, 'MM-DD-YYYY hh24:mi') as data_entry_date
                                     from cwms_v_tsv_dqu 
                                     where cwms_ts_id like '%Stage.Inst.6Hours.0.RVFShef-FF' 
@@ -699,7 +1620,7 @@ def retrieveNWSDay2( debug,                         # Set to True to print all d
                        ) :
     try :
         Day2 = None
-        stmt = conn.prepareStatement('''
+        stmt = prepareStatement(conn, '''
                                     select value from cwms_v_tsv_dqu 
                                     where cwms_ts_id like '%Stage.Inst.6Hours.0.RVFShef-FF' 
                                     and cwms_ts_id like :1 || '%'
@@ -724,7 +1645,7 @@ def retrieveNWSDay2Date( debug,                     # Set to True to print all d
                            ) :
     try :
         Day2Date = None
-        stmt = conn.prepareStatement('''
+        stmt = prepareStatement(conn, '''
                                     select to_char(cwms_util.change_timezone(date_time, 'UTC', 'CST6CDT' ), 'mm-dd') as date_time
                                     from cwms_v_tsv_dqu 
                                     where cwms_ts_id like '%Stage.Inst.6Hours.0.RVFShef-FF' 
@@ -748,7 +1669,7 @@ def retrieveNWSDay3( debug,                         # Set to True to print all d
                        ) :
     try :
         Day3 = None
-        stmt = conn.prepareStatement('''
+        stmt = prepareStatement(conn, '''
                                     select value from cwms_v_tsv_dqu 
                                     where cwms_ts_id like '%Stage.Inst.6Hours.0.RVFShef-FF' 
                                     and cwms_ts_id like :1 || '%'
@@ -772,7 +1693,7 @@ def retrieveNWSDay3Date( debug,                     # Set to True to print all d
                            ) :
     try :
         Day3Date = None
-        stmt = conn.prepareStatement('''
+        stmt = prepareStatement(conn, '''
                                     select to_char(cwms_util.change_timezone(date_time, 'UTC', 'CST6CDT' ), 'mm-dd') as date_time
                                     from cwms_v_tsv_dqu 
                                     where cwms_ts_id like '%Stage.Inst.6Hours.0.RVFShef-FF' 
@@ -795,7 +1716,7 @@ def retrieveGroup( debug,                           # Set to True to print all d
                      CategoryId,                    # Full name of time series container
                      ) :
     try :
-        stmt = conn.prepareStatement('''
+        stmt = prepareStatement(conn, '''
                                     select location_id from CWMS_20.AV_LOC_GRP_ASSGN where category_id = :1
                                     ''')   
         stmt.setString(1, CategoryId)
@@ -814,7 +1735,7 @@ def retrieveGroupLPMS( debug,                       # Set to True to print all d
                          conn,                      # 
                          ) :
     try :
-        stmt = conn.prepareStatement('''
+        stmt = prepareStatement(conn, '''
                                     select location_id from cwms_v_ts_id where cwms_ts_id like '%Stage.Inst.~2Hours.0.lpmsShef-raw'
                                     ''')   
         rs = stmt.executeQuery()
@@ -835,7 +1756,7 @@ def retrieveGageZero29( debug,                      # Set to True to print all d
                           BaseLocation,             # Full name of time series container
                           ) :
     try :
-        stmt = conn.prepareStatement('''
+        stmt = prepareStatement(conn, '''
                                     select constant_level from CWMS_20.AV_LOCATION_LEVEL where location_level_id = :1 || '.Height.Inst.0.NGVD29' and unit_system = 'EN'
                                     ''')   
         stmt.setString(1, BaseLocation)
@@ -856,7 +1777,7 @@ def retrieveBasin( debug,                           # Set to True to print all d
                      conn,                          #
                      ) :
     try :
-        stmt = conn.prepareStatement('''
+        stmt = prepareStatement(conn, '''
                                     select distinct group_id as basin from CWMS_V_LOC_GRP_ASSGN where category_id = 'RDL_Basins'
                                     ''')   
         rs = stmt.executeQuery()
@@ -874,7 +1795,7 @@ def retrieveLocationID( debug,                      # Set to True to print all d
                           Basin,                    # Full name of time series container
                           ) :
     try :
-        stmt = conn.prepareStatement('''
+        stmt = prepareStatement(conn, '''
                                     select location_id  from CWMS_V_LOC_GRP_ASSGN where category_id = 'RDL_Basins' and location_id in (select location_id from CWMS_V_LOC_GRP_ASSGN where category_id = 'RDL_River_Reservoir' and group_id = 'ALL') and group_id = :1 order by location_id asc
                                     ''')   
         stmt.setString(1, Basin)
@@ -896,7 +1817,7 @@ def retrieveLocationLevel2( debug,                  # Set to True to print all d
                         ) :
     try :
         Level = ''
-        stmt = conn.prepareStatement('''
+        stmt = prepareStatement(conn, '''
                                     select constant_level from CWMS_20.AV_LOCATION_LEVEL
                                     where specified_level_id = 'Flood' and location_id = :1 and unit_system = 'EN'
                                     ''')   
@@ -912,6 +1833,593 @@ def retrieveLocationLevel2( debug,                  # Set to True to print all d
     
     return Level
 
+#########################################################################
+# Bulk Retrieval
+#########################################################################
+
+# PathnameCatalog Class     : Loads the database pathname catalog once and indexes it. Membership checks use a set instead of
+#                               scanning the list from CwmsDb.getPathnameList() and the pathnames can be looked up by location and
+#                               parameter.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+class PathnameCatalog :
+    def __init__(   self,
+                    debug,          # Set to True to print all debug statements
+                    PathnameList,   # List of pathnames in the database from CwmsDb.getPathnameList()
+                    ) :
+        self.Pathnames = set()
+        self.LocationIndex = {}
+        for Pathname in PathnameList :
+            Pathname = str(Pathname)
+            self.Pathnames.add(Pathname)
+            PathnameParts = Pathname.split('.')
+            if len(PathnameParts) < 2 : continue
+            self.LocationIndex.setdefault(PathnameParts[0], {}).setdefault(PathnameParts[1], []).append(Pathname)
+        outputDebug(debug, 'Indexed %d pathnames for %d locations' % (len(self.Pathnames), len(self.LocationIndex)))
+
+    def __contains__(self, Pathname) :
+        return Pathname in self.Pathnames
+
+    def __len__(self) :
+        return len(self.Pathnames)
+
+    def __iter__(self) :
+        return iter(self.Pathnames)
+
+    # Returns the pathnames for a location. If a parameter is given, only the pathnames for that parameter are returned.
+    def locationPathnames(  self,
+                            Location,           # Location ID
+                            Parameter = None,   # Parameter, e.g. Stage
+                            ) :
+        LocationPathnames = self.LocationIndex.get(Location, {})
+        if Parameter != None : return list(LocationPathnames.get(Parameter, []))
+        PathnameList = []
+        for ParameterPathnames in LocationPathnames.values() : PathnameList.extend(ParameterPathnames)
+        return PathnameList
+
+    # Returns the pathnames that start with the prefix, e.g. 'St Louis-Mississippi.Stage.Inst'
+    def prefixPathnames(    self,
+                            Prefix,             # Start of the pathname
+                            ) :
+        Location = Prefix.split('.')[0]
+        return sorted([Pathname for Pathname in self.locationPathnames(Location) if Pathname.startswith(Prefix)])
+
+    # Returns the first candidate pathname that is in the database. If none of them are, the last candidate is returned.
+    def firstPathname(  self,
+                        CandidateList,      # Pathnames in order of preference
+                        ) :
+        for Pathname in CandidateList :
+            if Pathname in self.Pathnames : return Pathname
+        return CandidateList[-1]
+
+# Seconds a pathname catalog is reused by the bulletins that run in the same process, e.g. in BulletinServer.py
+PathnameCatalogTTL = 60 * 60
+
+# Pathname catalogs loaded during the run, keyed by office id. Each value is (load time, PathnameCatalog)
+PathnameCatalogCache = {}
+
+# loadPathnameCatalog Function  : Retrieves the pathname catalog from the database and indexes it. The catalog is reused until it is
+#                                   older than PathnameCatalogTTL, so a warm bulletin server only retrieves it once an hour.
+# Author/Editor                 : Ivan Nguyen
+# Last updated                  : 10-18-2026
+
+def loadPathnameCatalog(    debug,      # Set to True to print all debug statements
+                            CwmsDb,     # DBAPI object
+                            ) :
+    try : OfficeId = str(CwmsDb.getOfficeId())
+    except : OfficeId = None
+    LoadTime, Catalog = PathnameCatalogCache.get(OfficeId, (0, None))
+    if Catalog == None or time.time() - LoadTime > PathnameCatalogTTL :
+        Catalog = PathnameCatalog(debug, timeCall('CwmsDb.getPathnameList', CwmsDb.getPathnameList))
+        PathnameCatalogCache[OfficeId] = (time.time(), Catalog)
+    else : outputDebug(debug, 'Using the pathname catalog loaded %d seconds ago' % (time.time() - LoadTime))
+    return Catalog
+
+# getProjectList Function   : Collects the unique projects from every data block so they can be retrieved in bulk
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def getProjectList( debug,                  # Set to True to print all debug statements
+                    DataBlockDict,          # Data block dictionary from the properties file
+                    ) :
+    ProjectList = []
+    for DataBlock in sorted(DataBlockDict['DataBlocks'].keys()) :
+        for project in DataBlockDict['DataBlocks'][DataBlock].get('ProjectList', []) :
+            if project not in ProjectList : ProjectList.append(project)
+    outputDebug(debug, 'Number of projects = ', len(ProjectList))
+    return ProjectList
+
+# bindList Function     : Creates the bind placeholders for a sql in clause (:1, :2, ...)
+# Author/Editor         : Ivan Nguyen
+# Last updated          : 10-18-2026
+
+def bindList(   Count,                      # Number of bind variables
+                Offset = 0,                 # Number of bind variables that come before the in clause
+                ) :
+    return ', '.join([':%d' % (x + 1 + Offset) for x in range(Count)])
+
+# splitList Function    : Splits a list into chunks. Oracle limits an in clause to 1000 expressions
+# Author/Editor         : Ivan Nguyen
+# Last updated          : 10-18-2026
+
+def splitList(  List,                       # List to split
+                Size = 500,                 # Maximum number of items in each chunk
+                ) :
+    return [List[x : x + Size] for x in range(0, len(List), Size)]
+
+# retrieveNWSForecast Function  : Retrieves every NWS river forecast (RVFShef-FF) and crest forecast (RVFShef-FX) stage for the
+#                                   office in a single query and pivots the values into a forecast record for each location.
+#                                   Replaces the retrieveNWSDay1/2/3, retrieveNWSForecastDate, retrieveCrest and retrieveCrestDate
+#                                   queries that each scan cwms_v_tsv_dqu once per location.
+# Author/Editor                 : Ivan Nguyen
+# Last updated                  : 10-18-2026
+
+def retrieveNWSForecast(    debug,          # Set to True to print all debug statements
+                            conn,           # SQL connection
+                            OfficeId = 'MVS', # Office of the forecasts
+                            ForecastDays = 3, # Number of daily 12:00 UTC forecast values to keep
+                            ) :
+    NWSForecast = {}
+    try :
+        stmt = prepareStatement(conn, '''
+                                    select cwms_ts_id
+                                        ,date_time - to_date(to_char(current_date, 'mm-dd-yyyy') || '12:00' ,'mm-dd-yyyy hh24:mi') as day
+                                        ,value
+                                        ,to_char(cwms_util.change_timezone(date_time, 'UTC', 'CST6CDT' ), 'mm-dd') as day_date
+                                        ,to_char(date_time,'mm/dd am') as crest_date
+                                        ,to_char(data_entry_date, 'MM-DD-YYYY hh24:mi') as data_entry_date
+                                        ,case when (cwms_util.change_timezone(date_time, 'UTC', 'CST6CDT')) > to_date(to_char(current_date, 'mm-dd-yyyy hh24:mi') ,'mm-dd-yyyy hh24:mi')
+                                            then 1 else 0 end as future
+                                    from cwms_v_tsv_dqu
+                                    where office_id = :1
+                                    and unit_id = 'ft'
+                                    and (cwms_ts_id like '%.Stage.Inst.6Hours.0.RVFShef-FF' or cwms_ts_id like '%.Stage.Inst.6Hours.0.RVFShef-FX')
+                                    and date_time >= to_date(to_char(current_date, 'mm-dd-yyyy') ,'mm-dd-yyyy')
+                                    order by cwms_ts_id, data_entry_date desc, date_time
+                                    ''')
+        stmt.setString(1, OfficeId)
+        rs = stmt.executeQuery()
+        while rs.next() :
+            TsIdParts = str(rs.getString(1)).split('.')
+            Location = TsIdParts[0]
+            Forecast = NWSForecast.setdefault(Location, {   'Day1'          :   None,
+                                                            'Day2'          :   None,
+                                                            'Day3'          :   None,
+                                                            'Day1Date'      :   None,
+                                                            'Day2Date'      :   None,
+                                                            'Day3Date'      :   None,
+                                                            'ForecastDate'  :   None,
+                                                            'Crest'         :   None,
+                                                            'CrestDate'     :   None,
+                                                            })
+            if TsIdParts[-1] == 'RVFShef-FF' :
+                # Only the 12:00 UTC value of each forecast day is used
+                Day = rs.getDouble(2)
+                if Day != int(Day) or int(Day) < 1 or int(Day) > ForecastDays : continue
+                DayKey = 'Day%d' % int(Day)
+                if Forecast.get(DayKey) != None : continue
+                Forecast[DayKey] = rs.getString(3)
+                Forecast[DayKey + 'Date'] = rs.getString(4)
+                if DayKey == 'Day1' : Forecast['ForecastDate'] = str(rs.getString(6))
+            else :
+                # Rows are sorted by data entry date, so the first future value is from the latest crest forecast
+                if Forecast['Crest'] != None or rs.getInt(7) != 1 : continue
+                Forecast['Crest'] = rs.getString(3)
+                Forecast['CrestDate'] = str(rs.getString(5))
+    finally :
+        try : stmt.close()
+        except : pass
+        try : rs.close()
+        except : pass
+
+    outputDebug(debug, 'Retrieved NWS forecasts for %d locations' % len(NWSForecast))
+    return NWSForecast
+
+# retrieveLocationMeta Function : Retrieves the location information used by the bulletin tables for all projects with a handful
+#                                   of set based queries. Returns a dictionary keyed by location, so the table functions only do
+#                                   dictionary lookups instead of one query per cell. Flood and record stages without a constant
+#                                   level are retrieved for LevelTimeStr with cwms_level.retrieve_location_level_values.
+# Author/Editor                 : Ivan Nguyen
+# Last updated                  : 10-18-2026
+
+def retrieveLocationMeta(   debug,          # Set to True to print all debug statements
+                            conn,           # SQL connection
+                            ProjectList,    # List of base locations
+                            NWSForecast = None, # Forecast dictionary from retrieveNWSForecast. Retrieved if not given
+                            OfficeId = 'MVS', # Office of the locations
+                            LevelTimeStr = None, # Time of the location level values formatted as ddmonyyyy hh24mi. Today at 0000 if not given
+                            TimeZoneId = 'US/Central', # Time zone of LevelTimeStr
+                            FieldList = None, # List of the reference fields to retrieve, e.g. ['RiverMile']. All of them if not given
+                            ) :
+    if NWSForecast == None : NWSForecast = retrieveNWSForecast(debug, conn, OfficeId)
+    if LevelTimeStr == None : LevelTimeStr = time.strftime('%d%b%Y') + ' 0000'
+    if FieldList == None : FieldList = ReferenceCacheTTL.keys()
+
+    LocationMeta = {}
+    LevelValueList = [] # (Location, Field, LocationLevelId) of the stage levels without a constant level
+    for project in ProjectList :
+        LocationMeta[project] = {   'PublicName'        :   None,
+                                    'ElevDatum'         :   None,
+                                    'RiverMile'         :   None,
+                                    'GageZero29'        :   '',
+                                    'FloodLevel'        :   '',
+                                    'FloodStage'        :   None,
+                                    'RecordStage'       :   None,
+                                    'RecordStageDate'   :   None,
+                                    'NWSDay1'           :   None,
+                                    'NWSDay2'           :   None,
+                                    'NWSDay3'           :   None,
+                                    'NWSForecastDate'   :   None,
+                                    'Crest'             :   None,
+                                    'CrestDate'         :   None,
+                                    'LevelValueFields'  :   [], # Fields retrieved for LevelTimeStr because they have no constant level
+                                    }
+        if project in NWSForecast :
+            for DataKey in ['Day1', 'Day2', 'Day3', 'ForecastDate'] :
+                LocationMeta[project]['NWS' + DataKey] = NWSForecast[project][DataKey]
+            LocationMeta[project]['Crest'] = NWSForecast[project]['Crest']
+            LocationMeta[project]['CrestDate'] = NWSForecast[project]['CrestDate']
+
+    for ProjectChunk in splitList(ProjectList) :
+        # Public name and elevation datum
+        if 'PublicName' in FieldList or 'ElevDatum' in FieldList :
+            try :
+                stmt = prepareStatement(conn, '''
+                                            select distinct
+                                            bl.location_id
+                                            ,bl.public_name as base_location_public_name
+                                            ,bl.elevation as base_location_elevation
+                                            from cwms_v_loc loc
+                                            inner join cwms_v_loc bl on bl.base_location_code = loc.base_location_code
+                                                and bl.db_office_id = loc.db_office_id
+                                                and bl.unit_system = loc.unit_system
+                                            where loc.UNIT_SYSTEM = 'EN'
+                                                and loc.db_office_id = :1
+                                                and bl.location_id in (%s)
+                                            ''' % bindList(len(ProjectChunk), 1))
+                stmt.setString(1, OfficeId)
+                for x in range(len(ProjectChunk)) : stmt.setString(x + 2, ProjectChunk[x])
+                rs = stmt.executeQuery()
+                while rs.next() :
+                    Location = str(rs.getString(1))
+                    if Location not in LocationMeta or LocationMeta[Location]['PublicName'] != None : continue
+                    LocationMeta[Location]['PublicName'] = str(rs.getString(2))
+                    LocationMeta[Location]['ElevDatum'] = str(rs.getString(3))
+            finally :
+                try : stmt.close()
+                except : pass
+                try : rs.close()
+                except : pass
+
+        # River mile
+        if 'RiverMile' in FieldList :
+            try :
+                stmt = prepareStatement(conn, '''
+                                            select location_id, station from CWMS_20.AV_STREAM_LOCATION
+                                            where unit_system = 'EN' and db_office_id = :1 and location_id in (%s)
+                                            ''' % bindList(len(ProjectChunk), 1))
+                stmt.setString(1, OfficeId)
+                for x in range(len(ProjectChunk)) : stmt.setString(x + 2, ProjectChunk[x])
+                rs = stmt.executeQuery()
+                while rs.next() :
+                    Location = str(rs.getString(1))
+                    if Location not in LocationMeta or LocationMeta[Location]['RiverMile'] != None : continue
+                    LocationMeta[Location]['RiverMile'] = str(rs.getString(2))
+            finally :
+                try : stmt.close()
+                except : pass
+                try : rs.close()
+                except : pass
+
+        # Flood, record stage and NGVD29 gage zero location levels
+        if len(set(FieldList) & set(['GageZero29', 'FloodLevel', 'FloodStage', 'RecordStage', 'RecordStageDate'])) > 0 :
+            try :
+                stmt = prepareStatement(conn, '''
+                                            select location_id
+                                                ,location_level_id
+                                                ,specified_level_id
+                                                ,constant_level
+                                                ,to_char(level_date, 'MM-DD-YY') as level_date
+                                            from CWMS_20.AV_LOCATION_LEVEL
+                                            where unit_system = 'EN'
+                                                and specified_level_id in ('Flood', 'Record Stage', 'NGVD29')
+                                                and location_id in (%s)
+                                            ''' % bindList(len(ProjectChunk)))
+                for x in range(len(ProjectChunk)) : stmt.setString(x + 1, ProjectChunk[x])
+                rs = stmt.executeQuery()
+                while rs.next() :
+                    Location = str(rs.getString(1))
+                    if Location not in LocationMeta : continue
+                    LocationLevelId = str(rs.getString(2))
+                    SpecifiedLevelId = str(rs.getString(3))
+                    ConstantLevel = rs.getString(4)
+                    if SpecifiedLevelId == 'Flood' :
+                        if LocationMeta[Location]['FloodLevel'] == '' and ConstantLevel != None : LocationMeta[Location]['FloodLevel'] = str(ConstantLevel)
+                        if LocationLevelId == '%s.Stage.Inst.0.Flood' % Location :
+                            if ConstantLevel != None : LocationMeta[Location]['FloodStage'] = float(ConstantLevel)
+                            else : LevelValueList.append((Location, 'FloodStage', LocationLevelId))
+                    elif SpecifiedLevelId == 'Record Stage' :
+                        if LocationMeta[Location]['RecordStageDate'] == None and rs.getString(5) != None : LocationMeta[Location]['RecordStageDate'] = str(rs.getString(5))
+                        if LocationLevelId == '%s.Stage.Inst.0.Record Stage' % Location :
+                            if ConstantLevel != None : LocationMeta[Location]['RecordStage'] = float(ConstantLevel)
+                            else : LevelValueList.append((Location, 'RecordStage', LocationLevelId))
+                    elif LocationLevelId == '%s.Height.Inst.0.NGVD29' % Location and ConstantLevel != None :
+                        LocationMeta[Location]['GageZero29'] = ConstantLevel
+            finally :
+                try : stmt.close()
+                except : pass
+                try : rs.close()
+                except : pass
+
+    # Seasonal and time series levels have no constant level. Their values are retrieved like retrieveLocationLevel does, with the same
+    #   prepared statement for all of them
+    if len(LevelValueList) > 0 :
+        try :
+            stmt = prepareStatement(conn, '''
+                                  select * from table(cwms_level.retrieve_location_level_values(
+                                  p_location_level_id => :1,
+                                  p_level_units       => :2,
+                                  p_start_time        => to_date(:3, 'ddmonyyyy hh24mi'),
+                                  p_end_time          => to_date(:4, 'ddmonyyyy hh24mi'),
+                                  p_timezone_id       => :5))
+                            ''')
+            for Location, Field, LocationLevelId in LevelValueList :
+                stmt.setString(1, LocationLevelId)
+                stmt.setString(2, 'ft')
+                stmt.setString(3, LevelTimeStr)
+                stmt.setString(4, LevelTimeStr)
+                stmt.setString(5, TimeZoneId)
+                LocationMeta[Location]['LevelValueFields'].append(Field)
+                rs = stmt.executeQuery()
+                try :
+                    if rs.next() : LocationMeta[Location][Field] = rs.getDouble(2)
+                finally :
+                    rs.close()
+        finally :
+            try : stmt.close()
+            except : pass
+
+    outputDebug(debug, 'Retrieved location information for %d projects' % len(LocationMeta))
+    return LocationMeta
+
+# Number of days the reference values in the reference cache are used before they are retrieved from the database again
+ReferenceCacheTTL = {   'PublicName'        :   30,
+                        'ElevDatum'         :   90,
+                        'RiverMile'         :   90,
+                        'GageZero29'        :   90,
+                        'FloodLevel'        :   30,
+                        'FloodStage'        :   30,
+                        'RecordStage'       :   7,
+                        'RecordStageDate'   :   7,
+                        }
+
+# loadReferenceCache Function   : Reads the reference cache file. An empty cache is returned if the file does not exist or can not be read.
+# Author/Editor                 : Ivan Nguyen
+# Last updated                  : 10-18-2026
+
+def loadReferenceCache( debug,          # Set to True to print all debug statements
+                        CachePathname,  # Pathname of the reference cache json file
+                        ) :
+    ReferenceCache = {'Locations' : {}}
+    if os.path.exists(CachePathname) :
+        try :
+            CacheFile = open(CachePathname, 'r')
+            try : ReferenceCache = json.load(CacheFile)
+            finally : CacheFile.close()
+        except Exception, e :
+            outputDebug(debug, 'Could not read reference cache %s : %s' % (CachePathname, e))
+    ReferenceCache.setdefault('Locations', {})
+    return ReferenceCache
+
+# referenceCacheLock Function   : Context manager that holds the lock file of the reference cache, so bulletins running at the same time
+#                                   do not write the cache over each other. Yields False if the lock could not be taken within the timeout.
+#                                   A lock file older than the timeout is left over from a bulletin that was killed and is removed.
+# Author/Editor                 : Ivan Nguyen
+# Last updated                  : 10-18-2026
+
+@contextmanager
+def referenceCacheLock( CachePathname,  # Pathname of the reference cache json file
+                        Timeout = 30,   # Seconds to wait for the lock
+                        ) :
+    LockPathname = CachePathname + '.lock'
+    StartTime = time.time()
+    Locked = False
+    while not Locked :
+        try :
+            os.close(os.open(LockPathname, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            Locked = True
+        except OSError :
+            try :
+                if time.time() - os.path.getmtime(LockPathname) > Timeout :
+                    os.remove(LockPathname)
+                    continue
+            except OSError :
+                continue
+            if time.time() - StartTime > Timeout : break
+            time.sleep(0.1)
+    try :
+        yield Locked
+    finally :
+        if Locked :
+            try : os.remove(LockPathname)
+            except OSError : pass
+
+# saveReferenceCache Function   : Writes the reference cache file. The file on disk is read again while the cache is locked and the values
+#                                   are merged, keeping the value of each field that was updated last, so the values another bulletin saved
+#                                   since this one loaded the cache are kept. The file is written to a temporary file first and renamed so a
+#                                   bulletin running at the same time never reads a partial file.
+# Author/Editor                 : Ivan Nguyen
+# Last updated                  : 10-18-2026
+
+def saveReferenceCache( debug,          # Set to True to print all debug statements
+                        CachePathname,  # Pathname of the reference cache json file
+                        ReferenceCache, # Reference cache dictionary
+                        ) :
+    with referenceCacheLock(CachePathname) as Locked :
+        if not Locked :
+            outputDebug(debug, 'Could not lock reference cache ', CachePathname, ', the cache is not saved')
+            return
+        SavedLocations = loadReferenceCache(debug, CachePathname)['Locations']
+        for project, CachedLocation in ReferenceCache['Locations'].items() :
+            SavedLocation = SavedLocations.setdefault(project, {})
+            SavedValues = SavedLocation.setdefault('Values', {})
+            SavedUpdated = SavedLocation.setdefault('Updated', {})
+            Updated = CachedLocation.get('Updated', {})
+            for Field, Value in CachedLocation.get('Values', {}).items() :
+                if Field in SavedValues and Updated.get(Field, 0) < SavedUpdated.get(Field, 0) : continue
+                SavedValues[Field] = Value
+                if Field in Updated : SavedUpdated[Field] = Updated[Field]
+                else : SavedUpdated.pop(Field, None)
+        ReferenceCache['Locations'] = SavedLocations
+
+        TempPathname = '%s.%d.tmp' % (CachePathname, os.getpid())
+        try :
+            CacheFile = open(TempPathname, 'w')
+            try :
+                with span('saveReferenceCache', File = os.path.basename(CachePathname)) :
+                    json.dump(ReferenceCache, CacheFile, indent = 1, sort_keys = True)
+            finally : CacheFile.close()
+            if os.name == 'nt' and os.path.exists(CachePathname) : os.remove(CachePathname)
+            os.rename(TempPathname, CachePathname)
+        except Exception, e :
+            outputDebug(debug, 'Could not write reference cache %s : %s' % (CachePathname, e))
+            try : os.remove(TempPathname)
+            except : pass
+
+# retrieveLocationMetaCached Function   : Same as retrieveLocationMeta, but the reference values are read from the reference cache file.
+#                                           Only the values older than their ReferenceCacheTTL, or that are not in the cache, are
+#                                           retrieved from the database. The NWS forecast values are never cached, and neither are the
+#                                           flood and record stages without a constant level, because their values depend on the date.
+# Author/Editor                         : Ivan Nguyen
+# Last updated                          : 10-18-2026
+
+def retrieveLocationMetaCached( debug,          # Set to True to print all debug statements
+                                conn,           # SQL connection
+                                ProjectList,    # List of base locations
+                                CachePathname,  # Pathname of the reference cache json file
+                                NWSForecast = None, # Forecast dictionary from retrieveNWSForecast. Retrieved if not given
+                                OfficeId = 'MVS', # Office of the locations
+                                LevelTimeStr = None, # Time of the location level values formatted as ddmonyyyy hh24mi. Today at 0000 if not given
+                                TimeZoneId = 'US/Central', # Time zone of LevelTimeStr
+                                ) :
+    if NWSForecast == None : NWSForecast = retrieveNWSForecast(debug, conn, OfficeId)
+    ReferenceCache = loadReferenceCache(debug, CachePathname)
+    CachedLocations = ReferenceCache['Locations']
+
+    # Find the fields of each project with a missing or expired value
+    Now = time.time()
+    StaleFields = {}
+    for project in ProjectList :
+        Updated = CachedLocations.get(project, {}).get('Updated', {})
+        FieldList = [Field for Field, TTL in ReferenceCacheTTL.items() if Now - Updated.get(Field, 0) > TTL * 86400]
+        if len(FieldList) > 0 : StaleFields[project] = FieldList
+    outputDebug(debug, 'Reference cache has %d of %d projects up to date' % (len(ProjectList) - len(StaleFields),
+        len(ProjectList)))
+
+    # Only the stale fields are retrieved and updated. A field that is still empty, or that was retrieved for LevelTimeStr, is not marked
+    #   as updated, so it is retrieved again on the next run instead of after its TTL
+    if len(StaleFields) > 0 :
+        StaleFieldList = sorted(set([Field for FieldList in StaleFields.values() for Field in FieldList]))
+        FreshMeta = retrieveLocationMeta(debug, conn, sorted(StaleFields.keys()), {}, OfficeId, LevelTimeStr, TimeZoneId, StaleFieldList)
+        for project, FieldList in StaleFields.items() :
+            CachedLocation = CachedLocations.setdefault(project, {})
+            Values = CachedLocation.setdefault('Values', {})
+            Updated = CachedLocation.setdefault('Updated', {})
+            for Field in FieldList :
+                Values[Field] = FreshMeta[project][Field]
+                if Values[Field] not in [None, ''] and Field not in FreshMeta[project]['LevelValueFields'] : Updated[Field] = Now
+                else : Updated.pop(Field, None)
+        saveReferenceCache(debug, CachePathname, ReferenceCache)
+
+    # Build the same dictionary as retrieveLocationMeta
+    LocationMeta = {}
+    for project in ProjectList :
+        LocationMeta[project] = dict(CachedLocations[project]['Values'])
+        # json returns unicode strings. The tables expect str like the values retrieved from the database
+        for Field in ReferenceCacheTTL :
+            if type(LocationMeta[project][Field]) == type(u'') : LocationMeta[project][Field] = LocationMeta[project][Field].encode('utf-8')
+        Forecast = NWSForecast.get(project, {})
+        for DataKey in ['Day1', 'Day2', 'Day3', 'ForecastDate'] :
+            LocationMeta[project]['NWS' + DataKey] = Forecast.get(DataKey)
+        LocationMeta[project]['Crest'] = Forecast.get('Crest')
+        LocationMeta[project]['CrestDate'] = Forecast.get('CrestDate')
+    return LocationMeta
+
+# retrieveTsFirstLast Function  : Retrieves the first and last value within the time window for a list of time series with one query
+#                                   instead of a CwmsDb.get call for each time series. Regular time series use the values at the
+#                                   start and end of the time window, like CwmsDb.get with trim missing turned off. Irregular time
+#                                   series use the first and last values within the time window.
+# Author/Editor                 : Ivan Nguyen
+# Last updated                  : 10-18-2026
+
+def retrieveTsFirstLast(    debug,          # Set to True to print all debug statements
+                            conn,           # SQL connection
+                            PathnameList,   # List of time series pathnames
+                            StartTimeStr,   # Start of time window formatted as ddmonyyyy hh24mi
+                            EndTimeStr,     # End of time window formatted as ddmonyyyy hh24mi
+                            TimeZoneId = 'US/Central', # Time zone of the time window
+                            Units = 'ft',   # Units of the values
+                            ) :
+    TsData = {}
+    for Pathname in PathnameList :
+        TsData[Pathname] = {    'First'     :   Constants.UNDEFINED,
+                                'Last'      :   Constants.UNDEFINED,
+                                'Quality'   :   0,
+                                }
+
+    UniquePathnameList = sorted(TsData.keys())
+    for PathnameChunk in splitList(UniquePathnameList) :
+        try :
+            stmt = prepareStatement(conn, '''
+                                        with cte_window as (
+                                        select cwms_util.change_timezone(to_date(:1, 'ddmonyyyy hh24mi'), :2, 'UTC') as start_time
+                                            ,cwms_util.change_timezone(to_date(:3, 'ddmonyyyy hh24mi'), :4, 'UTC') as end_time
+                                        from dual)
+                                        select tsv.cwms_ts_id
+                                            ,tsv.value
+                                            ,tsv.quality_code
+                                            ,case when tsv.date_time = cte_window.start_time then 1 else 0 end as is_start
+                                            ,case when tsv.date_time = cte_window.end_time then 1 else 0 end as is_end
+                                        from cwms_v_tsv_dqu tsv, cte_window
+                                        where tsv.unit_id = :5
+                                            and tsv.date_time between cte_window.start_time and cte_window.end_time
+                                            and tsv.cwms_ts_id in (%s)
+                                        order by tsv.cwms_ts_id, tsv.date_time
+                                        ''' % bindList(len(PathnameChunk), 5))
+            stmt.setString(1, StartTimeStr)
+            stmt.setString(2, TimeZoneId)
+            stmt.setString(3, EndTimeStr)
+            stmt.setString(4, TimeZoneId)
+            stmt.setString(5, Units)
+            for x in range(len(PathnameChunk)) : stmt.setString(x + 6, PathnameChunk[x])
+            rs = stmt.executeQuery()
+            FirstFound = {}
+            while rs.next() :
+                Pathname = str(rs.getString(1))
+                if Pathname not in TsData or rs.getString(2) == None : continue
+                Value = rs.getDouble(2)
+                if Pathname.split('.')[3].startswith('~') :
+                    # Irregular time series. Keep the first and last values in the time window
+                    if Pathname not in FirstFound :
+                        TsData[Pathname]['First'] = Value
+                        FirstFound[Pathname] = True
+                    TsData[Pathname]['Last'] = Value
+                    TsData[Pathname]['Quality'] = rs.getInt(3)
+                else :
+                    if rs.getInt(4) == 1 : TsData[Pathname]['First'] = Value
+                    if rs.getInt(5) == 1 :
+                        TsData[Pathname]['Last'] = Value
+                        TsData[Pathname]['Quality'] = rs.getInt(3)
+        finally :
+            try : stmt.close()
+            except : pass
+            try : rs.close()
+            except : pass
+
+    outputDebug(debug, 'Retrieved first and last values for %d time series' % len(TsData))
+    return TsData
+
 #########################################################################
 # Webrep Sub Report
 #########################################################################
@@ -922,7 +2430,7 @@ def retrieveYesterdayInflow( debug,                 # Set to True to print all d
                         ) :
     try :
         YesterdayInflow = None
-        stmt = conn.prepareStatement('''
+        stmt = prepareStatement(conn, '''
                                     select value
                                     from cwms_v_tsv_dqu 
                                     where cwms_ts_id like '%Flow-In.Ave.~1Day.1Day.lakerep-rev' 
@@ -947,7 +2455,7 @@ def retrieveLakeMeta( debug,                        # Set to True to print all d
                          conn,                      # 
                          ) :
     try :
-        stmt = conn.prepareStatement('''
+        stmt = prepareStatement(conn, '''
                                     with cte_data as (
                                     select location_id
                                         ,specified_level_id
@@ -997,7 +2505,7 @@ def retrieveCrestLake( debug,                       # Set to True to print all d
     try :
         CrestLake = None
         CrestOption = None
-        stmt = conn.prepareStatement('''
+        stmt = prepareStatement(conn, '''
                                     with cte_data as (
                                         select 
                                             case
@@ -1038,7 +2546,7 @@ def retrieveCrestLakeDate( debug,                   # Set to True to print all d
                         ) :
     try :
         CrestDateLake=None
-        stmt = conn.prepareStatement('''
+        stmt = prepareStatement(conn, '''
                                     with cte_data as (
                                     select 
                                         case
@@ -1078,7 +2586,7 @@ def retrieveProjectId( debug,                       # Set to True to print all d
                          conn,                      #
                          ) :
     try :
-        stmt = conn.prepareStatement('''
+        stmt = prepareStatement(conn, '''
                                     select location_id as project_id
                                     from cwms_v_loc_grp_assgn
                                     where category_id = 'RDL_Project_Types' and group_id = 'Lake'
@@ -1100,7 +2608,7 @@ def retrievePrecipLake( debug,                      # Set to True to print all d
                         ) :
     try :
         Precip = None
-        stmt = conn.prepareStatement('''
+        stmt = prepareStatement(conn, '''
                                     select value from CWMS_20.AV_TSV_DQU_30D
                                     where cwms_ts_id = :1 || '.Precip.Total.~1Day.1Day.lakerep-rev'
                                     and (cwms_util.change_timezone(date_time, 'UTC', 'CST6CDT')) = to_date(to_char((cwms_util.change_timezone(sysdate, 'UTC', 'CST6CDT')), 'mm-dd-yyyy') || '00:00' ,'mm-dd-yyyy hh24:mi')
@@ -1125,7 +2633,7 @@ def retrieveMidnight( debug,                        # Set to True to print all d
                         ) :
     try :
         Midnight = None
-        stmt = conn.prepareStatement('''
+        stmt = prepareStatement(conn, '''
                                     with cte_rend as (
                                     select 'Rend Lk-Big Muddy' as project_id 
                                     ,(cwms_util.change_timezone(date_time, 'UTC', 'CST6CDT')) as date_time
@@ -1203,7 +2711,7 @@ def retrieveEveningOutflow( debug,                  # Set to True to print all d
                         ) :
     try :
         EveningOutflow = None
-        stmt = conn.prepareStatement('''
+        stmt = prepareStatement(conn, '''
                                     with cte_evening_outflow as (
                                     select 
                                         case
@@ -1246,7 +2754,7 @@ def retrieveRuleCurve( debug,                       # Set to True to print all d
                         ) :
     try :
         RuleCurve = None 
-        stmt = conn.prepareStatement('''
+        stmt = prepareStatement(conn, '''
                                     with cte_rule_curve as (
                                     select 
                                         case
@@ -1285,7 +2793,7 @@ def retrieveStorageLake( debug,                     # Set to True to print all d
                         ) :
     try :
         Storage = None
-        stmt = conn.prepareStatement('''
+        stmt = prepareStatement(conn, '''
                                     select value 
                                     from CWMS_20.AV_TSV_DQU
                                     where cwms_ts_id = :1 || '.Stor.Inst.30Minutes.0.RatingCOE'
@@ -1313,7 +2821,7 @@ def retrieveTopBottomLake( debug,                   # Set to True to print all d
         BOC = None
         TOF = None
         BOF = None
-        stmt = conn.prepareStatement('''
+        stmt = prepareStatement(conn, '''
                                     with cte_data as (
                                     select location_id
                                         ,specified_level_id
@@ -1374,6 +2882,145 @@ def retrieveTopBottomLake( debug,                   # Set to True to print all d
         rs.close()
     return TOC, BOC, TOF, BOF
 
+# LakeRecord            : Snapshot of the lake report values for one lake. The values are strings like the values returned by the
+#                           single lake retrieve functions and are None if there is no data.
+LakeRecord = namedtuple('LakeRecord', ['Precip', 'YesterdayInflow', 'MidnightOutflow', 'EveningOutflow', 'RuleCurve', 'Crest',
+    'CrestOption', 'CrestDate', 'Storage', 'TOC', 'BOC', 'TOF', 'BOF'])
+EmptyLakeRecord = LakeRecord(*([None] * len(LakeRecord._fields))) # Used for projects that are not lakes
+
+# retrieveLakeSnapshot Function : Retrieves the lake report values for all of the lakes with one query instead of running the single
+#                                   lake retrieve functions for every lake and column
+# Author/Editor                 : Ivan Nguyen
+# Last updated                  : 10-18-2026
+
+def retrieveLakeSnapshot(   debug,                  # Set to True to print all debug statements
+                            conn,                   # SQL connection
+                            ) :
+    LakeSnapshot = {}
+    try :
+        stmt = prepareStatement(conn, '''
+                                    with cte_lake as (
+                                    select 'Carlyle Lk-Kaskaskia' as project_id, 'CARLYLE' as lake, 'Carlyle Lk' as location_id from dual
+                                    union all
+                                    select 'Lk Shelbyville-Kaskaskia', 'SHELBYVILLE', 'Lk Shelbyville' from dual
+                                    union all
+                                    select 'Mark Twain Lk-Salt', 'MT', 'Mark Twain Lk' from dual
+                                    union all
+                                    select 'Rend Lk-Big Muddy', 'REND', 'Rend Lk' from dual
+                                    union all
+                                    select 'Wappapello Lk-St Francis', 'WAPPAPELLO', 'Wappapello Lk' from dual
+                                    ),
+                                    cte_today as (
+                                    select to_date(to_char((cwms_util.change_timezone(sysdate, 'UTC', 'CST6CDT')), 'mm-dd-yyyy') || '00:00' ,'mm-dd-yyyy hh24:mi') as today
+                                    from dual
+                                    ),
+                                    cte_precip as (
+                                    select cte_lake.project_id, tsv.value
+                                    from CWMS_20.AV_TSV_DQU_30D tsv, cte_lake, cte_today
+                                    where tsv.cwms_ts_id = cte_lake.project_id || '.Precip.Total.~1Day.1Day.lakerep-rev'
+                                    and (cwms_util.change_timezone(tsv.date_time, 'UTC', 'CST6CDT')) = cte_today.today
+                                    and tsv.unit_id = 'ft'
+                                    ),
+                                    cte_inflow as (
+                                    select cte_lake.project_id, tsv.value, tsv.data_entry_date
+                                    from cwms_v_tsv_dqu tsv, cte_lake, cte_today
+                                    where tsv.cwms_ts_id like '%Flow-In.Ave.~1Day.1Day.lakerep-rev'
+                                    and tsv.cwms_ts_id like cte_lake.project_id || '%'
+                                    and tsv.unit_id = 'cfs'
+                                    and (cwms_util.change_timezone(tsv.date_time, 'UTC', 'CST6CDT')) = cte_today.today - interval '1' day
+                                    ),
+                                    cte_midnight as (
+                                    select 'Rend Lk-Big Muddy' as project_id, round(q_tom, -1) as midnight
+                                    from wm_mvs_lake.rend_flow, cte_today
+                                    where cwms_util.change_timezone(date_time, 'UTC', 'CST6CDT') >= cte_today.today - interval '1' day
+                                    union all
+                                    select 'Wappapello Lk-St Francis', q
+                                    from wm_mvs_lake.wappapello_gate, cte_today
+                                    where cwms_util.change_timezone(date_time, 'UTC', 'CST6CDT') = cte_today.today - interval '1' day
+                                    union all
+                                    select 'Lk Shelbyville-Kaskaskia', q
+                                    from wm_mvs_lake.shelbyville_gate, cte_today
+                                    where cwms_util.change_timezone(date_time, 'UTC', 'CST6CDT') = cte_today.today - interval '1' day
+                                    union all
+                                    select 'Carlyle Lk-Kaskaskia', q
+                                    from wm_mvs_lake.carlyle_gate, cte_today
+                                    where cwms_util.change_timezone(date_time, 'UTC', 'CST6CDT') = cte_today.today - interval '1' day
+                                    union all
+                                    select 'Mark Twain Lk-Salt', outflow
+                                    from wm_mvs_lake.qlev_fcst, cte_today
+                                    where (cwms_util.change_timezone(date_time, 'UTC', 'CST6CDT')) = cte_today.today - interval '1' day
+                                    and (cwms_util.change_timezone(fcst_date, 'UTC', 'CST6CDT')) = cte_today.today
+                                    and lake = 'MT'
+                                    ),
+                                    cte_evening_outflow as (
+                                    select cte_lake.project_id, fcst.outflow
+                                    from wm_mvs_lake.qlev_fcst fcst, cte_lake, cte_today
+                                    where fcst.lake = cte_lake.lake
+                                    and (cwms_util.change_timezone(fcst.fcst_date, 'UTC', 'CST6CDT')) = cte_today.today
+                                    and (cwms_util.change_timezone(fcst.date_time, 'UTC', 'CST6CDT')) = cte_today.today
+                                    ),
+                                    cte_rule_curve as (
+                                    select cte_lake.project_id, cast(rule_curve.lev as number) as lev
+                                    from wm_mvs_lake.rule_curve rule_curve, cte_lake
+                                    where rule_curve.lake = cte_lake.lake
+                                    and current_date > to_date(rule_curve.dt_s, 'mm-dd hh24:mi')
+                                    and current_date < to_date(rule_curve.dt_e, 'mm-dd hh24:mi')
+                                    ),
+                                    cte_crest as (
+                                    select cte_lake.project_id, crst.crest, crst.opt, to_char(crst.crst_dt,'mm-dd am') as crest_date
+                                    from wm_mvs_lake.crst_fcst crst, cte_lake
+                                    where crst.lake = cte_lake.lake
+                                    and (cwms_util.change_timezone(crst.data_entry_dt, 'UTC', 'CST6CDT')) = to_date(to_char(current_date, 'mm-dd-yyyy') || '00:00' ,'mm-dd-yyyy hh24:mi')
+                                    ),
+                                    cte_storage as (
+                                    select cte_lake.project_id, tsv.value
+                                    from CWMS_20.AV_TSV_DQU tsv, cte_lake, cte_today
+                                    where tsv.cwms_ts_id = cte_lake.project_id || '.Stor.Inst.30Minutes.0.RatingCOE'
+                                    and tsv.date_time = cte_today.today
+                                    and tsv.unit_id = 'ac-ft'
+                                    ),
+                                    cte_level as (
+                                    select cte_lake.project_id
+                                        ,max(case when loc_level.specified_level_id = 'Top of Conservation' then loc_level.constant_level end) as toc
+                                        ,max(case when loc_level.specified_level_id = 'Bottom of Conservation' then loc_level.constant_level end) as boc
+                                        ,max(case when loc_level.specified_level_id = 'Top of Flood' then loc_level.constant_level end) as tof
+                                        ,max(case when loc_level.specified_level_id = 'Bottom of Flood' then loc_level.constant_level end) as bof
+                                    from CWMS_20.AV_LOCATION_LEVEL loc_level, cte_lake
+                                    where loc_level.location_id = cte_lake.location_id
+                                    and loc_level.level_unit in ('ac-ft')
+                                    and loc_level.unit_system = 'EN'
+                                    and loc_level.specified_level_id in ('Top of Conservation','Bottom of Conservation', 'Top of Flood', 'Bottom of Flood')
+                                    group by cte_lake.project_id
+                                    )
+                                    select cte_lake.project_id
+                                        ,(select value from cte_precip where cte_precip.project_id = cte_lake.project_id fetch first 1 rows only) as precip
+                                        ,(select value from cte_inflow where cte_inflow.project_id = cte_lake.project_id order by data_entry_date desc fetch first 1 rows only) as yesterday_inflow
+                                        ,(select midnight from cte_midnight where cte_midnight.project_id = cte_lake.project_id fetch first 1 rows only) as midnight_outflow
+                                        ,(select outflow from cte_evening_outflow where cte_evening_outflow.project_id = cte_lake.project_id fetch first 1 rows only) as evening_outflow
+                                        ,(select lev from cte_rule_curve where cte_rule_curve.project_id = cte_lake.project_id fetch first 1 rows only) as rule_curve
+                                        ,(select crest from cte_crest where cte_crest.project_id = cte_lake.project_id fetch first 1 rows only) as crest
+                                        ,(select opt from cte_crest where cte_crest.project_id = cte_lake.project_id fetch first 1 rows only) as crest_option
+                                        ,(select crest_date from cte_crest where cte_crest.project_id = cte_lake.project_id fetch first 1 rows only) as crest_date
+                                        ,(select value from cte_storage where cte_storage.project_id = cte_lake.project_id fetch first 1 rows only) as storage
+                                        ,cte_level.toc
+                                        ,cte_level.boc
+                                        ,cte_level.tof
+                                        ,cte_level.bof
+                                    from cte_lake
+                                        left outer join cte_level on cte_lake.project_id = cte_level.project_id
+                                    ''')
+        rs = stmt.executeQuery()
+        while rs.next() :
+            LakeSnapshot[str(rs.getString(1))] = LakeRecord(*[rs.getString(x) for x in range(2, len(LakeRecord._fields) + 2)])
+    finally :
+        try : stmt.close()
+        except : pass
+        try : rs.close()
+        except : pass
+
+    outputDebug(debug, 'LakeSnapshot = ', LakeSnapshot)
+    return LakeSnapshot
+
 # checkTs Function    : Check if the TS is in the database
 # Author/Editor       : Scott Hoffman
 
@@ -1384,8 +3031,9 @@ def checkTs(timeseries,
         #check if timeseries exist in DB
         #sql = "select * from CWMS_20.av_cwms_ts_id where cwms_ts_id='" + timeseries + "'"
         #rset = stmt.executeQuery(sql)
-        string = "select * from CWMS_20.av_cwms_ts_id where cwms_ts_id='" + timeseries + "'"
-        stmt = conn.prepareStatement(string)
+        string = "select * from CWMS_20.av_cwms_ts_id where cwms_ts_id = :1"
+        stmt = prepareStatement(conn, string)
+        stmt.setString(1, timeseries)
         rset = stmt.executeQuery()
         if rset.next() :
             #Found timeseries
@@ -1414,9 +3062,259 @@ def is_dst(dayTime):
 
     return timezoneone.inDaylightTime(day) 
 
-# createCell Function   : Creates a PdfPCell for tables
+#########################################################################
+# Row Records
+#########################################################################
+
+# RowRecord Class           : Values of one row of a data block. The subclasses made by rowRecordClass have one slot for each column, so a
+#                               row has no dictionary and a value is read with one attribute lookup, e.g. Row.Stage. Values that are not
+#                               set are None.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+class RowRecord(object) :
+    __slots__ = ('Project',)
+    Columns = ()
+
+    def __init__(   self,
+                    Project,    # Location id of the row
+                    ) :
+        self.Project = Project
+        for Name in self.Columns : setattr(self, Name, None)
+
+    # Returns the values of the row as a dictionary keyed by column name
+    def asDict(self) :
+        return dict([(Name, getattr(self, Name)) for Name in self.Columns])
+
+    def __repr__(self) :
+        return '%s(%r, %s)' % (self.__class__.__name__, self.Project, ', '.join(['%s=%r' % (Name, getattr(self, Name)) for Name in self.Columns]))
+
+# Row record classes made during the run, keyed by (class name, columns)
+RowRecordClasses = {}
+
+# rowRecordClass Function   : Returns the RowRecord subclass with a slot for each column. Columns that are listed more than once only get
+#                               one slot. The class is only made once for each name and list of columns.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def rowRecordClass( Name,       # Name of the class, e.g. Table1Row
+                    Columns,    # List of column names, e.g. DataOrder plus the extra values that are kept for each row
+                    ) :
+    Columns = tuple([Column for x, Column in enumerate(Columns) if Column not in Columns[: x]])
+    Key = (Name, Columns)
+    if Key not in RowRecordClasses :
+        RowRecordClasses[Key] = type(Name, (RowRecord,), {'__slots__' : Columns, 'Columns' : Columns})
+    return RowRecordClasses[Key]
+
+# DataBlockRows Class       : Row records of one data block in the order of its project list. The rows are made by the data functions
+#                               of the bulletins, so computed values like the Stage change can be read by other code without querying the
+#                               database again and without writing to the DataBlockDict of the properties file.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+class DataBlockRows(object) :
+    __slots__ = ('Name', 'RowClass', 'ProjectList', 'Rows')
+
+    def __init__(   self,
+                    Name,           # Name of the data block, e.g. Table1Data1
+                    RowClass,       # RowRecord subclass from rowRecordClass
+                    ProjectList,    # List of location ids of the data block
+                    ) :
+        self.Name = Name
+        self.RowClass = RowClass
+        self.ProjectList = list(ProjectList)
+        self.Rows = dict([(Project, RowClass(Project)) for Project in self.ProjectList])
+
+    # Returns the row of a project
+    def row(self, Project) :
+        return self.Rows[Project]
+
+    # Returns the values of a column in the order of the project list
+    def column(self, Name) :
+        return [getattr(self.Rows[Project], Name) for Project in self.ProjectList]
+
+    # Each row is traced as a project span of the data block until the next row is requested
+    def __iter__(self) :
+        for Project in self.ProjectList :
+            Span = startSpan('project', DataBlock = self.Name, Project = Project)
+            try : yield self.Rows[Project]
+            finally : endSpan(Span)
+
+    def __len__(self) :
+        return len(self.ProjectList)
+
+#########################################################################
+# Streaming Tables
+#########################################################################
+
+# Number of body rows that are kept in a streamed table before they are written to the pdf. This is about one page of a bulletin
+StreamFlushRows = 40
+
+# openBulletinPdf Function  : Opens one letter size document that writes to all of the pdf files. Every element that is added to the
+#                               document is written to each file, so the tables of a bulletin are only built once. Returns the document and
+#                               the list of writers. Closing the document closes the files.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def openBulletinPdf(    debug,          # Set to True to print all debug statements
+                        FilenameList,   # List of pdf filenames, e.g. the bulletin and its archive copy
+                        Margins,        # List of the Left, Right, Top and Bottom margins
+                        ) :
+    with span('openBulletinPdf', Files = ', '.join([os.path.basename(Filename) for Filename in FilenameList])) :
+        BulletinPdf = Document()
+        WriterList = [PdfWriter.getInstance(BulletinPdf, FileOutputStream(Filename)) for Filename in FilenameList]
+        BulletinPdf.setPageSize(PageSize.LETTER) # Set the page size
+        BulletinPdf.setMargins(Margins[0], Margins[1], Margins[2], Margins[3]) # Left, Right, Top, Bottom
+        BulletinPdf.setMarginMirroring(True)
+        BulletinPdf.open()
+    outputDebug(debug, 'Opened %s' % ', '.join(FilenameList))
+    return BulletinPdf, WriterList
+
+# writeFooter Function      : Writes a footer at the bottom of the current page of every pdf file of the document
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def writeFooter(    Footer,         # PdfPTable with the footer
+                    BulletinPdf,    # Document from openBulletinPdf
+                    WriterList,     # List of writers from openBulletinPdf
+                    ) :
+    Footer.setTotalWidth(BulletinPdf.getPageSize().getWidth() - 48) # Total width is 612 pixels (8.5 inches) minus the left and right margins (24 pixels each)
+    for Writer in WriterList : Footer.writeSelectedRows(0, -1, 24, 36, Writer.getDirectContent())
+
+# streamTable Function      : Writes a table to the document while its rows are being made. The table is marked as incomplete, so each
+#                               time it is added to the document iText writes the finished body rows and removes them from the table. The
+#                               header rows stay in the table and are repeated on every page. RowBlocks is an iterator that adds rows to the
+#                               table, e.g. a generator that adds one data block for each step. The table is only written between steps, so
+#                               cells that span rows are never split. Returns the table.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def streamTable(    debug,                      # Set to True to print all debug statements
+                    BulletinPdf,                # Document the table is written to
+                    Table,                      # PdfPTable with its widths and header rows set
+                    RowBlocks,                  # Iterator that adds rows to the table
+                    FlushRows = StreamFlushRows,# Number of body rows that are kept before they are written
+                    ) :
+    Table.setComplete(False)
+    RowBlock = None
+    for RowBlock in RowBlocks :
+        if Table.size() - Table.getHeaderRows() >= FlushRows :
+            outputDebug(debug, 'Writing ', Table.size() - Table.getHeaderRows(), ' rows of ', RowBlock)
+            with span('BulletinPdf.add', DataBlock = RowBlock, Rows = Table.size() - Table.getHeaderRows()) : BulletinPdf.add(Table)
+    Table.setComplete(True)
+    with span('BulletinPdf.add', DataBlock = RowBlock, Rows = Table.size() - Table.getHeaderRows()) : BulletinPdf.add(Table)
+    return Table
+
+#########################################################################
+# Cell Styles
+#########################################################################
+
+# CellStyle Class           : Cell properties that are resolved once into a prototype PdfPCell. apply() copies the prototype and sets the
+#                               content, so each cell costs a copy instead of about twenty property setters. Styles are shared between
+#                               cells and must not be changed after they are created. Change the returned cell instead.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+class CellStyle(object) :
+    __slots__ = ('Key', 'Prototype')
+
+    def __init__(   self,
+                    Key,    # Tuple of (RowSpan, ColSpan, HorizontalAlignment, VerticalAlignment, CellPadding, BorderColors, BorderWidths,
+                            #   VariableBorders, BackgroundColor) with the lists as tuples
+                    ) :
+        RowSpan, ColSpan, HorizontalAlignment, VerticalAlignment, CellPadding, BorderColors, BorderWidths, VariableBorders, BackgroundColor = Key
+        Cell = PdfPCell(Phrase(''))
+        Cell.setRowspan(RowSpan); Cell.setColspan(ColSpan)
+        Cell.setHorizontalAlignment(HorizontalAlignment); Cell.setVerticalAlignment(VerticalAlignment)
+        Cell.setPaddingTop(CellPadding[0]); Cell.setPaddingRight(CellPadding[1]); Cell.setPaddingBottom(CellPadding[2]); Cell.setPaddingLeft(CellPadding[3])
+        Cell.setBorderColorTop(BorderColors[0]); Cell.setBorderColorRight(BorderColors[1]); Cell.setBorderColorBottom(BorderColors[2]); Cell.setBorderColorLeft(BorderColors[3])
+        Cell.setBorderWidthTop(BorderWidths[0]); Cell.setBorderWidthRight(BorderWidths[1]); Cell.setBorderWidthBottom(BorderWidths[2]); Cell.setBorderWidthLeft(BorderWidths[3])
+        Cell.setUseVariableBorders(VariableBorders)
+        Cell.setBackgroundColor(BackgroundColor)
+        self.Key = Key
+        self.Prototype = Cell
+
+    # Returns a new PdfPCell with the style and the content. CellData can be a Phrase, an Image or a PdfPTable
+    def apply(self, CellData) :
+        Cell = PdfPCell(self.Prototype)
+        if isinstance(CellData, Phrase) : Cell.setPhrase(CellData)
+        # An image is added as a Chunk, like PdfPCell(Image) does, so it keeps its own scale. setImage would fit it to the cell
+        elif isinstance(CellData, Image) : Cell.setPhrase(Phrase(Chunk(CellData, 0, 0, True)))
+        elif isinstance(CellData, PdfPTable) : Cell.setTable(CellData)
+        else : Cell.setPhrase(Phrase(CellData))
+        return Cell
+
+    # Returns the style with some of the properties changed, e.g. style.replace(BorderWidths = [0.25, 0.25, 1, 0.25])
+    def replace(self, **Overrides) :
+        Properties = dict(zip(CellStyleProperties, self.Key))
+        Properties.update(Overrides)
+        return getCellStyle(*[Properties[Name] for Name in CellStyleProperties])
+
+# Order of the properties in the CellStyle key
+CellStyleProperties = ( 'RowSpan', 'ColSpan', 'HorizontalAlignment', 'VerticalAlignment', 'CellPadding', 'BorderColors', 'BorderWidths',
+                        'VariableBorders', 'BackgroundColor')
+
+# Cell styles used during the run, keyed by the CellStyle key. Each distinct set of properties is only resolved once
+CellStyleRegistry = {}
+
+# getCellStyle Function     : Returns the CellStyle for the cell properties. The style is created and added to the registry the first
+#                               time the properties are used.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def getCellStyle(   RowSpan,                # Specifies number of rows information within cell will span
+                    ColSpan,                # Specifies number of columns information within cell will span
+                    HorizontalAlignment,    # Specifies horizontal alignment: ALIGN_CENTER, ALIGN_LEFT, ALIGN_RIGHT
+                    VerticalAlignment,      # Specifies vertical alignment: ALIGN_CENTER, ALIGN_TOP, ALIGN_BOTTOM
+                    CellPadding,            # List of cell padding around text: [Top, Right, Bottom, Left]
+                    BorderColors,           # List of border colors: [Top, Right, Bottom, Left]
+                    BorderWidths,           # List of border widths: [Top, Right, Bottom, Left]
+                    VariableBorders,        # Allows or denies variable borders: True, False
+                    BackgroundColor         # Color of cell background
+                    ) :
+    Key = ( RowSpan, ColSpan, HorizontalAlignment, VerticalAlignment, tuple(CellPadding), tuple(BorderColors), tuple(BorderWidths),
+            VariableBorders, BackgroundColor)
+    Style = CellStyleRegistry.get(Key)
+    if Style == None :
+        Style = CellStyleRegistry[Key] = CellStyle(Key)
+    return Style
+
+# getTableCellStyle Function    : Returns the default CellStyle of a table in the TableLayoutDict of a bulletin
+# Author/Editor                 : Ivan Nguyen
+# Last updated                  : 10-18-2026
+
+def getTableCellStyle(  TableLayout,    # Layout dictionary of the table, e.g. TableLayoutDict['Table1']
+                        ) :
+    return getCellStyle(*[TableLayout[Name] for Name in CellStyleProperties])
+
+#########################################################################
+# Images
+#########################################################################
+
+# Images read during the run, keyed by (pathname, modified time, size). A changed file is read again
+ImageCache = {}
+
+# getImage Function         : Returns an iText Image of a file. The file is only read and decoded the first time it is used. Each call
+#                               returns a copy that shares the image data, so it can be scaled without changing the other copies, and
+#                               the image is only embedded once in a pdf no matter how many times it is added.
+# Author/Editor             : Ivan Nguyen
+# Last updated              : 10-18-2026
+
+def getImage(   debug,      # Set to True to print all debug statements
+                Pathname,   # Pathname of the image file
+                ) :
+    FileStat = os.stat(Pathname)
+    Key = (Pathname, FileStat.st_mtime, FileStat.st_size)
+    Img = ImageCache.get(Key)
+    if Img == None :
+        outputDebug(debug, 'Reading image ', Pathname)
+        Img = ImageCache[Key] = Image.getInstance(Pathname)
+    return Image.getInstance(Img)
+
+# createCell Function   : Creates a PdfPCell for tables. The cell properties are applied from the CellStyle in the registry
 # Author/Editor         : Ryan Larsen
-# Last updated          : 12-20-2017
+# Modified              : Ivan Nguyen
+# Last updated          : 10-18-2026
 
 def createCell( debug,                  # Set to True to print all debug statments
                 CellData,               # Data that will appear within the cell
@@ -1430,13 +3328,16 @@ def createCell( debug,                  # Set to True to print all debug statmen
                 VariableBorders,        # Allows or denies variable borders: True, False
                 BackgroundColor         # Color of cell background
                 ) :
-    Cell = PdfPCell(CellData)
-    Cell.setRowspan(RowSpan); Cell.setColspan(ColSpan)
-    Cell.setHorizontalAlignment(HorizontalAlignment); Cell.setVerticalAlignment(VerticalAlignment)
-    Cell.setPaddingTop(CellPadding[0]); Cell.setPaddingRight(CellPadding[1]); Cell.setPaddingBottom(CellPadding[2]); Cell.setPaddingLeft(CellPadding[3])
-    Cell.setBorderColorTop(BorderColors[0]); Cell.setBorderColorRight(BorderColors[1]); Cell.setBorderColorBottom(BorderColors[2]); Cell.setBorderColorLeft(BorderColors[3])
-    Cell.setBorderWidthTop(BorderWidths[0]); Cell.setBorderWidthRight(BorderWidths[1]); Cell.setBorderWidthBottom(BorderWidths[2]); Cell.setBorderWidthLeft(BorderWidths[3])
-    Cell.setUseVariableBorders(VariableBorders)
-    Cell.setBackgroundColor(BackgroundColor)
-
-    return Cell
+    Style = getCellStyle(RowSpan, ColSpan, HorizontalAlignment, VerticalAlignment, CellPadding, BorderColors, BorderWidths, VariableBorders,
+        BackgroundColor)
+    return Style.apply(CellData)
+
+#########################################################################
+# Instrumented Functions
+#########################################################################
+
+# Every retrieve function, checkTs and loadProperties is replaced by an instrumented function. The bulletins import the instrumented functions and
+#   the calls between the functions in this file use them too. createCell is not instrumented, the timing would cost more than the cell.
+for Name in sorted([Name for Name in globals().keys() if Name.startswith('retrieve')]) + ['checkTs', 'loadProperties'] :
+    globals()[Name] = instrumented(globals()[Name], Name)
+del Name